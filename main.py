@@ -1,2329 +1,3408 @@
-#!/usr/bin/env python3
-"""
-AI Content Agent Pro - WordPress Focused Implementation
-Automated content creation and WordPress publishing with Gemini AI
-"""
-
-import streamlit as st
-import os
-import json
-import markdown
-from datetime import datetime, timedelta
-import requests
-import base64
-from pathlib import Path
-import zipfile
-import shutil
-import re
-from typing import Dict, Any, Optional, List, Tuple
-import time
-from dotenv import load_dotenv
-import io # Import for image handling
-
-# Load environment variables from .env file
-load_dotenv()
-
-
-class AdvancedPublisher:
-    """Advanced publishing module for automated content deployment, focused on WordPress."""
-    
-    def __init__(self):
-        self.wordpress_config = {}
-        
-    def setup_wordpress(self, site_url: str, username: str, password: str):
-        """Setup WordPress REST API connection."""
-        is_wpcom = 'wordpress.com' in site_url.lower()
-        
-        if is_wpcom:
-            site_domain = site_url.replace('https://', '').replace('http://', '').rstrip('/')
-            self.wordpress_config = {
-                'site_url': site_url.rstrip('/'),
-                'site_domain': site_domain,
-                'username': username,
-                'password': password,  # For WordPress.com, this is an access token
-                'is_wpcom': True,
-                'api_base': f'https://public-api.wordpress.com/rest/v1.1/sites/{site_domain}',
-                'headers': {
-                    'Content-Type': 'application/json', # Default content type
-                    'Authorization': f'Bearer {password}'
-                }
-            }
-        else:
-            self.wordpress_config = {
-                'site_url': site_url.rstrip('/'),
-                'username': username,
-                'password': password,
-                'is_wpcom': False,
-                'use_query_params': None, # Will be detected automatically
-                'headers': {
-                    'Content-Type': 'application/json', # Default content type
-                    'Authorization': f'Basic {base64.b64encode(f"{username}:{password}".encode()).decode()}'
-                }
-            }
-            
-    def _get_api_url(self, endpoint: str) -> str:
-        """Constructs the correct API URL based on permalink settings (for self-hosted WordPress)."""
-        if not self.wordpress_config:
-            raise ValueError("WordPress configuration not set.")
-            
-        if self.wordpress_config.get('is_wpcom'):
-            # WordPress.com uses a fixed base + endpoint
-            return f"{self.wordpress_config['api_base']}{endpoint}"
-        else:
-            # Self-hosted WordPress uses detected permalink structure
-            site_url = self.wordpress_config['site_url']
-            # Default to pretty permalinks if use_query_params is not explicitly True
-            if self.wordpress_config.get('use_query_params', False): # This will be True if detected, otherwise False (default)
-                return f"{site_url}/?rest_route={endpoint}"
-            else:
-                return f"{site_url}/wp-json{endpoint}"
-            
-    def test_wordpress_connection(self) -> Dict[str, Any]:
-        """Test WordPress connection with fallback for sites without pretty permalinks."""
-        if not self.wordpress_config:
-            return {'success': False, 'error': 'WordPress not configured'}
-        
-        try:
-            if self.wordpress_config.get('is_wpcom'):
-                response = requests.get(
-                    self._get_api_url("/"),
-                    headers=self.wordpress_config['headers'],
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    site_data = response.json()
-                    return {
-                        'success': True, 
-                        'message': f"Connected to WordPress.com site: {site_data.get('name', 'Unknown')}"
-                    }
-                elif response.status_code == 403:
-                    return {
-                        'success': False, 
-                        'error': 'WordPress.com site is private or in Coming Soon mode. Please make your site public first.'
-                    }
-                else:
-                    return {
-                        'success': False, 
-                        'error': f"WordPress.com API error: {response.status_code} - {response.text}"
-                    }
-            else:
-                headers_to_use = self.wordpress_config['headers'].copy()
-                headers_to_use['Accept'] = 'application/json' # Ensure JSON is accepted for better error messages
-                
-                # Try pretty permalinks first
-                pretty_url = self._get_api_url("/wp/v2/users/me") # This will currently use default self.wordpress_config['use_query_params'] which is None/False initially
-                response = requests.get(pretty_url, headers=headers_to_use, timeout=10)
-                
-                if response.status_code == 404:
-                    # Fallback to query parameter format
-                    fallback_url = self.wordpress_config['site_url'] + "/?rest_route=/wp/v2/users/me"
-                    response = requests.get(fallback_url, headers=headers_to_use, timeout=10)
-                    
-                    if response.status_code == 200:
-                        user_data = response.json()
-                        self.wordpress_config['use_query_params'] = True # Set it if this worked
-                        return {
-                            'success': True, 
-                            'message': f"Connected as {user_data.get('name', 'Unknown')} (using query parameter format)"
-                        }
-                    elif response.status_code == 401:
-                         return {
-                            'success': False,
-                            'error': 'Authentication failed. Please check your username and application password.'
-                        }
-                elif response.status_code == 200:
-                    user_data = response.json()
-                    self.wordpress_config['use_query_params'] = False # Set it if this worked
-                    return {
-                        'success': True, 
-                        'message': f"Connected as {user_data.get('name', 'Unknown')}"
-                    }
-                elif response.status_code == 401:
-                    return {
-                        'success': False,
-                        'error': 'Authentication failed. Please check your username and application password.'
-                    }
-                
-                return {
-                    'success': False, 
-                    'error': f"WordPress API error: {response.status_code} - {response.text}. Check if REST API is enabled and credentials are correct."
-                }
-                    
-        except requests.exceptions.Timeout:
-            return {'success': False, 'error': 'Connection timed out. Please check the URL and your network connection.'}
-        except requests.exceptions.RequestException as e:
-            return {'success': False, 'error': f"Network error or invalid URL: {str(e)}"}
-        except Exception as e:
-            return {'success': False, 'error': str(e)}
-            
-    def _get_terms_robust(self, term_type: str) -> List[Dict[str, Any]]:
-        """
-        Fetches terms (categories/tags) for WordPress.
-        Returns a list of {'id': int, 'name': str} dictionaries.
-        """
-        if self.wordpress_config.get('is_wpcom'):
-            # For WP.com, fetching terms requires specific endpoints and might vary.
-            # We explicitly decided not to fully support fetching terms list for WP.com
-            # due to API complexities in this focused version.
-            st.warning(f"Fetching {term_type} list is not fully supported for WordPress.com via this API configuration.")
-            return []
-
-        terms_list = []
-        headers_to_use = self.wordpress_config['headers'].copy()
-        headers_to_use['Accept'] = 'application/json' # Ensure JSON is accepted
-        
-        endpoint = f"/wp/v2/{term_type}" # e.g., /wp/v2/categories or /wp/v2/tags
-        api_url = self._get_api_url(endpoint) # This call will now use the correct /?rest_route= format if detected
-
-        try:
-            response = requests.get(api_url, headers=headers_to_use, timeout=10)
-            
-            if response.status_code == 200:
-                terms_data = response.json()
-                for term in terms_data:
-                    terms_list.append({'id': term['id'], 'name': term['name']})
-            else:
-                st.error(f"Failed to fetch {term_type} from {api_url}: {response.status_code} - {response.text}")
-                return []
-
-        except requests.exceptions.Timeout:
-            st.error(f"Timed out fetching {term_type}. Check network or site responsiveness.")
-            return []
-        except requests.exceptions.RequestException as e:
-            st.error(f"Network error fetching {term_type}: {e}")
-            return []
-        except json.JSONDecodeError:
-            st.error(f"Failed to decode JSON from {term_type} response: {response.text}")
-            return []
-        except Exception as e:
-            st.error(f"Error processing {term_type} data: {e}")
-            
-        return terms_list
-
-    def fetch_categories(self) -> List[Dict[str, Any]]:
-        """Fetches all existing categories from WordPress."""
-        return self._get_terms_robust('categories')
-
-    def fetch_tags(self) -> List[Dict[str, Any]]:
-        """Fetches all existing tags from WordPress."""
-        return self._get_terms_robust('tags')
-
-    def upload_image_to_wordpress(self, image_data: bytes, filename: str, mime_type: str) -> Dict[str, Any]:
-        """Uploads an image to the WordPress media library."""
-        if not self.wordpress_config:
-            return {'success': False, 'error': 'WordPress not configured'}
-
-        if self.wordpress_config.get('is_wpcom'):
-            # WordPress.com media upload is to /sites/{siteID}/media/new
-            # This endpoint typically expects multipart/form-data with a file field.
-            # The structure for WP.com media upload can be more complex than self-hosted.
-            st.warning("WordPress.com image upload is more complex and not fully implemented for direct file upload in this version.")
-            return {'success': False, 'error': 'WordPress.com image upload not fully supported in this version. Try self-hosted WP.'}
-
-        try:
-            media_api_url = self._get_api_url("/wp/v2/media")
-            
-            headers_to_use = self.wordpress_config['headers'].copy()
-            # Crucially, set the Content-Type for the raw binary data
-            headers_to_use['Content-Type'] = mime_type 
-            # Add Content-Disposition header
-            headers_to_use['Content-Disposition'] = f'attachment; filename="{filename}"'
-            
-            response = requests.post(
-                media_api_url,
-                headers=headers_to_use,
-                data=image_data, 
-                timeout=30
-            )
-
-            if response.status_code == 201:
-                media_info = response.json()
-                return {
-                    'success': True,
-                    'media_id': media_info['id'],
-                    'media_url': media_info['source_url'],
-                    'message': f"Image '{filename}' uploaded successfully to media library."
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': f"Image upload failed: {response.status_code} - {response.text}"
-                }
-
-        except requests.exceptions.Timeout:
-            return {'success': False, 'error': 'Image upload timed out. The WordPress site might be slow or unreachable.'}
-        except requests.exceptions.RequestException as e:
-            return {'success': False, 'error': f"Network error during image upload: {str(e)}"}
-        except Exception as e:
-            return {'success': False, 'error': f"Unexpected error during image upload: {str(e)}"}
-            
-    def publish_to_wordpress(self, title: str, content: str, status: str = 'draft', 
-                           categories: List[str] = None, tags: List[str] = None, 
-                           featured_image_id: Optional[int] = None) -> Dict[str, Any]:
-        """Publish content to WordPress using REST API with permalink format detection and term ID handling."""
-        if not self.wordpress_config:
-            return {'success': False, 'error': 'WordPress not configured'}
-        
-        html_content = markdown.markdown(content, extensions=['codehilite', 'fenced_code'])
-        
-        try:
-            post_data = {
-                'title': title,
-                'content': html_content,
-                'status': status,
-                'format': 'standard'
-            }
-
-            if featured_image_id:
-                post_data['featured_media'] = featured_image_id
-            
-            if self.wordpress_config.get('is_wpcom'):
-                if tags:
-                    post_data['tags'] = ','.join(tags) 
-                # Categories for WP.com still a bit tricky if not using direct IDs.
-                # For now, will not attempt to set categories for WP.com via this method.
-                if categories:
-                    st.warning("Categories not directly supported for WordPress.com via this API version's post creation. Post will be uncategorized or default.")
-
-                response = requests.post(
-                    self._get_api_url("/posts/new"),
-                    json=post_data,
-                    headers=self.wordpress_config['headers'],
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    post_info = response.json()
-                    return {
-                        'success': True,
-                        'post_id': post_info['ID'],
-                        'url': post_info['URL'],
-                        'edit_url': f"{self.wordpress_config['site_url']}/wp-admin/post.php?post={post_info['ID']}&action=edit",
-                        'message': f'Post published successfully to WordPress.com (Status: {status})'
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': f"WordPress.com API error: {response.status_code} - {response.text}"
-                    }
-                    
-            else:
-                # Self-hosted WordPress
-                # Retrieve category and tag IDs based on names provided by the user
-                if categories:
-                    # st.session_state.wp_all_categories stores {'id': X, 'name': Y}
-                    # We need to map user-selected names to their IDs
-                    all_existing_categories = st.session_state.get('wp_all_categories', [])
-                    selected_category_ids = [
-                        cat['id'] for cat in all_existing_categories 
-                        if cat['name'].lower() in [c.lower() for c in categories]
-                    ]
-                    if selected_category_ids:
-                        post_data['categories'] = selected_category_ids
-                    else:
-                        st.warning(f"None of the specified categories ({', '.join(categories)}) were found or selected. Post will be uncategorized or default.")
-                    
-                if tags:
-                    # Similar mapping for tags
-                    all_existing_tags = st.session_state.get('wp_all_tags', [])
-                    selected_tag_ids = [
-                        tag['id'] for tag in all_existing_tags 
-                        if tag['name'].lower() in [t.lower() for t in tags]
-                    ]
-                    if selected_tag_ids:
-                        post_data['tags'] = selected_tag_ids
-                    else:
-                        st.warning(f"None of the specified tags ({', '.join(tags)}) were found or selected. Post will be published without specified tags.")
-                
-                api_url = self._get_api_url("/wp/v2/posts")
-                
-                response = requests.post(
-                    api_url,
-                    json=post_data,
-                    headers=self.wordpress_config['headers'],
-                    timeout=30
-                )
-                
-                if response.status_code == 201:
-                    post_info = response.json()
-                    return {
-                        'success': True,
-                        'post_id': post_info['id'],
-                        'url': post_info['link'],
-                        'edit_url': f"{self.wordpress_config['site_url']}/wp-admin/post.php?post={post_info['id']}&action=edit",
-                        'message': f'Post published successfully to WordPress (Status: {status})'
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': f"WordPress API error: {response.status_code} - {response.text}"
-                    }
-                    
-        except requests.exceptions.Timeout:
-            return {
-                'success': False,
-                'error': 'WordPress publishing timed out. The WordPress site might be slow or unreachable.'
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                'success': False,
-                'error': f"Network error during WordPress publishing: {str(e)}"
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f"WordPress publishing error: {str(e)}"
-            }
-
-
-class CompleteAIContentAgent:
-    def __init__(self):
-        self.publisher = AdvancedPublisher()
-        
-        self.article_content_types = [
-            "Blog Post",
-            "Technical Article", 
-            "Tutorial",
-            "News Article",
-            "Review",
-            "Opinion Piece",
-            "How-to Guide",
-            "Case Study",
-            "Product Documentation",
-            "API Documentation",
-            "White Paper",
-            "Research Paper",
-            "Marketing Copy",
-        ]
-        
-        self.project_content_types = [
-            "Python Project", "Web Application", "API Project", "Data Science Project",
-            "Machine Learning Project", "Discord Bot", "Automation Script",
-            "CLI Tool", "Game Project"
-        ]
-        
-        self.writing_styles = [
-            "Professional", "Casual", "Technical", "Conversational", "Academic",
-            "Creative", "Formal", "Friendly", "Authoritative"
-        ]
-        
-        self.target_audiences = [
-            "Beginners", "Intermediate", "Advanced", "General Public", "Developers",
-            "Business Professionals", "Students", "Researchers", "Decision Makers"
-        ]
-        
-        self.word_counts = [
-            "500-800", "800-1200", "1200-2000", "2000-3000", "3000-5000", "5000+"
-        ]
-        
-    def setup_gemini(self, api_key: str) -> bool:
-        """Setup Gemini AI API."""
-        try:
-            self.gemini_api_key = api_key
-            test_result = self.call_gemini_api("Hello", api_key)
-            if test_result and not test_result.startswith("Error:"):
-                return True
-            else:
-                st.error(f"Gemini AI test failed: {test_result}")
-                return False
-        except Exception as e:
-            st.error(f"Error initializing Gemini AI: {str(e)}")
-            return False
-    
-    def call_gemini_api(self, prompt: str, api_key: str) -> str:
-        """Call Gemini API using REST API."""
-        chat_history = [{"role": "user", "parts": [{"text": prompt}]}]
-        payload = {"contents": chat_history}
-        api_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
-
-        try:
-            response = requests.post(api_url, headers={'Content-Type': 'application/json'}, data=json.dumps(payload))
-            response.raise_for_status()
-            result = response.json()
-
-            if (result.get("candidates") and len(result["candidates"]) > 0 and 
-                result["candidates"][0].get("content") and 
-                result["candidates"][0]["content"].get("parts") and 
-                len(result["candidates"][0]["content"]["parts"]) > 0):
-                return result["candidates"][0]["content"]["parts"][0]["text"]
-            else:
-                return f"Error: No content generated. API Response: {json.dumps(result, indent=2)}"
-
-        except requests.exceptions.RequestException as e:
-            return f"Error making API request: {e}"
-        except json.JSONDecodeError:
-            return f"Error decoding JSON response: {response.text}"
-        except Exception as e:
-            return f"An unexpected error occurred: {e}"
-
-    def generate_image_with_ai(self, prompt: str) -> Optional[bytes]:
-        """
-        Simulates AI image generation or provides a placeholder.
-        In a real scenario, this would call an external image generation API.
-        """
-        st.info(f"Generating image for prompt: '{prompt}' (This is a placeholder, actual image generation requires external API integration like DALL-E, Stable Diffusion, etc.)")
-        try:
-            image_url = "https://via.placeholder.com/600x400?text=AI+Generated+Image"
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            return response.content
-        except requests.exceptions.RequestException as e:
-            st.error(f"Could not fetch placeholder image: {e}. Please check internet connection.")
-            return None
-        except Exception as e:
-            st.error(f"Error in placeholder image generation: {e}")
-            return None
-    
-    def generate_enhanced_content(self, topic: str, content_type: str, description: str, 
-                                additional_requirements: str, writing_style: str, 
-                                target_audience: str, word_count: str, 
-                                include_seo: bool = True, include_toc: bool = False, 
-                                include_examples: bool = True, include_conclusion: bool = True) -> Optional[str]:
-        """Generate enhanced content with detailed parameters, adapting for content type."""
-        
-        seo_instructions = """
-        SEO Requirements:
-        - Include an engaging, keyword-rich title at the top (H1).
-        - Use proper header hierarchy (H1, H2, H3, etc.).
-        - Include relevant keywords naturally throughout the text.
-        - Add a meta description-worthy introduction (first paragraph).
-        - Ensure a strong conclusion with key takeaways.
-        """ if include_seo else ""
-        
-        toc_instructions = """
-        Table of Contents:
-        - Generate a Table of Contents (TOC) at the beginning of the article, linking to main H2 sections.
-        """ if include_toc else ""
-
-        examples_instructions = """
-        Examples and Practicality:
-        - Incorporate practical examples, code snippets (if applicable), or real-world scenarios to illustrate concepts.
-        - Ensure all code blocks are properly formatted with language identifiers (e.g., ```python).
-        """ if include_examples else ""
-        
-        conclusion_instructions = """
-        Conclusion:
-        - Provide a concise summary of key points.
-        - Offer actionable next steps or final thoughts.
-        """ if include_conclusion else ""
-
-        type_specific_instructions = ""
-        if content_type == "Blog Post":
-            type_specific_instructions = "Make it engaging, conversational, and shareable. Use relatable analogies. Focus on a strong hook and clear takeaways."
-        elif content_type == "Tutorial" or content_type == "How-to Guide":
-            type_specific_instructions = "Provide clear, step-by-step instructions. Include necessary prerequisites, detailed code examples (if applicable), and practical troubleshooting tips. The content should be highly actionable and easy to follow."
-        elif content_type == "Technical Article":
-            type_specific_instructions = "Dive deep into the technical aspects. Use precise terminology, comprehensive explanations of concepts, and detailed code/configuration examples. Assume a knowledgeable audience."
-        elif content_type == "Review":
-            type_specific_instructions = "Analyze the product/service comprehensively. Include a clear introduction, detailed pros and cons, target audience analysis, pricing insights (if applicable), and a clear recommendation or rating (e.g., '4.5/5 Stars')."
-        elif content_type == "News Article":
-            type_specific_instructions = "Report on a recent event or development. Follow journalistic principles: who, what, when, where, why, and how. Maintain an objective, informative tone. Include a clear headline and summary."
-        elif content_type == "Case Study":
-            type_specific_instructions = "Detail a specific problem, the solution implemented, and the measurable results achieved. Focus on data, methodology, and quantifiable outcomes. Structure as: Introduction, Problem, Solution, Results, Conclusion."
-        elif content_type == "Product Documentation" or content_type == "API Documentation":
-             type_specific_instructions = "Provide clear, concise, and accurate instructions for using a product or API. Include installation, usage examples, parameter descriptions, and error handling. Organize content logically for easy navigation."
-
-
-        prompt = f"""
-        Create a comprehensive and engaging {content_type.lower()} about "{topic}".
-        
-        Content Specifications:
-        - Content Type: {content_type}
-        - Topic: {topic}
-        - Writing Style: {writing_style}
-        - Target Audience: {target_audience}
-        - Word Count Target: Approximately {word_count} words
-        
-        Special Requirements from User:
-        {description}
-        
-        Additional Instructions from User:
-        {additional_requirements}
-        
-        ---
-        Formatting and Structural Guidelines:
-        {seo_instructions}
-        {toc_instructions}
-        {examples_instructions}
-        {conclusion_instructions}
-        
-        Type-Specific Guidance:
-        {type_specific_instructions}
-        
-        General Structure Requirements:
-        1. **Title**: Create an engaging, descriptive title (use # for H1)
-        2. **Introduction**: Hook the reader and outline what they'll learn (first paragraph).
-        3. **Main Content**: Use proper heading hierarchy (##, ###) for sections.
-        4. **Code Examples**: Use proper markdown code blocks with language specification (e.g., ```python).
-        5. **Lists**: Use bullet points or numbered lists where appropriate.
-        6. **Tables**: Create tables when comparing data or features (if relevant).
-        7. **Quotes/Callouts**: Use > for important quotes or callouts.
-        8. **Links**: Include relevant links (use placeholder URLs like https://example.com).
-        
-        Content Quality Standards:
-        - Make it informative and actionable.
-        - Ensure accuracy and up-to-date information.
-        - Make it engaging and easy to read.
-        - Include troubleshooting tips where relevant (especially for tutorials).
-        - Add best practices and common pitfalls to avoid.
-        
-        Please create content that is publication-ready and professionally formatted in Markdown.
-        """
-        
-        try:
-            if not hasattr(self, 'gemini_api_key'):
-                return "Error: Gemini AI API key not configured"
-                
-            result = self.call_gemini_api(prompt, self.gemini_api_key)
-            return result if result and not result.startswith("Error:") else result
-        except Exception as e:
-            st.error(f"Error generating content: {str(e)}")
-            return None
-    
-    def generate_project_files(self, project_name: str, project_type: str, description: str, 
-                              additional_requirements: str, target_audience: str,
-                              project_complexity: str = "Intermediate", include_tests: bool = False,
-                              include_docker: bool = False, include_ci_cd: bool = False,
-                              include_docs: bool = True, create_examples: bool = True) -> Optional[Dict[str, str]]:
-        """Generate multiple files for a complete project with enhanced parameters."""
-        
-        test_instructions = "\n5. Include unit tests for key functionalities (e.g., using unittest or pytest)." if include_tests else ""
-        docker_instructions = "\n6. Provide a Dockerfile and docker-compose.yml for containerization." if include_docker else ""
-        ci_cd_instructions = "\n7. Add a basic CI/CD configuration (e.g., GitHub Actions workflow)." if include_ci_cd else ""
-        docs_instructions = "\n8. Ensure inline comments and docstrings are comprehensive. Create a separate `docs/` folder for additional documentation if needed." if include_docs else ""
-        examples_instructions = "\n9. Include example usage or test files (e.g., `example.py`)." if create_examples else ""
-        
-        prompt = f"""
-        Create a complete {project_type.lower()} called "{project_name}".
-        
-        Project Specifications:
-        - Project Name: {project_name}
-        - Project Type: {project_type}
-        - Target Audience: {target_audience}
-        - Complexity Level: {project_complexity}
-        - Description: {description}
-        - Additional Requirements: {additional_requirements}
-        
-        Please create a complete project structure with multiple files. Format your response as follows:
-        
-        FILE: filename.ext
-        ```language
-        [file content here]
-        ```
-        
-        FILE: another_file.ext
-        ```language
-        [file content here]
-        ```
-        
-        Requirements:
-        1. Create a main Python file with complete, working code.
-        2. Include `requirements.txt` with all necessary dependencies.
-        3. Create a comprehensive `README.md` with setup instructions, usage, and project overview.
-        4. Add a `.gitignore` file for Python projects.
-        {test_instructions}
-        {docker_instructions}
-        {ci_cd_instructions}
-        {docs_instructions}
-        {examples_instructions}
-        10. Add configuration files if needed (e.g., `config.py`, `.env.example`).
-        
-        Make sure all code is:
-        - Production-ready and well-commented.
-        - Follows best practices for the chosen language/framework.
-        - Includes proper error handling.
-        - Has clear documentation.
-        - Is ready to run after setup.
-        
-        Focus on creating a {project_type.lower()} that is practical and useful.
-        """
-        
-        try:
-            if not hasattr(self, 'gemini_api_key'):
-                return None
-                
-            result = self.call_gemini_api(prompt, self.gemini_api_key)
-            
-            if result and not result.startswith("Error:"):
-                return self.parse_project_files(result)
-            else:
-                st.error(f"Project generation failed: {result}")
-                return None
-                
-        except Exception as e:
-            st.error(f"Error generating project: {str(e)}")
-            return None
-    
-    def parse_project_files(self, content: str) -> Dict[str, str]:
-        """Parse the AI response to extract individual files."""
-        files = {}
-        
-        file_blocks_matches = re.findall(r'FILE:\s*([^\n]+)\n```(?:([a-zA-Z0-9]+))?\n(.*?)\n```', content, re.DOTALL)
-        
-        for filename, lang, file_content in file_blocks_matches:
-            files[filename.strip()] = file_content.strip()
-
-        if not files:
-            st.warning("Could not parse files using strict FILE: and ``` markers. Attempting simpler parsing.")
-            potential_files = re.split(r'(FILE:\s*[^\n]+)', content, flags=re.IGNORECASE)
-            
-            current_filename = None
-            current_content = []
-
-            for part in potential_files:
-                if part.lower().startswith('file:'):
-                    if current_filename and current_content:
-                        files[current_filename] = "\n".join(current_content).strip()
-                    current_filename = part.replace('FILE:', '').strip()
-                    current_content = []
-                else:
-                    current_content.append(part)
-            
-            if current_filename and current_content:
-                files[current_filename] = "\n".join(current_content).strip()
-            
-            for fname, fcontent in files.items():
-                if fcontent.startswith('```') and fcontent.endswith('```'):
-                    files[fname] = '\n'.join(fcontent.split('\n')[1:-1]).strip()
-                elif fcontent.startswith('```'):
-                    files[fname] = '\n'.join(fcontent.split('\n')[1:]).strip()
-
-        if not files:
-            project_name = "AI Generated Project"
-            files['README.md'] = f"# {project_name}\n\nProject generated by AI Content Agent Pro"
-            files['main.py'] = "# Main project file\nprint('Hello, World!')"
-            files['requirements.txt'] = "# Add your dependencies here"
-            st.error("Failed to parse any files from AI response. Generated minimal placeholder files.")
-        
-        return files
-    
-    def generate_seo_metadata(self, content: str, topic: str) -> Optional[Dict[str, Any]]:
-        """Generate SEO metadata for the content."""
-        
-        content_preview = content[:1500] 
-        
-        prompt = f"""
-        Based on this content about "{topic}", generate SEO metadata.
-        
-        Content Preview: {content_preview}...
-        
-        Please provide SEO-optimized metadata in this exact JSON format.
-        Make sure the content adheres to length constraints and is highly relevant.
-        {{
-            "title": "SEO-optimized title (50-60 characters, avoid truncation)",
-            "description": "Compelling meta description (150-160 characters, summarize key points, entice clicks)",
-            "keywords": ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"],
-            "slug": "url-friendly-slug-with-hyphens"
-        }}
-        
-        Guidelines:
-        - **Title**: Include main keywords, be descriptive, engaging, and fit within 50-60 characters.
-        - **Description**: Summarize the article, use strong verbs, include relevant keywords, and be between 150-160 characters.
-        - **Keywords**: 3-5 relevant, high-impact keywords.
-        - **Slug**: Lowercase, use hyphens instead of spaces, avoid special characters, be concise.
-        """
-        
-        try:
-            if not hasattr(self, 'gemini_api_key'):
-                st.warning("Gemini AI API key not configured for SEO generation. Using fallback metadata.")
-                return {
-                    "title": topic[:60],
-                    "description": f"Learn about {topic} in this comprehensive guide.",
-                    "keywords": [topic.lower()],
-                    "slug": topic.lower().replace(' ', '-').replace(',', '').replace('.', '')[:50]
-                }
-                
-            response = self.call_gemini_api(prompt, self.gemini_api_key)
-            
-            if response and not response.startswith("Error:"):
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    try:
-                        parsed_json = json.loads(json_match.group())
-                        parsed_json['title'] = parsed_json.get('title', topic)[:60].strip()
-                        parsed_json['description'] = parsed_json.get('description', f"Learn about {topic}").replace('\n', ' ')[:160].strip()
-                        parsed_json['keywords'] = [k.strip().lower() for k in parsed_json.get('keywords', []) if k.strip()][:5]
-                        parsed_json['slug'] = re.sub(r'[^\w\s-]', '', parsed_json.get('slug', topic).lower()).replace(' ', '-').strip()[:60]
-                        return parsed_json
-                    except json.JSONDecodeError:
-                        st.warning(f"Could not parse SEO JSON from Gemini. Raw response: {response}. Using fallback metadata.")
-                        pass
-            
-            st.warning("SEO generation failed or returned invalid format. Using fallback metadata.")
-            return {
-                "title": topic[:60],
-                "description": f"Learn about {topic} in this comprehensive guide.",
-                "keywords": [topic.lower()],
-                "slug": topic.lower().replace(' ', '-').replace(',', '').replace('.', '')[:50]
-            }
-            
-        except Exception as e:
-            st.error(f"Error generating SEO metadata: {str(e)}")
-            return {
-                "title": topic[:60],
-                "description": f"Learn about {topic} in this comprehensive guide.",
-                "keywords": [topic.lower()],
-                "slug": topic.lower().replace(' ', '-').replace(',', '').replace('.', '')[:50]
-            }
-    
-    def extract_title_from_content(self, content: str) -> str:
-        """Extract title from generated content (first H1)."""
-        lines = content.split('\n')
-        for line in lines:
-            if line.startswith('#') and not line.startswith('##'):
-                potential_title = line.replace('#', '').strip()
-                potential_title = re.sub(r'[^\w\s]', '', potential_title).strip()
-                return potential_title
-        return "Generated Content"
-    
-    def save_markdown_file(self, content: str, title: str, seo_metadata: Dict = None) -> str:
-        """Save content as markdown file with YAML front matter metadata."""
-        output_dir = Path("generated_content")
-        output_dir.mkdir(exist_ok=True)
-        
-        filename = re.sub(r'[^\w\s-]', '', title).strip()
-        filename = re.sub(r'[-\s]+', '-', filename).lower()
-        filepath = output_dir / f"{filename}.md"
-        
-        metadata_header = "---\n"
-        metadata_header += f"title: {json.dumps(title)}\n" 
-        metadata_header += f"date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        metadata_header += f"generated_by: AI Content Agent Pro\n"
-        
-        if seo_metadata:
-            metadata_header += f"seo_title: {json.dumps(seo_metadata.get('title', ''))}\n"
-            metadata_header += f"description: {json.dumps(seo_metadata.get('description', ''))}\n"
-            keywords_str = ', '.join(seo_metadata.get('keywords', []))
-            metadata_header += f"keywords: {json.dumps(keywords_str)}\n"
-            metadata_header += f"slug: {json.dumps(seo_metadata.get('slug', ''))}\n"
-        
-        metadata_header += "---\n\n"
-        
-        content_lines = content.split('\n')
-        if content_lines and content_lines[0].strip().startswith('#'):
-            potential_ai_h1 = content_lines[0].strip()[1:].strip()
-            if potential_ai_h1.lower() == title.lower():
-                content = '\n'.join(content_lines[1:])
-        
-        markdown_content = metadata_header + content
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        return str(filepath)
-    
-    def create_html_website(self, content: str, title: str, seo_metadata: Dict = None) -> str:
-        """Create a complete HTML website with the generated content."""
-        
-        output_dir = Path("generated_website")
-        output_dir.mkdir(exist_ok=True)
-        
-        html_content = markdown.markdown(content, extensions=['codehilite', 'fenced_code', 'tables'])
-        
-        page_title = seo_metadata.get('title', title) if seo_metadata else title
-        meta_description = seo_metadata.get('description', '') if seo_metadata else ''
-        keywords = ', '.join(seo_metadata.get('keywords', [])) if seo_metadata else ''
-        
-        html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{page_title}</title>
-    <meta name="description" content="{meta_description}">
-    <meta name="keywords" content="{keywords}">
-    <meta name="author" content="AI Content Agent Pro">
-    <meta property="og:title" content="{page_title}">
-    <meta property="og:description" content="{meta_description}">
-    <meta property="og:type" content="article">
-    
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/styles/github.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/highlight.min.js"></script>
-    
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #fafafa;
-        }}
-        
-        .container {{
-            background-color: white;
-            padding: 40px;
-            border-radius: 12px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        }}
-        
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 15px;
-            margin-bottom: 30px;
-            font-size: 2.5em;
-        }}
-        
-        h2 {{
-            color: #34495e;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-            margin-top: 40px;
-            margin-bottom: 20px;
-        }}
-        
-        h3 {{
-            color: #34495e;
-            margin-top: 30px;
-            margin-bottom: 15px;
-        }}
-        
-        pre {{
-            background-color: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            padding: 20px;
-            overflow-x: auto;
-            margin: 20px 0;
-        }}
-        
-        code {{
-            background-color: #f8f9fa;
-            padding: 3px 6px;
-            border-radius: 4px;
-            font-family: 'SFMono-Regular', 'Monaco', 'Inconsolata', 'Liberation Mono', 'Courier New', monospace;
-            font-size: 0.9em;
-        }}
-        
-        pre code {{
-            background-color: transparent;
-            padding: 0;
-        }}
-        
-        blockquote {{
-            border-left: 4px solid #3498db;
-            margin: 0;
-            padding: 0 0 0 20px;
-            font-style: italic;
-            background-color: #f8f9fa;
-            padding: 15px 20px;
-            border-radius: 0 8px 8px 0;
-        }}
-        
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-        }}
-        
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 12px;
-            text-align: left;
-        }}
-        
-        th {{
-            background-color: #f2f2f2;
-            font-weight: bold;
-        }}
-        
-        .meta {{
-            color: #7f8c8d;
-            font-style: italic;
-            border-top: 1px solid #ecf0f1;
-            padding-top: 20px;
-            margin-top: 40px;
-            text-align: center;
-        }}
-        
-        .toc {{
-            background-color: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 20px 0;
-        }}
-        
-        .toc h3 {{
-            margin-top: 0;
-            color: #495057;
-        }}
-        
-        .highlight {{
-            background-color: #fff3cd;
-            border: 1px solid #ffeaa7;
-            border-radius: 4px;
-            padding: 15px;
-            margin: 20px 0;
-        }}
-        
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        
-        a:hover {{
-            text-decoration: underline;
-        }}
-        
-        img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-        }}
-        
-        .article-header {{
-            text-align: center;
-            margin-bottom: 40px;
-        }}
-        
-        .publish-date {{
-            color: #7f8c8d;
-            font-size: 0.9em;
-        }}
-        
-        @media (max-width: 768px) {{
-            body {{
-                padding: 10px;
-            }}
-            
-            .container {{
-                padding: 20px;
-            }}
-            
-            h1 {{
-                font-size: 2em;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="article-header">
-            <div class="publish-date">Published on {datetime.now().strftime('%B %d, %Y')}</div>
-        </div>
-        
-        {html_content}
-        
-        <div class="meta">
-            <p><strong>Article Information</strong><br>
-            Published on {datetime.now().strftime('%Y-%m-%d at %H:%M:%S')}</p>
-        </div>
-    </div>
-    
-    <script>
-        hljs.highlightAll();
-        
-        // Add copy buttons to code blocks
-        document.querySelectorAll('pre code').forEach((block) => {{
-            const button = document.createElement('button');
-            button.innerText = 'Copy';
-            button.style.float = 'right';
-            button.style.margin = '5px';
-            button.style.padding = '5px 10px';
-            button.style.background = '#3498db';
-            button.style.color = 'white';
-            button.style.border = 'none';
-            button.style.borderRadius = '4px';
-            button.style.cursor = 'pointer';
-            
-            button.addEventListener('click', () => {{
-                navigator.clipboard.writeText(block.textContent);
-                button.innerText = 'Copied!';
-                setTimeout(() => {{ button.innerText = 'Copy'; }}, 2000);
-            }});
-            
-            block.parentNode.style.position = 'relative';
-            block.parentNode.appendChild(button);
-        }});
-    </script>
-</body>
-</html>"""
-        
-        html_file = output_dir / "index.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_template)
-        
-        return str(html_file)
-
-
-def main():
-    """Main Streamlit application."""
-    
-    st.set_page_config(
-        page_title="AI Content Agent Pro (WordPress Focused)",
-        page_icon="🚀",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
-    
-    # Custom CSS
-    st.markdown("""
-    <style>
-        .main-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 2rem;
-            border-radius: 15px;
-            color: white;
-            text-align: center;
-            margin-bottom: 2rem;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        }
-        
-        .main-header h1 {
-            margin: 0;
-            font-size: 3rem;
-            font-weight: bold;
-        }
-        
-        .main-header p {
-            margin: 0.5rem 0 0 0;
-            font-size: 1.2rem;
-            opacity: 0.9;
-        }
-        
-        .feature-box {
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            padding: 1.5rem;
-            border-radius: 12px;
-            border-left: 6px solid #667eea;
-            margin: 1rem 0;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.05);
-        }
-        
-        .success-box {
-            background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-            padding: 1.5rem;
-            border-radius: 12px;
-            border-left: 6px solid #28a745;
-            margin: 1rem 0;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.05);
-        }
-        
-        .metric-card {
-            background: white;
-            padding: 1.5rem;
-            border-radius: 12px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            text-align: center;
-            border: 1px solid #e9ecef;
-        }
-        
-        .status-connected {
-            color: #28a745;
-            font-weight: bold;
-        }
-        
-        .status-disconnected {
-            color: #dc3545;
-            font-weight: bold;
-        }
-        
-        .platform-card {
-            background: white;
-            padding: 1rem;
-            border-radius: 8px;
-            border: 1px solid #e9ecef;
-            margin: 0.5rem 0;
-        }
-        
-        div.stButton > button {
-            width: 100%;
-            border-radius: 8px;
-            border: none;
-            padding: 0.5rem 1rem;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }
-        
-        div.stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }
-        
-        .sidebar .sidebar-content {
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🚀 AI Content Agent Pro</h1>
-        <p>WordPress-Focused Content Creation & Publishing with Gemini AI</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    if 'agent' not in st.session_state:
-        st.session_state.agent = CompleteAIContentAgent()
-    
-    agent = st.session_state.agent
-    
-    # Sidebar Configuration
-    with st.sidebar:
-        st.header("🔧 Configuration")
-        
-        env_gemini_key = os.getenv('GEMINI_API_KEY', '')
-        env_wp_site_url = os.getenv('WP_SITE_URL', '')
-        env_wp_username = os.getenv('WP_USERNAME', '')
-        env_wp_app_password = os.getenv('WP_APP_PASSWORD', '')
-        
-        api_key = st.text_input(
-            "🤖 Gemini AI API Key", # Changed label for clarity
-            value=env_gemini_key,
-            type="password", 
-            help="Get your API key from https://aistudio.google.com/",
-            placeholder="Enter your Gemini AI API key" if not env_gemini_key else "Loaded from .env file",
-            key="gemini_api_key_input"
-        )
-        
-        if api_key:
-            if 'gemini_configured' not in st.session_state or st.session_state.gemini_configured_key != api_key: # Added check for key change
-                if agent.setup_gemini(api_key):
-                    st.session_state.gemini_configured = True
-                    st.session_state.gemini_configured_key = api_key # Store the key that successfully configured
-                    st.success("✅ Gemini AI Connected")
-                else:
-                    st.error("❌ Failed to connect to Gemini AI")
-            else:
-                st.success("✅ Gemini AI Connected")
-        else:
-            st.session_state.gemini_configured = False # Set to false if key is empty
-            st.session_state.gemini_configured_key = None
-            st.info("👆 Enter your Gemini AI API key to get started")
-        
-        if env_gemini_key:
-            st.caption("🔄 API key loaded from .env file")
-        
-        st.divider()
-        
-        st.subheader("📡 Publishing Platforms")
-        
-        # WordPress Configuration
-        with st.expander("🏢 WordPress", expanded=True): # Expanded by default
-            st.markdown("**Choose your WordPress type:**")
-            wp_type = st.radio(
-                "WordPress Type",
-                ["Self-hosted WordPress", "WordPress.com"],
-                help="Select whether you're using a self-hosted WordPress site or WordPress.com",
-                key="wp_type_radio"
-            )
-            
-            if wp_type == "WordPress.com":
-                st.info("⚠️ **WordPress.com Requirements:**\n- Your site must be **public** (not in Coming Soon mode)\n- You need a **Business plan** or higher for REST API access\n- Use an **access token** instead of password")
-                
-                wp_site = st.text_input(
-                    "WordPress.com Site URL", 
-                    placeholder="https://yoursite.com",
-                    help="Your full WordPress.com site URL",
-                    value=env_wp_site_url,
-                    key="wpcom_site_url_input"
-                )
-                wp_user = st.text_input(
-                    "Username",
-                    placeholder="your-username",
-                    key="wpcom_username_input"
-                )
-                wp_pass = st.text_input(
-                    "Access Token", 
-                    type="password",
-                    help="Get access token from WordPress.com → My Sites → Manage → Marketing → Connections",
-                    key="wpcom_pass_input"
-                )
-
-                if env_wp_site_url or env_wp_username or env_wp_app_password:
-                    st.caption("🔄 WordPress credentials loaded from .env file (if set)")
-                if wp_site and 'wordpress.com' not in wp_site.lower() and wp_site.strip():
-                    st.warning("⚠️ This doesn't look like a WordPress.com URL")
-            else:
-                st.info("ℹ️ **Self-hosted WordPress Requirements:**\n- WordPress 4.7+ with REST API enabled\n- Use **Application Password** (not login password)\n- **Auto-detects permalink format** (works with/without pretty permalinks)")
-                
-                wp_site = st.text_input(
-                    "Site URL", 
-                    placeholder="https://yoursite.com",
-                    help="Your self-hosted WordPress site URL",
-                    value=env_wp_site_url, # Pre-filled for your site
-                    key="self_hosted_site_url_input"
-                )
-                wp_user = st.text_input(
-                    "Username",
-                    placeholder="your-username",
-                    value=env_wp_username,
-                    key="self_hosted_username_input"
-                )
-                wp_pass = st.text_input(
-                    "App Password", 
-                    type="password",
-                    help="Create Application Password in WordPress admin → Users → Profile → Application Passwords",
-                    value=env_wp_app_password,
-                    key="self_hosted_pass_input"
-                )
-            
-            # Button for explicit connection test
-            if st.button("🔗 Test WordPress Connection", key="test_wp_connection_button"):
-                with st.spinner("Testing connection..."):
-                    agent.publisher.setup_wordpress(wp_site, wp_user, wp_pass)
-                    result = agent.publisher.test_wordpress_connection()
-                    
-                    if result['success']:
-                        st.session_state.wp_configured = True
-                        st.session_state.wp_site_type = wp_type 
-                        st.success(f"✅ {result['message']}")
-                        
-                        # Store detected permalink type if self-hosted
-                        if not agent.publisher.wordpress_config.get('is_wpcom'):
-                            if agent.publisher.wordpress_config.get('use_query_params'):
-                                st.info("🔧 **Detected**: Your site uses query parameter format for REST API")
-                            else:
-                                st.info("🔧 **Detected**: Your site uses pretty permalinks for REST API")
-                            
-                            # --- Fetch categories and tags on successful self-hosted connection ---
-                            with st.spinner("Fetching categories and tags..."):
-                                st.session_state.wp_all_categories = agent.publisher.fetch_categories()
-                                st.session_state.wp_all_tags = agent.publisher.fetch_tags()
-                                if st.session_state.wp_all_categories:
-                                    st.success(f"Fetched {len(st.session_state.wp_all_categories)} categories.")
-                                else:
-                                    st.warning("Could not fetch any categories. Ensure categories exist and API permissions are correct.")
-                                if st.session_state.wp_all_tags:
-                                    st.success(f"Fetched {len(st.session_state.wp_all_tags)} tags.")
-                                else:
-                                    st.warning("Could not fetch any tags. Ensure tags exist and API permissions are correct.")
-
-                        else: # WP.com
-                            st.warning("Category and Tag fetching is not directly supported for WordPress.com via this application's API configuration yet.")
-                    else:
-                        st.session_state.wp_configured = False 
-                        st.error(f"❌ {result['error']}")
-                        
-                        if 'Coming Soon' in result['error']:
-                            st.markdown("Follow the instructions above to make your WordPress.com site public.")
-                        elif '401' in result['error'] or 'Authentication failed' in result['error']:
-                            st.markdown("Check your username and application password/access token.")
-                        elif '404' in result['error']:
-                            st.markdown("Ensure REST API is enabled and URL is correct. For self-hosted, also check permalink settings.")
-                        st.warning("Click '🔗 Test WordPress Connection' manually if you change credentials.")
-            
-            # Display current status
-            if 'wp_configured' in st.session_state and st.session_state.wp_configured:
-                st.markdown('<p class="status-connected">🟢 WordPress Connected</p>', unsafe_allow_html=True)
-            else:
-                st.markdown('<p class="status-disconnected">🔴 WordPress Not Configured</p>', unsafe_allow_html=True)
-        
-        st.divider()
-        st.subheader("📊 Platform Status")
-        
-        platforms_status = [
-            ("Gemini AI", "gemini_configured"),
-            ("WordPress", "wp_configured")
-        ]
-        
-        for platform, key in platforms_status:
-            status = "🟢 Connected" if key in st.session_state and st.session_state[key] else "🔴 Not Connected"
-            st.markdown(f"**{platform}**: {status}")
-    
-    tab1, tab2, tab3, tab4 = st.tabs(["📝 Content & Project Creation", "🚀 Publishing", "📊 Results", "⚙️ Settings"])
-    
-    with tab1:
-        st.header("📝 Content & Project Creation Wizard")
-        
-        if 'gemini_configured' not in st.session_state or not st.session_state.gemini_configured:
-            st.warning("⚠️ Please configure Gemini AI in the sidebar to continue.")
-            return
-        
-        creation_type = st.radio(
-            "What would you like to create?",
-            ["📄 Content (Articles, Blog Posts, Documentation)", "🚀 Python Projects & Applications"],
-            help="Choose between creating written content or complete coding projects",
-            key="creation_type_radio"
-        )
-        
-        is_project = "Projects" in creation_type
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.subheader("📋 Basic Information")
-            
-            if is_project:
-                project_name = st.text_input(
-                    "🚀 Project Name",
-                    placeholder="e.g., Simple Chatbot with Flask",
-                    help="Enter the name of your project",
-                    key="project_name_input"
-                )
-                
-                col1a, col1b = st.columns(2)
-                with col1a:
-                    project_type = st.selectbox("🛠️ Project Type", 
-                        agent.project_content_types,
-                        key="project_type_select")
-                with col1b:
-                    target_audience = st.selectbox("👥 Target Users", 
-                        ["Beginners", "Intermediate", "Advanced", "Developers"],
-                        key="project_audience_select")
-                
-                topic = project_name
-                
-            else: # Not a project, so it's article/blog content
-                topic = st.text_input(
-                    "📌 Article Topic",
-                    placeholder="e.g., The Future of AI in Content Creation",
-                    help="Enter the main topic or title for your content",
-                    key="article_topic_input"
-                )
-                
-                col1a, col1b = st.columns(2)
-                with col1a:
-                    content_type = st.selectbox("📄 Content Type", 
-                        agent.article_content_types,
-                        key="article_type_select")
-                    writing_style = st.selectbox("✍️ Writing Style", 
-                        agent.writing_styles,
-                        key="writing_style_select")
-                
-                with col1b:
-                    target_audience = st.selectbox("👥 Target Audience", 
-                        agent.target_audiences,
-                        key="audience_select")
-                    word_count = st.selectbox("📏 Word Count", 
-                        agent.word_counts,
-                        key="word_count_select")
-            
-            st.divider()
-            
-            st.subheader("📄 Detailed Requirements & Structure")
-            
-            if is_project:
-                description = st.text_area(
-                    "📝 Project Description & Features",
-                    placeholder="""Describe your project in detail:
-
-🎯 Main Purpose:
-• What should this project do?
-• What problem does it solve?
-
-🔧 Features to Include:
-• User authentication: Implement login/registration.
-• Database integration: Use SQLite for data storage.
-• API endpoints: Define GET/POST for user data.
-
-💻 Technical Requirements:
-• Programming languages: Python 3.9+
-• Frameworks: Flask
-• Libraries: SQLAlchemy, requests
-• User interface: REST API (no frontend needed)
-
-📚 Additional Requirements:
-• Comprehensive error handling for all API endpoints.
-• Logging of user activities.
-• Simple configuration using environment variables (.env.example).""",
-                    height=300,
-                    help="Provide detailed specifications for your project",
-                    key="project_description_area"
-                )
-                
-                additional_requirements = st.text_area(
-                    "➕ Additional Specifications (Optional)",
-                    placeholder="""Any other specific instructions for the AI:
-
-• Performance goals: Aim for quick response times.
-• Scalability: Design for future expansion (e.g., easy switch to PostgreSQL).
-• Security: Basic API key authentication.
-• Development environment setup details.""",
-                    height=200,
-                    key="project_additional_req_area"
-                )
-                
-            else:
-                description = st.text_area(
-                    "📝 Detailed Description & Core Topics",
-                    placeholder=f"""Describe your content requirements in detail for a {content_type.lower()} about "{topic}":
-
-🎯 Main Topics to Cover:
-• Introduction to [Concept]: Explain the basics.
-• Step-by-step implementation guide: Show how to do X.
-• Best practices for [Concept]: Provide actionable advice.
-
-💻 Technical Requirements (if applicable):
-• Programming language: Python (version, libraries)
-• Specific code examples for: data processing, API calls.
-• Command-line instructions for setup.
-
-📊 Structure Preferences:
-• Include an engaging introduction and a strong conclusion.
-• Use at least 3 main sections (H2 headings).
-• Include practical examples for each major point.
-• Add a "Troubleshooting Common Issues" section.
-• Use bullet points for lists and tables for comparisons.
-
-🔍 SEO & Format:
-• Primary keyword: "{topic.lower().replace(' ', '-')}"
-• Secondary keywords: [list, up, to, 5]
-• Include a call-to-action (e.g., "start your journey").""",
-                    height=300,
-                    help="Provide detailed instructions for the AI to create exactly what you need. Be specific about sections, examples, and tone.",
-                    key="content_description_area"
-                )
-                
-                additional_requirements = st.text_area(
-                    "➕ Additional Requirements (Optional)",
-                    placeholder="""Any other specific instructions for the AI:
-
-🎨 Style & Tone:
-• Professional but approachable, avoiding overly academic jargon.
-• Maintain a consistent, encouraging tone.
-
-📈 Special Elements:
-• Include a compelling anecdote or real-world example.
-• Suggest relevant external resources for further reading.
-• Add a section on common pitfalls and how to avoid them.
-
-🔗 References:
-• Mention 2-3 prominent tools/libraries in the field.
-• Suggest potential sub-topics for future articles.
-
-📱 Format Specifics:
-• Mobile-friendly formatting.
-• Suggest a potential social media blurb (e.g., tweet).""",
-                    height=200,
-                    key="content_additional_req_area"
-                )
-            
-            with st.expander("🔧 Advanced Generation Options", expanded=True):
-                if not is_project:
-                    col_adv_content1, col_adv_content2 = st.columns(2)
-                    with col_adv_content1:
-                        include_seo = st.checkbox("Include SEO optimization", value=True, help="AI will focus on keywords, headings, and meta-description elements.", key="include_seo_checkbox")
-                        include_toc = st.checkbox("Generate Table of Contents", value=False, help="Adds a Table of Contents at the start of the article.", key="include_toc_checkbox")
-                    with col_adv_content2:
-                        include_examples = st.checkbox("Include Practical Examples", value=True, help="Encourage the AI to provide code snippets, real-world scenarios, etc.", key="include_examples_checkbox")
-                        include_conclusion = st.checkbox("Include Actionable Conclusion", value=True, help="Ensure the article ends with key takeaways and next steps.", key="include_conclusion_checkbox")
-                else: 
-                    col_adv_project1, col_adv_project2 = st.columns(2)
-                    with col_adv_project1:
-                        project_complexity = st.selectbox("⚙️ Project Complexity", ["Simple", "Intermediate", "Advanced"], help="Influences the depth and scope of the generated project.", key="project_complexity_select")
-                        include_tests = st.checkbox("Include Unit Tests", value=False, help="Generate basic unit tests for the project.", key="include_tests_checkbox")
-                        include_docker = st.checkbox("Include Docker Setup", value=False, help="Generate Dockerfile and docker-compose.yml.", key="include_docker_checkbox")
-                    with col_adv_project2:
-                        create_examples = st.checkbox("Create Usage Examples", value=True, help="Generate example scripts or usage demonstrations.", key="create_examples_checkbox")
-                        include_docs = st.checkbox("Include Detailed Documentation", value=True, help="Encourage more extensive inline comments and README details.", key="include_docs_checkbox")
-                        include_ci_cd = st.checkbox("Include CI/CD Configuration", value=False, help="Generate basic CI/CD workflow (e.g., GitHub Actions).", key="include_ci_cd_checkbox")
-
-
-        with col2:
-            st.subheader("🎯 Creation Preview")
-            
-            if topic or (is_project and project_name):
-                col2a, col2b = st.columns(2)
-                with col2a:
-                    st.metric("⏱️ Est. Gen Time", "30-180s")
-                    st.metric("📊 Audience", target_audience)
-                
-                with col2b:
-                    if is_project:
-                        st.metric("📁 Files", "3-10+")
-                        st.metric("⚙️ Complexity", project_complexity)
-                    else:
-                        st.metric("📝 Words", word_count)
-                        st.metric("🎨 Style", writing_style)
-                
-                if is_project:
-                    st.markdown("""
-                    <div class="feature-box">
-                    <h4>🚀 Project Features (AI Will Attempt)</h4>
-                    <ul style="margin: 0; padding-left: 20px;">
-                    <li>🐍 Core project logic files</li>
-                    <li>📋 `requirements.txt`</li>
-                    <li>📚 Comprehensive `README.md`</li>
-                    <li>🔧 `.gitignore` and config files</li>
-                    <li>🧪 Unit tests (optional)</li>
-                    <li>🐳 Docker setup (optional)</li>
-                    <li>🔄 CI/CD config (optional)</li>
-                    </ul>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown("""
-                    <div class="feature-box">
-                    <h4>✅ Content Quality & Structure (AI Will Attempt)</h4>
-                    <ul style="margin: 0; padding-left: 20px;">
-                    <li>🎯 SEO-optimized elements (title, meta desc, keywords)</li>
-                    <li>📱 Clean, readable formatting</li>
-                    <li>💻 Syntax-highlighted code blocks (if technical)</li>
-                    <li>📊 Logical section hierarchy (H1, H2, H3)</li>
-                    <li>🔗 Placeholder for relevant links</li>
-                    <li>📈 Actionable insights & tips</li>
-                    <li>📚 Optional Table of Contents</li>
-                    </ul>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                if is_project:
-                    project_info_map = {
-                        "Python Project": "A general-purpose Python application.",
-                        "Web Application": "A functional web app, potentially with frontend/backend components.",
-                        "API Project": "A RESTful API with defined endpoints.",
-                        "Data Science Project": "Scripts and notebooks for data analysis/modeling.",
-                        "Machine Learning Project": "Code for an ML model, including data processing.",
-                        "Discord Bot": "A functional Discord bot with commands.",
-                        "Automation Script": "A script to automate a specific task.",
-                        "CLI Tool": "A command-line interface tool.",
-                        "Game Project": "Basic code for a simple game."
-                    }
-                    st.info(f"**{project_type}**: {project_info_map.get(project_type, 'A customized project.')}")
-                else:
-                    content_info_map = {
-                        "Blog Post": "An engaging, conversational article for your blog.",
-                        "Technical Article": "An in-depth piece covering technical concepts.",
-                        "Tutorial": "A step-by-step guide to teach a specific skill.",
-                        "News Article": "A factual report on a current event.",
-                        "Review": "An evaluation of a product or service.",
-                        "Opinion Piece": "A subjective article expressing a viewpoint.",
-                        "How-to Guide": "Practical instructions for achieving a task.",
-                        "Case Study": "An analysis of a problem, solution, and results.",
-                        "Product Documentation": "User guides and reference material for a product.",
-                        "API Documentation": "Comprehensive guide for using an API.",
-                        "White Paper": "An authoritative report on a specific topic, often for problem-solving.",
-                        "Research Paper": "A structured, academic-style paper based on research.",
-                        "Marketing Copy": "Persuasive content designed to promote something."
-                    }
-                    st.info(f"**{content_type}**: {content_info_map.get(content_type, 'A customized content piece.')}")
-        
-        st.divider()
-        
-        col_gen1, col_gen2, col_gen3 = st.columns([1, 2, 1])
-        
-        with col_gen2:
-            if is_project:
-                button_text = "🚀 Generate Project"
-                input_check = project_name
-                error_msg = "❌ Please enter a project name."
-            else:
-                button_text = "🚀 Generate Content"
-                input_check = topic
-                error_msg = "❌ Please enter a topic for your content."
-            
-            if st.button(button_text, type="primary", use_container_width=True, key="generate_button"):
-                if not input_check.strip():
-                    st.error(error_msg)
-                elif len(input_check.strip()) < 5 and not description.strip():
-                    st.error("❌ Please provide a more detailed topic/project name or description (at least 5 characters).")
-                else:
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    try:
-                        if is_project:
-                            status_text.text("🤖 AI is analyzing your project requirements...")
-                            progress_bar.progress(20)
-                            time.sleep(1)
-                            
-                            status_text.text("🔨 Creating project structure and code...")
-                            progress_bar.progress(40)
-                            
-                            project_files = agent.generate_project_files(
-                                project_name=project_name,
-                                project_type=project_type,
-                                description=description, 
-                                additional_requirements=additional_requirements, 
-                                target_audience=target_audience,
-                                project_complexity=project_complexity,
-                                include_tests=include_tests,
-                                include_docker=include_docker,
-                                include_ci_cd=include_ci_cd,
-                                include_docs=include_docs,
-                                create_examples=create_examples
-                            )
-                            
-                            if project_files:
-                                progress_bar.progress(90)
-                                status_text.text("📁 Finalizing project files...")
-                                
-                                st.session_state.generated_project = project_files
-                                st.session_state.project_name = project_name
-                                st.session_state.project_type = project_type
-                                st.session_state.project_description = description
-                                st.session_state.generation_time = datetime.now()
-                                st.session_state.is_project = True
-                                
-                                progress_bar.progress(100)
-                                status_text.text("✅ Project generated successfully!")
-                                
-                                file_count = len(project_files)
-                                total_lines = sum(len(content.split('\n')) for content in project_files.values())
-                                
-                                st.success(f"""
-                                🎉 **Project Generated Successfully!**
-                                
-                                📊 **Stats:**
-                                - Files: {file_count}
-                                - Total lines: {total_lines:,}
-                                - Project type: {project_type}
-                                """)
-                                
-                                st.balloons()
-                                
-                            else:
-                                st.error("❌ Failed to generate project files.")
-                                
-                        else: # Generating content (articles, blogs, etc.)
-                            status_text.text("🤖 AI is analyzing your content requirements...")
-                            progress_bar.progress(20)
-                            time.sleep(1)
-                            
-                            status_text.text("✍️ Creating your content...")
-                            progress_bar.progress(50)
-                            
-                            content = agent.generate_enhanced_content(
-                                topic=topic,
-                                content_type=content_type,
-                                description=description, 
-                                additional_requirements=additional_requirements, 
-                                writing_style=writing_style, 
-                                target_audience=target_audience, 
-                                word_count=word_count, 
-                                include_seo=include_seo,
-                                include_toc=include_toc,
-                                include_examples=include_examples,
-                                include_conclusion=include_conclusion
-                            )
-                            
-                            if content and not content.startswith("Error:"):
-                                progress_bar.progress(70)
-                                status_text.text("🔍 Generating SEO metadata...")
-                                
-                                seo_metadata = agent.generate_seo_metadata(content, topic)
-                                
-                                progress_bar.progress(90)
-                                status_text.text("📝 Finalizing content...")
-                                
-                                st.session_state.generated_content = content
-                                st.session_state.content_title = agent.extract_title_from_content(content)
-                                st.session_state.content_topic = topic
-                                st.session_state.content_type = content_type
-                                st.session_state.seo_metadata = seo_metadata
-                                st.session_state.generation_time = datetime.now()
-                                st.session_state.is_project = False
-                                
-                                progress_bar.progress(100)
-                                status_text.text("✅ Content generated successfully!")
-                                
-                                word_count_actual = len(content.split())
-                                
-                                st.success(f"""
-                                🎉 **Content Generated Successfully!**
-                                
-                                📊 **Stats:**
-                                - Words: {word_count_actual:,}
-                                - Characters: {len(content):,}
-                                - Estimated reading time: {word_count_actual // 200} minutes
-                                """)
-                                
-                                st.balloons()
-                                
-                            else:
-                                st.error(f"❌ Content generation failed: {content}")
-                        
-                        time.sleep(2)
-                        progress_bar.empty()
-                        status_text.empty()
-                        
-                    except Exception as e:
-                        st.error(f"❌ Error during generation: {str(e)}")
-                        progress_bar.empty()
-                        status_text.empty()
-    
-    with tab2:
-        st.header("🚀 Publishing & Distribution")
-        
-        has_content = 'generated_content' in st.session_state
-        has_project = 'generated_project' in st.session_state
-        
-        if not has_content and not has_project:
-            st.info("👆 Generate content or a project in the first tab to continue.")
-            return
-        
-        is_project = st.session_state.get('is_project', False)
-        
-        if is_project and has_project:
-            st.subheader("🚀 Project Files")
-            
-            project_files = st.session_state.generated_project
-            project_name = st.session_state.project_name
-            
-            with st.expander("📁 Project Files Preview", expanded=False):
-                for filename, content in project_files.items():
-                    st.markdown(f"**📄 {filename}**")
-                    
-                    ext = filename.split('.')[-1].lower()
-                    if ext == 'py': language = 'python'
-                    elif ext == 'md': language = 'markdown'
-                    elif ext == 'json': language = 'json'
-                    elif ext in ['yaml', 'yml']: language = 'yaml'
-                    elif ext == 'txt': language = 'text'
-                    elif ext == 'html': language = 'html'
-                    elif ext == 'css': language = 'css'
-                    elif ext == 'js': language = 'javascript'
-                    elif ext == 'sh': language = 'bash'
-                    elif ext == 'env': language = 'bash' 
-                    else: language = 'text'
-                    
-                    display_content = content[:1000] + "\n..." if len(content) > 1000 else content
-                    st.code(display_content, language=language)
-                    st.divider()
-            
-            file_count = len(project_files)
-            calculated_total_lines = sum(len(content.split('\n')) for content in project_files.values())
-            
-            col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
-            
-            with col_stat1: st.metric("📁 Files", file_count)
-            with col_stat2: st.metric("📝 Total Lines", f"{calculated_total_lines:,}")
-            with col_stat3: st.metric("🛠️ Project Type", st.session_state.project_type)
-            with col_stat4: st.metric("📊 Generated", "Recently")
-            
-            st.divider()
-            st.subheader("💾 Local Download Options")
-            
-            col_down1, col_down2 = st.columns(2)
-            
-            with col_down1:
-                if st.button("📁 Download as ZIP", use_container_width=True, key="download_project_zip_button"):
-                    import io
-                    
-                    zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for filename, content in project_files.items():
-                            zip_file.writestr(filename, content)
-                    
-                    zip_buffer.seek(0)
-                    
-                    st.download_button(
-                        "⬇️ Download Project ZIP",
-                        zip_buffer.getvalue(),
-                        file_name=f"{project_name.replace(' ', '_').lower()}_project.zip",
-                        mime='application/zip',
-                        key="final_download_project_zip"
-                    )
-            
-            with col_down2:
-                if st.button("📄 View Files Individually", use_container_width=True, key="view_individual_files_button"):
-                    st.session_state.show_individual_files = True
-            
-            if st.session_state.get('show_individual_files', False):
-                st.subheader("📄 Individual File Downloads")
-                for filename, content in project_files.items():
-                    col_file1, col_file2 = st.columns([3, 1])
-                    with col_file1:
-                        st.write(f"**{filename}**")
-                    with col_file2:
-                        st.download_button(
-                            "⬇️ Download",
-                            content.encode('utf-8'), 
-                            file_name=filename,
-                            key=f"download_individual_{filename}"
-                        )
-        
-        elif has_content:
-            with st.expander("📖 Content Preview", expanded=False):
-                st.markdown(st.session_state.generated_content)
-            
-            content_stats = {
-                "Word Count": len(st.session_state.generated_content.split()),
-                "Character Count": len(st.session_state.generated_content),
-                "Reading Time": f"{len(st.session_state.generated_content.split()) // 200} min",
-                "Content Type": st.session_state.get('content_type', 'Unknown')
-            }
-            
-            col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
-            
-            with col_stat1: st.metric("📝 Words", f"{content_stats['Word Count']:,}")
-            with col_stat2: st.metric("🔤 Chars", f"{content_stats['Character Count']:,}")
-            with col_stat3: st.metric("📖 Read Time", content_stats['Reading Time'])
-            with col_stat4: st.metric("📄 Type", content_stats['Content Type'])
-            
-            st.divider()
-            
-            if 'seo_metadata' in st.session_state and st.session_state.seo_metadata:
-                st.subheader("🔍 SEO Optimization")
-                
-                seo = st.session_state.seo_metadata
-                
-                col_seo1, col_seo2 = st.columns(2)
-                
-                with col_seo1:
-                    seo_title = st.text_input(
-                        "📰 SEO Title", 
-                        value=seo.get('title', ''),
-                        help="Optimized title for search engines (50-60 characters)",
-                        key="seo_title_input"
-                    )
-                    
-                    url_slug = st.text_input(
-                        "🔗 URL Slug", 
-                        value=seo.get('slug', ''),
-                        help="URL-friendly version of your title",
-                        key="url_slug_input"
-                    )
-                
-                with col_seo2:
-                    meta_description = st.text_area(
-                        "📝 Meta Description", 
-                        value=seo.get('description', ''),
-                        height=100,
-                        help="Description for search results (150-160 characters)",
-                        key="meta_description_area"
-                    )
-                    
-                    current_keywords = seo.get('keywords', [])
-                    if not isinstance(current_keywords, list):
-                        current_keywords = []
-                    
-                    keywords = st.multiselect(
-                        "🏷️ Keywords/Tags",
-                        options=list(set(current_keywords + [k.strip() for k in st.session_state.get('content_topic', '').split(',') if k.strip()])), 
-                        default=current_keywords[:5],
-                        key="keywords_multiselect"
-                    )
-                
-                if seo:
-                    st.session_state.seo_metadata.update({
-                        'title': seo_title,
-                        'description': meta_description,
-                        'slug': url_slug,
-                        'keywords': keywords
-                    })
-            
-            st.divider()
-            
-            st.subheader("⚡ Quick Actions & WordPress Publishing")
-            
-            col_actions, col_wp_publish = st.columns([1, 2])
-            
-            with col_actions:
-                if st.button("💾 Save Markdown", use_container_width=True, key="save_markdown_button"):
-                    try:
-                        filepath = agent.save_markdown_file(
-                            st.session_state.generated_content,
-                            st.session_state.content_title,
-                            st.session_state.get('seo_metadata')
-                        )
-                        st.success(f"✅ Saved: {filepath}")
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            st.download_button(
-                                "⬇️ Download Markdown", f.read().encode('utf-8'),
-                                file_name=Path(filepath).name, mime='text/markdown',
-                                key="download_markdown_final"
-                            )
-                    except Exception as e:
-                        st.error(f"❌ Error saving file: {str(e)}")
-                
-                if st.button("🌐 Create HTML File", use_container_width=True, key="create_html_button"):
-                    try:
-                        html_path = agent.create_html_website(
-                            st.session_state.generated_content,
-                            st.session_state.content_title,
-                            st.session_state.get('seo_metadata')
-                        )
-                        st.success(f"✅ HTML file created: {html_path}")
-                        with open(html_path, 'r', encoding='utf-8') as f:
-                            st.download_button(
-                                "⬇️ Download HTML", f.read().encode('utf-8'),
-                                file_name="index.html", mime='text/html',
-                                key="download_html_final"
-                            )
-                    except Exception as e:
-                        st.error(f"❌ Error creating HTML: {str(e)}")
-            
-            with col_wp_publish:
-                if 'wp_configured' in st.session_state and st.session_state.wp_configured:
-                    st.markdown("#### WordPress Publishing Options")
-                    publish_status = st.selectbox("Post Status", ["draft", "publish"], key="wp_publish_status_select")
-                    
-                    # --- Categories & Tags Multiselect based on fetched terms ---
-                    all_categories_names = [cat['name'] for cat in st.session_state.get('wp_all_categories', [])]
-                    selected_categories = st.multiselect(
-                        "Select Categories",
-                        options=all_categories_names,
-                        default=[],
-                        help="Select existing categories from your WordPress site.",
-                        key="categories_multiselect_wp"
-                    )
-
-                    all_tags_names = [tag['name'] for tag in st.session_state.get('wp_all_tags', [])]
-                    # Suggest keywords from SEO metadata as default selection
-                    default_tags = [
-                        tag_name for tag_name in all_tags_names
-                        if tag_name.lower() in [k.lower() for k in st.session_state.get('seo_metadata', {}).get('keywords', [])]
-                    ]
-                    selected_tags = st.multiselect(
-                        "Select Tags",
-                        options=all_tags_names,
-                        default=default_tags,
-                        help="Select existing tags from your WordPress site. Keywords from SEO are pre-selected if they exist as tags.",
-                        key="tags_multiselect_wp"
-                    )
-                    # --- END Categories & Tags Multiselect ---
-
-                    st.markdown("##### Featured Image (Optional)")
-                    featured_image_option = st.radio(
-                        "How to add Featured Image?",
-                        ["None", "Manual Upload", "AI Generated"],
-                        key="featured_image_option",
-                        horizontal=True
-                    )
-                    
-                    uploaded_file = None
-                    ai_image_prompt = ""
-                    featured_image_data = None 
-                    featured_image_filename = None
-                    featured_image_mime_type = None
-
-                    if featured_image_option == "Manual Upload":
-                        uploaded_file = st.file_uploader("Upload Image", type=["png", "jpg", "jpeg", "gif"], key="image_uploader")
-                        if uploaded_file is not None:
-                            featured_image_data = uploaded_file.getvalue()
-                            featured_image_filename = uploaded_file.name
-                            featured_image_mime_type = uploaded_file.type
-                            st.image(uploaded_file, caption='Uploaded Image', width=200)
-
-                    elif featured_image_option == "AI Generated":
-                        ai_image_prompt = st.text_input("Describe Image for AI", placeholder="e.g., a futuristic city at sunset", key="ai_image_prompt")
-                        if ai_image_prompt and st.button("Generate Image with AI", key="generate_ai_image_button"):
-                            with st.spinner("Generating image... (This is a placeholder)"):
-                                generated_image_bytes = agent.generate_image_with_ai(ai_image_prompt)
-                                if generated_image_bytes:
-                                    st.session_state.generated_ai_image_data = generated_image_bytes # Store data
-                                    st.session_state.generated_ai_image_filename = f"ai_generated_{ai_image_prompt.replace(' ', '_')[:20]}.png"
-                                    st.session_state.generated_ai_image_mime = "image/png"
-                                    st.image(io.BytesIO(generated_image_bytes), caption='AI Generated Image', width=200)
-                                else:
-                                    st.error("Failed to generate AI image.")
-                        # Display last generated image if exists and option is AI Generated
-                        if 'generated_ai_image_data' in st.session_state and featured_image_option == "AI Generated":
-                            featured_image_data = st.session_state.generated_ai_image_data
-                            featured_image_filename = st.session_state.generated_ai_image_filename
-                            featured_image_mime_type = st.session_state.generated_ai_image_mime
-                            st.image(io.BytesIO(featured_image_data), caption='AI Generated Image (from session)', width=200)
-
-
-                    if st.button("📝 Publish Post to WordPress", type="primary", use_container_width=True, key="publish_post_wp_button"):
-                        if not st.session_state.get('wp_configured', False):
-                            st.error("❌ WordPress is not configured. Please set up your credentials in the sidebar and test the connection.")
-                            return
-                        
-                        featured_media_id = None
-                        if featured_image_option != "None" and featured_image_data:
-                            with st.spinner("Uploading featured image to WordPress media library..."):
-                                upload_result = agent.publisher.upload_image_to_wordpress(
-                                    featured_image_data, 
-                                    featured_image_filename, 
-                                    featured_image_mime_type
-                                )
-                                if upload_result['success']:
-                                    st.success(f"✅ {upload_result['message']}")
-                                    featured_media_id = upload_result['media_id']
-                                else:
-                                    st.error(f"❌ Failed to upload featured image: {upload_result['error']}")
-                                    st.warning("Proceeding to publish post without featured image.")
-                        elif featured_image_option != "None" and not featured_image_data:
-                            st.warning("No image data available for featured image. Please upload/generate an image first.")
-                            # Do not return here, let the post publish without image if user chose option but no image data.
-
-                        with st.spinner("Publishing content to WordPress..."):
-                            result = agent.publisher.publish_to_wordpress(
-                                st.session_state.content_title,
-                                st.session_state.generated_content,
-                                status=publish_status,
-                                categories=selected_categories, # Pass selected names
-                                tags=selected_tags,         # Pass selected names
-                                featured_image_id=featured_media_id
-                            )
-                            
-                            if result['success']:
-                                st.success(f"✅ Content published successfully to WordPress!")
-                                st.markdown(f"🔗 **View Post:** {result['url']}")
-                                st.markdown(f"✏️ **Edit Post:** {result['edit_url']}")
-                                
-                                if 'publish_results' not in st.session_state:
-                                    st.session_state.publish_results = []
-                                st.session_state.publish_results.append({
-                                    'platform': 'WordPress',
-                                    'status': 'success',
-                                    'url': result['url'],
-                                    'edit_url': result['edit_url'],
-                                    'timestamp': datetime.now()
-                                })
-                            else:
-                                st.error(f"❌ WordPress Publishing Error: {result['error']}")
-                                
-                else:
-                    st.warning("WordPress is not configured. Please set up your credentials in the sidebar to enable publishing.")
-                    st.button("📝 Configure WordPress", use_container_width=True, disabled=True, key="configure_wp_disabled_button_main")
-            
-            st.divider()
-            st.subheader("🎯 Advanced Publishing Options")
-            st.info("Additional publishing options (e.g., to other platforms) have been removed to focus on WordPress as per your request.")
-            
-
-    with tab3:
-        st.header("📊 Publishing Results & Analytics")
-        
-        if 'publish_results' in st.session_state and st.session_state.publish_results:
-            st.subheader("📈 Recent Publications")
-            
-            wordpress_results = [res for res in st.session_state.publish_results if res['platform'] == 'WordPress']
-            
-            if wordpress_results:
-                for i, result in enumerate(reversed(wordpress_results)):
-                    display_title = st.session_state.get('content_title', 'Untitled Post')
-                    if len(display_title) > 70:
-                        display_title = display_title[:67] + "..."
-
-                    # >>> THIS IS THE LINE TO CHANGE <<<
-                    with st.expander(f"WordPress - {display_title} ({result['timestamp'].strftime('%Y-%m-%d %H:%M')})", expanded=(i==0)): # REMOVE 'key' HERE
-                        col_result1, col_result2 = st.columns([2, 1])
-                        
-                        with col_result1:
-                            st.write(f"**Platform:** {result['platform']}")
-                            st.write(f"**Status:** {'✅ Success' if result['status'] == 'success' else '❌ Failed'}")
-                            st.write(f"**Published:** {result['timestamp'].strftime('%Y-%m-%d at %H:%M:%S')}")
-                            
-                            if 'url' in result:
-                                st.markdown(f"🔗 [View Published Content]({result['url']})")
-                                if 'edit_url' in result:
-                                    st.markdown(f"✏️ [Edit in WordPress Admin]({result['edit_url']})")
-
-                        with col_result2:
-                            # You might still need keys for buttons inside loops
-                            if st.button(f"📋 Copy URL", key=f"copy_url_btn_{i}"): # Add a unique key to the button
-                                if 'url' in result:
-                                    st.clipboard(result['url'])
-                                    st.success("URL copied to clipboard!")
-            else:
-                st.info("📝 No WordPress publications yet. Publish some content to see results here!")
-        else:
-            st.info("📝 No publications yet. Publish some content to see results here!")
-        
-        if 'generated_content' in st.session_state or 'generated_project' in st.session_state:
-            st.divider()
-            st.subheader("📊 Content Analytics")
-            
-            if 'generated_content' in st.session_state:
-                content = st.session_state.generated_content
-                
-                col_analytics1, col_analytics2, col_analytics3, col_analytics4 = st.columns(4)
-                
-                with col_analytics1: st.metric("📝 Total Words", f"{len(content.split()):,}")
-                with col_analytics2: st.metric("📄 Paragraphs", len([p for p in content.split('\n\n') if p.strip()]))
-                with col_analytics3: st.metric("💻 Code Blocks", len(re.findall(r'```[\s\S]*?```', content)))
-                with col_analytics4: st.metric("📑 Headings", len(re.findall(r'^#+\s', content, re.MULTILINE)))
-            
-            elif 'generated_project' in st.session_state:
-                project_files = st.session_state.generated_project
-                
-                col_analytics1, col_analytics2, col_analytics3, col_analytics4 = st.columns(4)
-                
-                with col_analytics1: st.metric("📁 Total Files", len(project_files))
-                calculated_total_lines = sum(len(content.split('\n')) for content in project_files.values())
-                with col_analytics2: st.metric("📝 Total Lines", f"{calculated_total_lines:,}")
-                with col_analytics3: st.metric("🐍 Python Files", len([f for f in project_files.keys() if f.endswith('.py')]))
-                with col_analytics4: st.metric("⚙️ Config Files", len([f for f in project_files.keys() if f in ['requirements.txt', 'README.md', '.gitignore', 'config.py', 'LICENSE']])) # Added LICENSE
-            
-            if 'seo_metadata' in st.session_state and st.session_state.seo_metadata:
-                st.divider()
-                st.subheader("🔍 SEO Analysis")
-                
-                seo = st.session_state.seo_metadata
-                
-                col_seo_analysis1, col_seo_analysis2 = st.columns(2)
-                
-                with col_seo_analysis1:
-                    title_length = len(seo.get('title', ''))
-                    title_status = "✅ Good" if 50 <= title_length <= 60 else "⚠️ Needs optimization"
-                    st.metric("📰 Title Length", f"{title_length} chars", delta=title_status)
-                    
-                    st.metric("🏷️ Keywords", len(seo.get('keywords', [])))
-                
-                with col_seo_analysis2:
-                    desc_length = len(seo.get('description', ''))
-                    desc_status = "✅ Good" if 150 <= desc_length <= 160 else "⚠️ Needs optimization"
-                    st.metric("📝 Description Length", f"{desc_length} chars", delta=desc_status)
-                    
-                    st.metric("🔗 URL Slug Length", f"{len(seo.get('slug', ''))} chars")
-    
-    with tab4:
-        st.header("⚙️ Settings & Configuration")
-        
-        st.subheader("🔧 API Configuration")
-        with st.expander("📋 API Information & Setup", expanded=True):
-            st.markdown("""
-            **Required API for Full Functionality:**
-            
-            1. **🤖 Google Gemini AI** (Required)
-               - Get API key: [Google AI Studio](https://aistudio.google.com/)
-               - Used for: Content generation and project creation
-               - Cost: Free tier available
-            
-            2. **🏢 WordPress REST API** (Optional)
-               - Setup: Ensure REST API is enabled in WordPress (default for modern versions).
-               - **Self-hosted**: Create an **Application Password** in your WordPress admin via Users → Profile → Application Passwords. Use this password, not your regular login password.
-               - **WordPress.com**: You'll need a **Business plan** or higher for full REST API access. Use an **Access Token** (from WordPress.com → My Sites → Manage → Marketing → Connections) instead of a password.
-               - Used for: Direct WordPress publishing of generated content.
-            """)
-        
-        st.divider()
-        st.subheader("💾 Configuration Management")
-        
-        col_config1, col_config2 = st.columns(2)
-        
-        with col_config1:
-            st.markdown("**📤 Export Current Preferences**")
-            if st.button("📋 Generate Config File", key="generate_config_file_button"):
-                config_template = {
-                    "content_preferences": {
-                        "default_writing_style": "Professional",
-                        "default_target_audience": "Intermediate",
-                        "default_word_count": "1200-2000",
-                        "include_seo": True,
-                        "include_toc": False,
-                        "include_examples": True,
-                        "include_conclusion": True
-                    },
-                    "project_preferences": {
-                        "default_project_type": "Python Project",
-                        "project_complexity": "Intermediate",
-                        "include_tests": False,
-                        "include_docker": False,
-                        "include_ci_cd": False,
-                        "include_documentation": True,
-                        "create_examples": True
-                    },
-                    "publishing_platforms": {
-                        "wordpress": {
-                            "site_url": agent.publisher.wordpress_config.get('site_url', 'https://your-site.com'),
-                            "username": agent.publisher.wordpress_config.get('username', 'your-username'),
-                            "is_wpcom": agent.publisher.wordpress_config.get('is_wpcom', False),
-                            "default_status": "draft"
-                        }
-                    },
-                    "gemini_api_key_placeholder": "YOUR_GEMINI_API_KEY_HERE"
-                }
-                
-                config_json = json.dumps(config_template, indent=2)
-                
-                st.download_button(
-                    "⬇️ Download Config JSON",
-                    config_json,
-                    file_name="ai_agent_config.json",
-                    mime="application/json",
-                    key="download_config_json_button"
-                )
-        
-        with col_config2:
-            st.markdown("**📥 Import Settings**")
-            uploaded_config = st.file_uploader(
-                "Upload Configuration File (.json)",
-                type=['json'],
-                help="Upload a configuration JSON file to load preferences.",
-                key="upload_config_file_uploader"
-            )
-            
-            if uploaded_config:
-                try:
-                    config_data = json.load(uploaded_config)
-                    
-                    if 'content_preferences' in config_data:
-                        st.session_state.default_content_prefs = config_data['content_preferences']
-                    if 'project_preferences' in config_data:
-                        st.session_state.default_project_prefs = config_data['project_preferences']
-                    if 'publishing_platforms' in config_data and 'wordpress' in config_data['publishing_platforms']:
-                        wp_cfg = config_data['publishing_platforms']['wordpress']
-                        if 'site_url' in wp_cfg and 'username' in wp_cfg:
-                            agent.publisher.setup_wordpress(wp_cfg['site_url'], wp_cfg['username'], "placeholder_password") 
-                            st.session_state.wp_configured = True 
-                            st.success("✅ WordPress configuration partially loaded (password/token needs re-entry).")
-                    
-                    st.success("✅ Configuration preferences loaded successfully!")
-                    st.json(config_data)
-                except Exception as e:
-                    st.error(f"❌ Error loading configuration: {str(e)}")
-        
-        st.divider()
-        st.subheader("ℹ️ Application Information")
-        
-        col_info1, col_info2 = st.columns(2)
-        
-        with col_info1:
-            st.markdown("""
-            **🚀 AI Content Agent Pro**
-            
-            - **Version:** 2.1.0 (WordPress Focused)
-            - **Framework:** Streamlit
-            - **AI Model:** Google Gemini 2.0 Flash
-            - **Language:** Python 3.8+
-            - **Key Features:** Content & Project Generation, WordPress Publishing
-            """)
-        
-        with col_info2:
-            wordpress_pub_count = len([r for r in st.session_state.get('publish_results', []) if r['platform'] == 'WordPress'])
-            st.markdown(f"""
-            **📊 Session Statistics**
-            
-            - **Content Generated:** {1 if 'generated_content' in st.session_state else 0}
-            - **Projects Generated:** {1 if 'generated_project' in st.session_state else 0}
-            - **WordPress Connected:** {'Yes' if st.session_state.get('wp_configured', False) else 'No'}
-            - **Successful WP Publications:** {wordpress_pub_count}
-            """)
-        
-        st.divider()
-        st.subheader("🧹 Session Management")
-        
-        if st.button("🗑️ Clear All Session Data", key="clear_session_data_button", type="secondary"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-            st.success("✅ All session data cleared! Please refresh the page or rerun the script.")
-            st.experimental_rerun() # Use experimental_rerun for full state clear and reload
-
-        st.divider()
-        st.subheader("📚 Quick Help")
-        
-        with st.expander("🆘 Common Issues & Solutions", expanded=True):
-            st.markdown("""
-            **Common Problems & Solutions:**
-            
-            1.  **Gemini AI API Connection Failed:**
-                * Double-check your API key for typos.
-                * Ensure your internet connection is stable.
-                * Verify your API key is active and has the necessary permissions in [Google AI Studio](https://aistudio.google.com/).
-                
-            2.  **WordPress Connection Failed:**
-                * **Self-hosted:** Ensure you are using an **Application Password** (created in WordPress admin → Users → Profile) and **NOT** your regular login password.
-                * **WordPress.com:** Confirm your site is **Public** (not "Coming Soon") and you have a **Business plan** or higher for REST API access. Use an **Access Token** (from WordPress.com → My Sites → Manage → Marketing → Connections).
-                * Verify your WordPress site URL is correct and accessible from where this app is running.
-                * Check if WordPress REST API is enabled (usually default for WP 4.7+).
-                
-            3.  **WordPress Publishing Failed (e.g., "Invalid parameter(s): tags" or categories not recognized):**
-                * For **self-hosted WordPress**, tags and categories **must exist** on your WordPress site *before* you publish. The app tries to convert names to IDs by fetching available terms. If a name doesn't exist or doesn't exactly match (case-insensitive), it won't be applied. Create them manually in WordPress first.
-                * For WordPress.com, tags are sent as names. Categories are often harder to set via API directly without specific IDs or plugins.
-                
-            4.  **Featured Image Upload Failed:**
-                * Ensure your WordPress user (associated with the Application Password/Access Token) has permissions to upload media.
-                * Check for file size limits on your WordPress server (PHP `upload_max_filesize`, `post_max_size`).
-                * Verify the image file type is supported by WordPress.
-                * **For AI-generated images:** This feature uses a placeholder. Actual AI image generation requires integration with a dedicated image generation API (e.g., DALL-E, Stable Diffusion) and their respective API keys.
-                
-            5.  **Generated Content/Project is too short or irrelevant:**
-                * Provide a **more detailed and specific "Description"** and "Additional Requirements" in the "Content & Project Creation" tab.
-                * Experiment with different "Writing Styles" or "Target Audiences."
-                * Increase the "Word Count" target.
-            """)
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+AI Content Agent Pro - WordPress Focused Implementation
+Automated content creation and WordPress publishing with Gemini AI
+"""
+
+import streamlit as st
+import os
+import json
+from datetime import datetime
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+import base64
+import gzip
+import hashlib
+import html
+import shelve
+from pathlib import Path
+import re
+import string
+import tempfile
+from typing import Dict, Any, BinaryIO, Optional, List, Tuple, Union
+import time
+from dotenv import load_dotenv
+import io # Import for image handling
+
+try:
+    import orjson  # Optional: markedly faster encode/decode for large JSON payloads
+except ImportError:
+    orjson = None
+
+try:
+    import cmarkgfm  # Optional: C-backed Markdown renderer for the HTML export
+except ImportError:
+    cmarkgfm = None
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Environment-sourced defaults, read once at import time (load_dotenv above
+# has already populated os.environ) instead of on every Streamlit rerun.
+_ENV_GEMINI_KEY = os.getenv('GEMINI_API_KEY', '')
+_ENV_WP_SITE_URL = os.getenv('WP_SITE_URL', '')
+_ENV_WP_USERNAME = os.getenv('WP_USERNAME', '')
+_ENV_WP_APP_PASSWORD = os.getenv('WP_APP_PASSWORD', '')
+
+# Reusable Markdown converters, built lazily on first use. Importing
+# markdown (which drags in Pygments via codehilite) and registering the
+# extensions is the expensive part, so it is kept off the Streamlit
+# cold-start path entirely and paid once per process.
+_MD_CONVERTER_EXTENSIONS = {
+    'post': ['codehilite', 'fenced_code'],
+    'page': ['codehilite', 'fenced_code', 'tables'],
+}
+_md_converter_cache: Dict[str, Any] = {}
+
+
+def _get_md_converter(kind: str) -> Any:
+    converter = _md_converter_cache.get(kind)
+    if converter is None:
+        import markdown
+        converter = markdown.Markdown(extensions=_MD_CONVERTER_EXTENSIONS[kind])
+        _md_converter_cache[kind] = converter
+    return converter
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _markdown_to_html(content: str, kind: str) -> str:
+    """Markdown->HTML conversion memoized on the content string, so repeat
+    publishes/exports of unchanged content skip the render entirely."""
+    if kind == 'page' and cmarkgfm is not None:
+        # libcmark fast path for the website export; see create_html_website.
+        return cmarkgfm.github_flavored_markdown_to_html(content)
+    return _get_md_converter(kind).reset().convert(content)
+
+# Detected REST API details (permalink format) persisted across app restarts.
+_WP_CACHE_FILE = Path('.wp_cache.json')
+
+# On-disk layer of the Gemini response cache (keyed by prompt hash), so
+# regenerating identical content across app restarts skips the API call.
+_GEMINI_CACHE_FILE = Path('.cache') / 'gemini_responses'
+
+# Compiled once at import; parse_project_files runs these over multi-kilobyte
+# AI responses. The language tag after ``` is matched but not captured since
+# nothing consumes it.
+_FILE_BLOCK_RE = re.compile(r'FILE:\s*([^\n]+)\n```(?:[a-zA-Z0-9]+)?\n(.*?)\n```', re.DOTALL)
+
+# Strips punctuation (anything that is not a word character or whitespace)
+# from extracted titles.
+_TITLE_CLEANUP_RE = re.compile(r'[^\w\s]')
+
+# Filename slugs: drop ASCII punctuation (keeping '-') in one C-level
+# translate pass, then collapse dash/whitespace runs.
+_SLUG_DROP_TABLE = {ord(c): None for c in string.punctuation if c != '-'}
+_DASH_RUN_RE = re.compile(r'[-\s]+')
+
+# Cleans AI-proposed URL slugs in generate_seo_metadata.
+_SLUG_CLEANUP_RE = re.compile(r'[^\w\s-]')
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _extract_title_from_content(content: str) -> str:
+    """First-H1 title extraction; memoized since Streamlit reruns re-scan
+    the same generated content on every widget interaction."""
+    # Walk line starts with str.find rather than materializing a full
+    # split('\n') list; generated articles carry the H1 within the first
+    # few lines, so the scan stops almost immediately.
+    start = 0
+    length = len(content)
+    while start < length:
+        end = content.find('\n', start)
+        if end == -1:
+            end = length
+        line = content[start:end]
+        if line.startswith('#') and not line.startswith('##'):
+            return _TITLE_CLEANUP_RE.sub('', line).strip()
+        start = end + 1
+    return "Generated Content"
+
+# Full HTML page skeleton for create_html_website, tokenized once at import.
+# Using Template placeholders lets the CSS/JS keep plain braces instead of
+# f-string escape doubling.
+_HTML_PAGE_TEXT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${page_title}</title>
+    <meta name="description" content="${meta_description}">
+    <meta name="keywords" content="${keywords}">
+    <meta name="author" content="AI Content Agent Pro">
+    <meta property="og:title" content="${page_title}">
+    <meta property="og:description" content="${meta_description}">
+    <meta property="og:type" content="article">
+    
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/styles/github.min.css">
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/highlight.min.js"></script>
+    
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #fafafa;
+        }
+        
+        .container {
+            background-color: white;
+            padding: 40px;
+            border-radius: 12px;
+            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        }
+        
+        h1 {
+            color: #2c3e50;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 15px;
+            margin-bottom: 30px;
+            font-size: 2.5em;
+        }
+        
+        h2 {
+            color: #34495e;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 10px;
+            margin-top: 40px;
+            margin-bottom: 20px;
+        }
+        
+        h3 {
+            color: #34495e;
+            margin-top: 30px;
+            margin-bottom: 15px;
+        }
+        
+        pre {
+            background-color: #f8f9fa;
+            border: 1px solid #e9ecef;
+            border-radius: 8px;
+            padding: 20px;
+            overflow-x: auto;
+            margin: 20px 0;
+        }
+        
+        code {
+            background-color: #f8f9fa;
+            padding: 3px 6px;
+            border-radius: 4px;
+            font-family: 'SFMono-Regular', 'Monaco', 'Inconsolata', 'Liberation Mono', 'Courier New', monospace;
+            font-size: 0.9em;
+        }
+        
+        pre code {
+            background-color: transparent;
+            padding: 0;
+        }
+        
+        blockquote {
+            border-left: 4px solid #3498db;
+            margin: 0;
+            padding: 0 0 0 20px;
+            font-style: italic;
+            background-color: #f8f9fa;
+            padding: 15px 20px;
+            border-radius: 0 8px 8px 0;
+        }
+        
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 20px 0;
+        }
+        
+        th, td {
+            border: 1px solid #ddd;
+            padding: 12px;
+            text-align: left;
+        }
+        
+        th {
+            background-color: #f2f2f2;
+            font-weight: bold;
+        }
+        
+        .meta {
+            color: #7f8c8d;
+            font-style: italic;
+            border-top: 1px solid #ecf0f1;
+            padding-top: 20px;
+            margin-top: 40px;
+            text-align: center;
+        }
+        
+        .toc {
+            background-color: #f8f9fa;
+            border: 1px solid #e9ecef;
+            border-radius: 8px;
+            padding: 20px;
+            margin: 20px 0;
+        }
+        
+        .toc h3 {
+            margin-top: 0;
+            color: #495057;
+        }
+        
+        .highlight {
+            background-color: #fff3cd;
+            border: 1px solid #ffeaa7;
+            border-radius: 4px;
+            padding: 15px;
+            margin: 20px 0;
+        }
+        
+        a {
+            color: #3498db;
+            text-decoration: none;
+        }
+        
+        a:hover {
+            text-decoration: underline;
+        }
+        
+        img {
+            max-width: 100%;
+            height: auto;
+            border-radius: 8px;
+        }
+        
+        .article-header {
+            text-align: center;
+            margin-bottom: 40px;
+        }
+        
+        .publish-date {
+            color: #7f8c8d;
+            font-size: 0.9em;
+        }
+        
+        .copy-btn {
+            float: right;
+            margin: 5px;
+            padding: 5px 10px;
+            background: #3498db;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+        }
+        
+        @media (max-width: 768px) {
+            body {
+                padding: 10px;
+            }
+            
+            .container {
+                padding: 20px;
+            }
+            
+            h1 {
+                font-size: 2em;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="article-header">
+            <div class="publish-date">Published on ${pub_date_human}</div>
+        </div>
+        
+        ${html_content}
+        
+        <div class="meta">
+            <p><strong>Article Information</strong><br>
+            Published on ${pub_date_full}</p>
+        </div>
+    </div>
+    
+    <script>
+        hljs.highlightAll();
+        
+        // Copy buttons: one styled element per code block, but a single
+        // delegated click listener for the whole page instead of a
+        // listener per block.
+        document.querySelectorAll('pre code').forEach((block) => {
+            block.parentNode.style.position = 'relative';
+            block.parentNode.insertAdjacentHTML('beforeend', '<button class="copy-btn">Copy</button>');
+        });
+        
+        document.body.addEventListener('click', (e) => {
+            if (!e.target.classList.contains('copy-btn')) return;
+            const code = e.target.parentNode.querySelector('code');
+            navigator.clipboard.writeText(code.textContent);
+            e.target.innerText = 'Copied!';
+            setTimeout(() => { e.target.innerText = 'Copy'; }, 2000);
+        });
+    </script>
+</body>
+</html>"""
+
+# Split around the article body so the exporter can stream head, content and
+# tail straight to the file handle instead of concatenating one giant page
+# string (halving peak memory for large articles).
+_head_text, _tail_text = _HTML_PAGE_TEXT.split('${html_content}')
+_HTML_PAGE_HEAD_TEMPLATE = string.Template(_head_text)
+_HTML_PAGE_TAIL_TEMPLATE = string.Template(_tail_text)
+del _head_text, _tail_text
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_text(obj: Any) -> str:
+    """JSON-encode for embedding in text output, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """
+    Returns the first balanced JSON object embedded in text, or None.
+    A single forward scan tracking brace depth and string state - unlike a
+    DOTALL '{.*}' regex, this cannot backtrack catastrophically and stops at
+    the first complete object instead of the last brace in the response.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+# Static building blocks for the content-generation prompt. These never vary
+# between calls, so they are assembled once here instead of inside
+# generate_enhanced_content.
+_SEO_INSTRUCTIONS = """
+        SEO Requirements:
+        - Include an engaging, keyword-rich title at the top (H1).
+        - Use proper header hierarchy (H1, H2, H3, etc.).
+        - Include relevant keywords naturally throughout the text.
+        - Add a meta description-worthy introduction (first paragraph).
+        - Ensure a strong conclusion with key takeaways.
+        """
+
+_TOC_INSTRUCTIONS = """
+        Table of Contents:
+        - Generate a Table of Contents (TOC) at the beginning of the article, linking to main H2 sections.
+        """
+
+_EXAMPLES_INSTRUCTIONS = """
+        Examples and Practicality:
+        - Incorporate practical examples, code snippets (if applicable), or real-world scenarios to illustrate concepts.
+        - Ensure all code blocks are properly formatted with language identifiers (e.g., ```python).
+        """
+
+_CONCLUSION_INSTRUCTIONS = """
+        Conclusion:
+        - Provide a concise summary of key points.
+        - Offer actionable next steps or final thoughts.
+        """
+
+# Per-content-type prompt guidance, keyed for single-lookup dispatch. Types
+# sharing guidance (Tutorial/How-to, the documentation pair) alias one string.
+_HOWTO_INSTRUCTIONS = "Provide clear, step-by-step instructions. Include necessary prerequisites, detailed code examples (if applicable), and practical troubleshooting tips. The content should be highly actionable and easy to follow."
+_DOCUMENTATION_INSTRUCTIONS = "Provide clear, concise, and accurate instructions for using a product or API. Include installation, usage examples, parameter descriptions, and error handling. Organize content logically for easy navigation."
+
+_TYPE_SPECIFIC_INSTRUCTIONS = {
+    "Blog Post": "Make it engaging, conversational, and shareable. Use relatable analogies. Focus on a strong hook and clear takeaways.",
+    "Tutorial": _HOWTO_INSTRUCTIONS,
+    "How-to Guide": _HOWTO_INSTRUCTIONS,
+    "Technical Article": "Dive deep into the technical aspects. Use precise terminology, comprehensive explanations of concepts, and detailed code/configuration examples. Assume a knowledgeable audience.",
+    "Review": "Analyze the product/service comprehensively. Include a clear introduction, detailed pros and cons, target audience analysis, pricing insights (if applicable), and a clear recommendation or rating (e.g., '4.5/5 Stars').",
+    "News Article": "Report on a recent event or development. Follow journalistic principles: who, what, when, where, why, and how. Maintain an objective, informative tone. Include a clear headline and summary.",
+    "Case Study": "Detail a specific problem, the solution implemented, and the measurable results achieved. Focus on data, methodology, and quantifiable outcomes. Structure as: Introduction, Problem, Solution, Results, Conclusion.",
+    "Product Documentation": _DOCUMENTATION_INSTRUCTIONS,
+    "API Documentation": _DOCUMENTATION_INSTRUCTIONS,
+}
+
+# The prompt skeleton is several kilobytes of static text; compile it once
+# so each generation only pays for the substitution.
+_CONTENT_PROMPT_TEMPLATE = string.Template("""
+        Create a comprehensive and engaging ${content_type_lower} about "${topic}".
+        
+        Content Specifications:
+        - Content Type: ${content_type}
+        - Topic: ${topic}
+        - Writing Style: ${writing_style}
+        - Target Audience: ${target_audience}
+        - Word Count Target: Approximately ${word_count} words
+        
+        Special Requirements from User:
+        ${description}
+        
+        Additional Instructions from User:
+        ${additional_requirements}
+        
+        ---
+        Formatting and Structural Guidelines:
+        ${seo_instructions}
+        ${toc_instructions}
+        ${examples_instructions}
+        ${conclusion_instructions}
+        
+        Type-Specific Guidance:
+        ${type_specific_instructions}
+        
+        General Structure Requirements:
+        1. **Title**: Create an engaging, descriptive title (use # for H1)
+        2. **Introduction**: Hook the reader and outline what they'll learn (first paragraph).
+        3. **Main Content**: Use proper heading hierarchy (##, ###) for sections.
+        4. **Code Examples**: Use proper markdown code blocks with language specification (e.g., ```python).
+        5. **Lists**: Use bullet points or numbered lists where appropriate.
+        6. **Tables**: Create tables when comparing data or features (if relevant).
+        7. **Quotes/Callouts**: Use > for important quotes or callouts.
+        8. **Links**: Include relevant links (use placeholder URLs like https://example.com).
+        
+        Content Quality Standards:
+        - Make it informative and actionable.
+        - Ensure accuracy and up-to-date information.
+        - Make it engaging and easy to read.
+        - Include troubleshooting tips where relevant (especially for tutorials).
+        - Add best practices and common pitfalls to avoid.
+        
+        Please create content that is publication-ready and professionally formatted in Markdown.
+        """)
+
+# SEO-metadata prompt, compiled once like the content prompt above. Template
+# placeholders also leave the example JSON braces literal.
+_SEO_PROMPT_TEMPLATE = string.Template("""
+        Based on this content about "${topic}", generate SEO metadata.
+
+        Content Preview: ${content_preview}...
+
+        Please provide SEO-optimized metadata in this exact JSON format.
+        Make sure the content adheres to length constraints and is highly relevant.
+        {
+            "title": "SEO-optimized title (50-60 characters, avoid truncation)",
+            "description": "Compelling meta description (150-160 characters, summarize key points, entice clicks)",
+            "keywords": ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"],
+            "slug": "url-friendly-slug-with-hyphens"
+        }
+
+        Guidelines:
+        - **Title**: Include main keywords, be descriptive, engaging, and fit within 50-60 characters.
+        - **Description**: Summarize the article, use strong verbs, include relevant keywords, and be between 150-160 characters.
+        - **Keywords**: 3-5 relevant, high-impact keywords.
+        - **Slug**: Lowercase, use hyphens instead of spaces, avoid special characters, be concise.
+        """)
+
+# Project-generation prompt skeleton, compiled once like the content and
+# SEO prompts above. The optional numbered requirements are module
+# constants gated by the include_* flags.
+_PROJECT_TESTS_INSTRUCTIONS = "\n5. Include unit tests for key functionalities (e.g., using unittest or pytest)."
+_PROJECT_DOCKER_INSTRUCTIONS = "\n6. Provide a Dockerfile and docker-compose.yml for containerization."
+_PROJECT_CI_CD_INSTRUCTIONS = "\n7. Add a basic CI/CD configuration (e.g., GitHub Actions workflow)."
+_PROJECT_DOCS_INSTRUCTIONS = "\n8. Ensure inline comments and docstrings are comprehensive. Create a separate `docs/` folder for additional documentation if needed."
+_PROJECT_EXAMPLES_INSTRUCTIONS = "\n9. Include example usage or test files (e.g., `example.py`)."
+
+_PROJECT_PROMPT_TEMPLATE = string.Template("""
+        Create a complete ${project_type_lower} called "${project_name}".
+        
+        Project Specifications:
+        - Project Name: ${project_name}
+        - Project Type: ${project_type}
+        - Target Audience: ${target_audience}
+        - Complexity Level: ${project_complexity}
+        - Description: ${description}
+        - Additional Requirements: ${additional_requirements}
+        
+        Please create a complete project structure with multiple files. Format your response as follows:
+        
+        FILE: filename.ext
+        ```language
+        [file content here]
+        ```
+        
+        FILE: another_file.ext
+        ```language
+        [file content here]
+        ```
+        
+        Requirements:
+        1. Create a main Python file with complete, working code.
+        2. Include `requirements.txt` with all necessary dependencies.
+        3. Create a comprehensive `README.md` with setup instructions, usage, and project overview.
+        4. Add a `.gitignore` file for Python projects.
+        ${test_instructions}
+        ${docker_instructions}
+        ${ci_cd_instructions}
+        ${docs_instructions}
+        ${examples_instructions}
+        10. Add configuration files if needed (e.g., `config.py`, `.env.example`).
+        
+        Make sure all code is:
+        - Production-ready and well-commented.
+        - Follows best practices for the chosen language/framework.
+        - Includes proper error handling.
+        - Has clear documentation.
+        - Is ready to run after setup.
+        
+        Focus on creating a ${project_type_lower} that is practical and useful.
+        """)
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_pooled_session() -> requests.Session:
+    """One process-wide requests.Session with keep-alive, a sized connection
+    pool and automatic capped retries for transient failures.
+
+    Reusing one session amortizes TCP+TLS handshakes across the many small
+    REST calls this app makes instead of reconnecting on every request, and
+    the retry policy absorbs flaky 429/5xx responses (honoring Retry-After)
+    instead of surfacing the first transient error to the user. The pools
+    are user-agnostic - credentials travel in per-request headers - while
+    the agent object itself stays in per-user session state because it
+    carries WordPress credentials.
+    """
+    session = requests.Session()
+    # Safe-method retries everywhere. POSTs are deliberately excluded for
+    # WordPress: retrying an ambiguous post-create failure could publish
+    # duplicates.
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Explicit, although urllib3 normally asks for this on its own: compressed
+    # JSON responses are ~10x smaller for term lists and Gemini output.
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+    # Gemini generation POSTs are side-effect free, so they do get retried.
+    gemini_retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        allowed_methods=frozenset({'GET', 'HEAD', 'POST'}),
+    )
+    session.mount(
+        'https://generativelanguage.googleapis.com/',
+        HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=gemini_retries)
+    )
+    return session
+
+
+class AdvancedPublisher:
+    """Advanced publishing module for automated content deployment, focused on WordPress."""
+
+    # Term lists change rarely; cache fetches for this long (seconds).
+    TERMS_CACHE_TTL = 300
+
+    def __init__(self):
+        self.wordpress_config = {}
+        self.session = _shared_pooled_session()
+        # Pre-built in setup_wordpress so hot paths never copy header dicts.
+        self._headers_json_accept: Dict[str, str] = {}
+        # Maps (site_url, term_type) -> (monotonic timestamp, terms list)
+        self._terms_cache: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+        # Maps term_type -> (terms list identity, {lowered name: id}) so the
+        # publish path never re-lowercases an unchanged term list.
+        self._name_index_cache: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, int]]] = {}
+
+    def _get_cached_terms(self, term_type: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached term list if it is still fresh, else None."""
+        key = (self.wordpress_config.get('site_url', ''), term_type)
+        entry = self._terms_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.TERMS_CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _store_terms_in_cache(self, term_type: str, terms: List[Dict[str, Any]]):
+        """Cache a successfully fetched term list; failures are not cached."""
+        if terms:
+            key = (self.wordpress_config.get('site_url', ''), term_type)
+            self._terms_cache[key] = (time.monotonic(), terms)
+
+    def invalidate_terms_cache(self):
+        """Drop cached term lists so the next fetch hits the REST API again."""
+        self._terms_cache.clear()
+        self._name_index_cache.clear()
+
+    def _term_name_index(self, term_type: str, terms: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Returns a {lowered name: id} index for terms, rebuilt only when the
+        list itself changes (the session reuses one list across publishes)."""
+        cached = self._name_index_cache.get(term_type)
+        if cached is not None and cached[0] is terms:
+            return cached[1]
+        index = {term['name'].strip().lower(): term['id'] for term in terms}
+        self._name_index_cache[term_type] = (terms, index)
+        return index
+
+    def setup_wordpress(self, site_url: str, username: str, password: str):
+        """Setup WordPress REST API connection."""
+        is_wpcom = 'wordpress.com' in site_url.lower()
+        
+        if is_wpcom:
+            site_domain = site_url.replace('https://', '').replace('http://', '').rstrip('/')
+            self.wordpress_config = {
+                'site_url': site_url.rstrip('/'),
+                'site_domain': site_domain,
+                'username': username,
+                'password': password,  # For WordPress.com, this is an access token
+                'is_wpcom': True,
+                'api_base': f'https://public-api.wordpress.com/rest/v1.1/sites/{site_domain}',
+                'headers': {
+                    'Content-Type': 'application/json', # Default content type
+                    'Authorization': f'Bearer {password}'
+                }
+            }
+        else:
+            self.wordpress_config = {
+                'site_url': site_url.rstrip('/'),
+                'username': username,
+                'password': password,
+                'is_wpcom': False,
+                # Loaded from the on-disk cache when a previous run already
+                # detected this site's format; otherwise detected on connect.
+                'use_query_params': self._load_cached_permalink_format(site_url),
+                'headers': {
+                    'Content-Type': 'application/json', # Default content type
+                    'Authorization': f'Basic {base64.b64encode(f"{username}:{password}".encode()).decode()}'
+                }
+            }
+
+        # The Authorization value is computed once above; build the JSON-accepting
+        # variant here too instead of copying and mutating it on every call.
+        self._headers_json_accept = {**self.wordpress_config['headers'], 'Accept': 'application/json'}
+
+    @staticmethod
+    def _load_cached_permalink_format(site_url: str) -> Optional[bool]:
+        """Returns the previously detected use_query_params for this site, if any."""
+        try:
+            with open(_WP_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            value = cache.get(site_url.rstrip('/'), {}).get('use_query_params')
+            return value if isinstance(value, bool) else None
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _save_cached_permalink_format(site_url: str, use_query_params: bool):
+        """Persists the detected permalink format so later runs skip re-detection."""
+        try:
+            try:
+                with open(_WP_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                cache = {}
+            cache[site_url.rstrip('/')] = {'use_query_params': use_query_params}
+            with open(_WP_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass  # The cache is best-effort; detection simply runs again next time.
+
+    def _get_api_url(self, endpoint: str) -> str:
+        """Constructs the correct API URL based on permalink settings (for self-hosted WordPress)."""
+        if not self.wordpress_config:
+            raise ValueError("WordPress configuration not set.")
+            
+        if self.wordpress_config.get('is_wpcom'):
+            # WordPress.com uses a fixed base + endpoint
+            return f"{self.wordpress_config['api_base']}{endpoint}"
+        else:
+            # Self-hosted WordPress uses detected permalink structure
+            site_url = self.wordpress_config['site_url']
+            # Default to pretty permalinks if use_query_params is not explicitly True
+            if self.wordpress_config.get('use_query_params', False): # This will be True if detected, otherwise False (default)
+                return f"{site_url}/?rest_route={endpoint}"
+            else:
+                return f"{site_url}/wp-json{endpoint}"
+            
+    def test_wordpress_connection(self) -> Dict[str, Any]:
+        """Test WordPress connection with fallback for sites without pretty permalinks."""
+        if not self.wordpress_config:
+            return {'success': False, 'error': 'WordPress not configured'}
+        
+        try:
+            if self.wordpress_config.get('is_wpcom'):
+                response = self.session.get(
+                    self._get_api_url("/"),
+                    headers=self.wordpress_config['headers'],
+                    timeout=10
+                )
+                
+                if response.status_code == 200:
+                    site_data = response.json()
+                    return {
+                        'success': True, 
+                        'message': f"Connected to WordPress.com site: {site_data.get('name', 'Unknown')}"
+                    }
+                elif response.status_code == 403:
+                    return {
+                        'success': False, 
+                        'error': 'WordPress.com site is private or in Coming Soon mode. Please make your site public first.'
+                    }
+                else:
+                    return {
+                        'success': False, 
+                        'error': f"WordPress.com API error: {response.status_code} - {response.text}"
+                    }
+            else:
+                headers_to_use = self._headers_json_accept
+                
+                # Try the cached format if a previous run detected one,
+                # otherwise pretty permalinks first.
+                probe_used_query_params = bool(self.wordpress_config.get('use_query_params'))
+                pretty_url = self._get_api_url("/wp/v2/users/me")
+                response = self.session.get(pretty_url, headers=headers_to_use, timeout=10)
+                
+                if response.status_code == 404:
+                    # Fallback to query parameter format
+                    fallback_url = self.wordpress_config['site_url'] + "/?rest_route=/wp/v2/users/me"
+                    response = self.session.get(fallback_url, headers=headers_to_use, timeout=10)
+                    
+                    if response.status_code == 200:
+                        user_data = response.json()
+                        self.wordpress_config['use_query_params'] = True # Set it if this worked
+                        self._save_cached_permalink_format(self.wordpress_config['site_url'], True)
+                        return {
+                            'success': True, 
+                            'message': f"Connected as {user_data.get('name', 'Unknown')} (using query parameter format)"
+                        }
+                    elif response.status_code == 401:
+                         return {
+                            'success': False,
+                            'error': 'Authentication failed. Please check your username and application password.'
+                        }
+                elif response.status_code == 200:
+                    user_data = response.json()
+                    self.wordpress_config['use_query_params'] = probe_used_query_params
+                    self._save_cached_permalink_format(self.wordpress_config['site_url'], probe_used_query_params)
+                    return {
+                        'success': True,
+                        'message': f"Connected as {user_data.get('name', 'Unknown')}"
+                    }
+                elif response.status_code == 401:
+                    return {
+                        'success': False,
+                        'error': 'Authentication failed. Please check your username and application password.'
+                    }
+                
+                return {
+                    'success': False, 
+                    'error': f"WordPress API error: {response.status_code} - {response.text}. Check if REST API is enabled and credentials are correct."
+                }
+                    
+        except requests.exceptions.Timeout:
+            return {'success': False, 'error': 'Connection timed out. Please check the URL and your network connection.'}
+        except requests.exceptions.RequestException as e:
+            return {'success': False, 'error': f"Network error or invalid URL: {str(e)}"}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+            
+    def _get_terms_robust(self, term_type: str) -> List[Dict[str, Any]]:
+        """
+        Fetches terms (categories/tags) for WordPress.
+        Returns a list of {'id': int, 'name': str} dictionaries.
+        """
+        if self.wordpress_config.get('is_wpcom'):
+            # For WP.com, fetching terms requires specific endpoints and might vary.
+            # We explicitly decided not to fully support fetching terms list for WP.com
+            # due to API complexities in this focused version.
+            st.warning(f"Fetching {term_type} list is not fully supported for WordPress.com via this API configuration.")
+            return []
+
+        cached = self._get_cached_terms(term_type)
+        if cached is not None:
+            return cached
+
+        terms_list = []
+        headers_to_use = self._headers_json_accept
+
+        endpoint = f"/wp/v2/{term_type}" # e.g., /wp/v2/categories or /wp/v2/tags
+        api_url = self._get_api_url(endpoint) # This call will now use the correct /?rest_route= format if detected
+
+        try:
+            # WP returns only 10 terms per page by default; ask for the maximum
+            # and fan out any remaining pages concurrently.
+            response = self.session.get(api_url, headers=headers_to_use,
+                                        params={'per_page': 100, 'page': 1}, timeout=10)
+
+            if response.status_code == 200:
+                terms_list = [{'id': term['id'], 'name': term['name']} for term in response.json()]
+
+                try:
+                    total_pages = int(response.headers.get('X-WP-TotalPages', 1))
+                except (TypeError, ValueError):
+                    total_pages = 1
+                if total_pages > 1:
+                    def fetch_page(page: int) -> List[Dict[str, Any]]:
+                        page_response = self.session.get(
+                            api_url, headers=headers_to_use,
+                            params={'per_page': 100, 'page': page}, timeout=10
+                        )
+                        page_response.raise_for_status()
+                        return page_response.json()
+
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        for page_terms in executor.map(fetch_page, range(2, total_pages + 1)):
+                            terms_list.extend({'id': term['id'], 'name': term['name']} for term in page_terms)
+            else:
+                st.error(f"Failed to fetch {term_type} from {api_url}: {response.status_code} - {response.text}")
+                return []
+
+        except requests.exceptions.Timeout:
+            st.error(f"Timed out fetching {term_type}. Check network or site responsiveness.")
+            return []
+        except requests.exceptions.RequestException as e:
+            st.error(f"Network error fetching {term_type}: {e}")
+            return []
+        except json.JSONDecodeError:
+            st.error(f"Failed to decode JSON from {term_type} response: {response.text}")
+            return []
+        except Exception as e:
+            st.error(f"Error processing {term_type} data: {e}")
+
+        self._store_terms_in_cache(term_type, terms_list)
+        return terms_list
+
+    async def _get_terms_robust_async(self, client: httpx.AsyncClient, term_type: str) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of _get_terms_robust, sharing one httpx client
+        so several term requests can be in flight at the same time.
+        Returns a list of {'id': int, 'name': str} dictionaries.
+        """
+        if self.wordpress_config.get('is_wpcom'):
+            st.warning(f"Fetching {term_type} list is not fully supported for WordPress.com via this API configuration.")
+            return []
+
+        cached = self._get_cached_terms(term_type)
+        if cached is not None:
+            return cached
+
+        headers_to_use = self._headers_json_accept
+
+        api_url = self._get_api_url(f"/wp/v2/{term_type}")
+
+        try:
+            response = await client.get(api_url, headers=headers_to_use,
+                                        params={'per_page': 100, 'page': 1})
+
+            if response.status_code == 200:
+                terms_list = [{'id': term['id'], 'name': term['name']} for term in response.json()]
+
+                try:
+                    total_pages = int(response.headers.get('X-WP-TotalPages', 1))
+                except (TypeError, ValueError):
+                    total_pages = 1
+                if total_pages > 1:
+                    page_responses = await asyncio.gather(*[
+                        client.get(api_url, headers=headers_to_use,
+                                   params={'per_page': 100, 'page': page})
+                        for page in range(2, total_pages + 1)
+                    ])
+                    for page_response in page_responses:
+                        page_response.raise_for_status()
+                        terms_list.extend({'id': term['id'], 'name': term['name']} for term in page_response.json())
+
+                self._store_terms_in_cache(term_type, terms_list)
+                return terms_list
+
+            st.error(f"Failed to fetch {term_type} from {api_url}: {response.status_code} - {response.text}")
+            return []
+
+        except httpx.TimeoutException:
+            st.error(f"Timed out fetching {term_type}. Check network or site responsiveness.")
+            return []
+        except httpx.HTTPError as e:
+            st.error(f"Network error fetching {term_type}: {e}")
+            return []
+        except Exception as e:
+            st.error(f"Error processing {term_type} data: {e}")
+            return []
+
+    async def fetch_categories_async(self) -> List[Dict[str, Any]]:
+        """Async version of fetch_categories."""
+        async with httpx.AsyncClient(timeout=10) as client:
+            return await self._get_terms_robust_async(client, 'categories')
+
+    async def fetch_tags_async(self) -> List[Dict[str, Any]]:
+        """Async version of fetch_tags."""
+        async with httpx.AsyncClient(timeout=10) as client:
+            return await self._get_terms_robust_async(client, 'tags')
+
+    async def fetch_terms_async(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetches categories and tags concurrently over a shared connection,
+        overlapping the two round-trips instead of serializing them.
+        A fresh client is opened per call because its connection pool is
+        bound to the event loop that asyncio.run() creates.
+        """
+        async with httpx.AsyncClient(timeout=10) as client:
+            categories, tags = await asyncio.gather(
+                self._get_terms_robust_async(client, 'categories'),
+                self._get_terms_robust_async(client, 'tags')
+            )
+            return categories, tags
+
+    def fetch_categories(self) -> List[Dict[str, Any]]:
+        """Fetches all existing categories from WordPress."""
+        return self._get_terms_robust('categories')
+
+    def fetch_tags(self) -> List[Dict[str, Any]]:
+        """Fetches all existing tags from WordPress."""
+        return self._get_terms_robust('tags')
+
+    def upload_image_to_wordpress(self, image_data: Union[bytes, BinaryIO], filename: str, mime_type: str) -> Dict[str, Any]:
+        """
+        Uploads an image to the WordPress media library.
+        Accepts raw bytes or a seekable binary stream; streams are sent in
+        chunks so large images never need a second in-memory copy.
+        """
+        if not self.wordpress_config:
+            return {'success': False, 'error': 'WordPress not configured'}
+
+        if self.wordpress_config.get('is_wpcom'):
+            # WordPress.com media upload is to /sites/{siteID}/media/new
+            # This endpoint typically expects multipart/form-data with a file field.
+            # The structure for WP.com media upload can be more complex than self-hosted.
+            st.warning("WordPress.com image upload is more complex and not fully implemented for direct file upload in this version.")
+            return {'success': False, 'error': 'WordPress.com image upload not fully supported in this version. Try self-hosted WP.'}
+
+        try:
+            media_api_url = self._get_api_url("/wp/v2/media")
+            
+            # Media uploads are the one case where Content-Type must differ
+            # (raw binary body), so build the small per-call dict in one literal.
+            headers_to_use = {
+                **self.wordpress_config['headers'],
+                'Content-Type': mime_type,
+                'Content-Disposition': f'attachment; filename="{filename}"',
+            }
+
+            if isinstance(image_data, (bytes, bytearray)):
+                image_stream = io.BytesIO(image_data)
+                content_length = len(image_data)
+            else:
+                image_stream = image_data
+                image_stream.seek(0, io.SEEK_END)
+                content_length = image_stream.tell()
+                image_stream.seek(0)
+            headers_to_use['Content-Length'] = str(content_length)
+
+            response = self.session.post(
+                media_api_url,
+                headers=headers_to_use,
+                data=image_stream,
+                timeout=30
+            )
+
+            if response.status_code == 201:
+                media_info = response.json()
+                return {
+                    'success': True,
+                    'media_id': media_info['id'],
+                    'media_url': media_info['source_url'],
+                    'message': f"Image '{filename}' uploaded successfully to media library."
+                }
+            else:
+                return {
+                    'success': False,
+                    'error': f"Image upload failed: {response.status_code} - {response.text}"
+                }
+
+        except requests.exceptions.Timeout:
+            return {'success': False, 'error': 'Image upload timed out. The WordPress site might be slow or unreachable.'}
+        except requests.exceptions.RequestException as e:
+            return {'success': False, 'error': f"Network error during image upload: {str(e)}"}
+        except Exception as e:
+            return {'success': False, 'error': f"Unexpected error during image upload: {str(e)}"}
+            
+    def publish_to_wordpress(self, title: str, content: str, status: str = 'draft', 
+                           categories: List[str] = None, tags: List[str] = None, 
+                           featured_image_id: Optional[int] = None) -> Dict[str, Any]:
+        """Publish content to WordPress using REST API with permalink format detection and term ID handling."""
+        if not self.wordpress_config:
+            return {'success': False, 'error': 'WordPress not configured'}
+        
+        html_content = _markdown_to_html(content, 'post')
+        
+        try:
+            post_data = {
+                'title': title,
+                'content': html_content,
+                'status': status,
+                'format': 'standard'
+            }
+
+            if featured_image_id:
+                post_data['featured_media'] = featured_image_id
+            
+            if self.wordpress_config.get('is_wpcom'):
+                if tags:
+                    post_data['tags'] = ','.join(tags) 
+                # Categories for WP.com still a bit tricky if not using direct IDs.
+                # For now, will not attempt to set categories for WP.com via this method.
+                if categories:
+                    st.warning("Categories not directly supported for WordPress.com via this API version's post creation. Post will be uncategorized or default.")
+
+                response = self.session.post(
+                    self._get_api_url("/posts/new"),
+                    json=post_data,
+                    headers=self.wordpress_config['headers'],
+                    timeout=30
+                )
+                
+                if response.status_code == 200:
+                    post_info = response.json()
+                    return {
+                        'success': True,
+                        'post_id': post_info['ID'],
+                        'url': post_info['URL'],
+                        'edit_url': f"{self.wordpress_config['site_url']}/wp-admin/post.php?post={post_info['ID']}&action=edit",
+                        'message': f'Post published successfully to WordPress.com (Status: {status})'
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'error': f"WordPress.com API error: {response.status_code} - {response.text}"
+                    }
+                    
+            else:
+                # Self-hosted WordPress
+                # Retrieve category and tag IDs based on names provided by the user
+                if categories:
+                    # st.session_state.wp_all_categories stores {'id': X, 'name': Y}
+                    # We need to map user-selected names to their IDs
+                    # Warmed concurrently at connection-test time; fall back to a
+                    # (cached) fetch here so a cold session still resolves names.
+                    all_existing_categories = st.session_state.get('wp_all_categories') or self.fetch_categories()
+                    category_index = self._term_name_index('categories', all_existing_categories)
+                    selected_category_ids = [
+                        category_index[name.strip().lower()] for name in categories
+                        if name.strip().lower() in category_index
+                    ]
+                    if selected_category_ids:
+                        post_data['categories'] = selected_category_ids
+                    else:
+                        st.warning(f"None of the specified categories ({', '.join(categories)}) were found or selected. Post will be uncategorized or default.")
+                    
+                if tags:
+                    # Similar mapping for tags
+                    all_existing_tags = st.session_state.get('wp_all_tags') or self.fetch_tags()
+                    tag_index = self._term_name_index('tags', all_existing_tags)
+                    selected_tag_ids = [
+                        tag_index[name.strip().lower()] for name in tags
+                        if name.strip().lower() in tag_index
+                    ]
+                    if selected_tag_ids:
+                        post_data['tags'] = selected_tag_ids
+                    else:
+                        st.warning(f"None of the specified tags ({', '.join(tags)}) were found or selected. Post will be published without specified tags.")
+                
+                api_url = self._get_api_url("/wp/v2/posts")
+                
+                response = self.session.post(
+                    api_url,
+                    json=post_data,
+                    headers=self.wordpress_config['headers'],
+                    timeout=30
+                )
+                
+                if response.status_code == 201:
+                    post_info = response.json()
+                    return {
+                        'success': True,
+                        'post_id': post_info['id'],
+                        'url': post_info['link'],
+                        'edit_url': f"{self.wordpress_config['site_url']}/wp-admin/post.php?post={post_info['id']}&action=edit",
+                        'message': f'Post published successfully to WordPress (Status: {status})'
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'error': f"WordPress API error: {response.status_code} - {response.text}"
+                    }
+                    
+        except requests.exceptions.Timeout:
+            return {
+                'success': False,
+                'error': 'WordPress publishing timed out. The WordPress site might be slow or unreachable.'
+            }
+        except requests.exceptions.RequestException as e:
+            return {
+                'success': False,
+                'error': f"Network error during WordPress publishing: {str(e)}"
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"WordPress publishing error: {str(e)}"
+            }
+
+
+    def publish_with_featured_image(self, title: str, content: str, status: str = 'draft',
+                                    categories: List[str] = None, tags: List[str] = None,
+                                    image_data: Union[bytes, BinaryIO, None] = None,
+                                    image_filename: Optional[str] = None,
+                                    image_mime_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Uploads the featured image (when given) and creates the post as one
+        back-to-back sequence over the shared keep-alive connection, so the
+        publish flow pays a single pipelined round-trip pair instead of two
+        UI-separated requests.
+
+        WordPress's /batch/v1 framework cannot express this pair - batched
+        requests cannot reference each other's results, and the post needs
+        the media ID the upload returns - and it rejects GETs, so the term
+        fetches cannot batch either (they are already fetched concurrently
+        and TTL-cached).
+
+        The returned dict is publish_to_wordpress's result with an extra
+        'image_upload' key carrying the upload outcome (or None).
+        """
+        featured_image_id = None
+        upload_result = None
+        if image_data is not None:
+            upload_result = self.upload_image_to_wordpress(image_data, image_filename, image_mime_type)
+            if upload_result['success']:
+                featured_image_id = upload_result['media_id']
+
+        result = self.publish_to_wordpress(
+            title, content, status=status,
+            categories=categories, tags=tags,
+            featured_image_id=featured_image_id
+        )
+        result['image_upload'] = upload_result
+        return result
+
+
+class CompleteAIContentAgent:
+    # Widget option lists; class-level so they are allocated once per process
+    # rather than per agent (and read-only by convention).
+    article_content_types = [
+        "Blog Post",
+        "Technical Article",
+        "Tutorial",
+        "News Article",
+        "Review",
+        "Opinion Piece",
+        "How-to Guide",
+        "Case Study",
+        "Product Documentation",
+        "API Documentation",
+        "White Paper",
+        "Research Paper",
+        "Marketing Copy",
+    ]
+
+    project_content_types = [
+        "Python Project", "Web Application", "API Project", "Data Science Project",
+        "Machine Learning Project", "Discord Bot", "Automation Script",
+        "CLI Tool", "Game Project"
+    ]
+
+    writing_styles = [
+        "Professional", "Casual", "Technical", "Conversational", "Academic",
+        "Creative", "Formal", "Friendly", "Authoritative"
+    ]
+
+    target_audiences = [
+        "Beginners", "Intermediate", "Advanced", "General Public", "Developers",
+        "Business Professionals", "Students", "Researchers", "Decision Makers"
+    ]
+
+    word_counts = [
+        "500-800", "800-1200", "1200-2000", "2000-3000", "3000-5000", "5000+"
+    ]
+
+    def __init__(self):
+        self.publisher = AdvancedPublisher()
+        self.session = _shared_pooled_session()
+        # In-memory layer of the Gemini response cache; see _GEMINI_CACHE_FILE.
+        self._gemini_response_cache: Dict[str, str] = {}
+        # Last key that passed validation, so re-submitting it skips the probe.
+        self._gemini_validated_key: Optional[str] = None
+        
+    def setup_gemini(self, api_key: str) -> bool:
+        """Setup Gemini AI API."""
+        if api_key and api_key == self._gemini_validated_key:
+            # Unchanged key already validated this session; skip the probe.
+            return True
+        try:
+            self.gemini_api_key = api_key
+            # Listing models validates the key in one cheap round-trip with
+            # no token spend, unlike the old "Hello" generateContent probe.
+            response = self.session.get(
+                f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}",
+                timeout=5
+            )
+            if response.status_code == 200:
+                self._gemini_validated_key = api_key
+                return True
+
+            if response.status_code == 403:
+                # Some keys are scoped so that listing is forbidden while
+                # generation still works; fall back to a direct
+                # generateContent probe. Deliberately not call_gemini_api:
+                # the response cache is keyed by prompt alone, and a cached
+                # "Hello" reply must never validate a different (possibly
+                # revoked) key.
+                probe_url, probe_body, probe_headers = self._build_gemini_request("Hello", api_key)
+                probe = self.session.post(probe_url, headers=probe_headers, data=probe_body, timeout=15)
+                if probe.status_code == 200:
+                    self._gemini_validated_key = api_key
+                    return True
+                st.error(f"Gemini AI test failed: {probe.status_code} - {probe.text}")
+                return False
+
+            st.error(f"Gemini AI key validation failed: {response.status_code} - {response.text}")
+            return False
+        except Exception as e:
+            st.error(f"Error initializing Gemini AI: {str(e)}")
+            return False
+    
+    # Upper bound on in-flight Gemini requests when fanning out a batch,
+    # keeping well under the API's per-minute rate limits.
+    GEMINI_MAX_CONCURRENCY = 5
+
+    # Request bodies above this size get gzip-compressed before upload;
+    # smaller ones are not worth the CPU.
+    GEMINI_GZIP_THRESHOLD = 4096
+
+    @classmethod
+    def _build_gemini_request(cls, prompt: str, api_key: str,
+                              compress: bool = True) -> Tuple[str, bytes, Dict[str, str]]:
+        """Builds the (url, body, headers) triple for a generateContent call,
+        gzip-compressing large article prompts to cut uplink bytes."""
+        payload = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        api_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
+        body = _json_dumps(payload)
+        headers = {'Content-Type': 'application/json'}
+        if compress and len(body) > cls.GEMINI_GZIP_THRESHOLD:
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        return api_url, body, headers
+
+    @staticmethod
+    def _extract_gemini_text(result: Dict[str, Any]) -> str:
+        """Pulls the generated text out of a generateContent response."""
+        if (result.get("candidates") and len(result["candidates"]) > 0 and
+            result["candidates"][0].get("content") and
+            result["candidates"][0]["content"].get("parts") and
+            len(result["candidates"][0]["content"]["parts"]) > 0):
+            return result["candidates"][0]["content"]["parts"][0]["text"]
+        return f"Error: No content generated. API Response: {json.dumps(result, indent=2)}"
+
+    @staticmethod
+    def _gemini_cache_key(prompt: str) -> str:
+        """Stable cache key for a generation request."""
+        return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _lookup_cached_generation(self, cache_key: str) -> Optional[str]:
+        """Checks the in-memory then the on-disk response cache."""
+        cached = self._gemini_response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            with shelve.open(str(_GEMINI_CACHE_FILE)) as db:
+                if cache_key in db:
+                    text = db[cache_key]
+                    self._gemini_response_cache[cache_key] = text
+                    return text
+        except Exception:
+            pass  # Disk cache is best-effort.
+        return None
+
+    def _store_cached_generation(self, cache_key: str, text: str):
+        """Records a successful generation in both cache layers."""
+        self._gemini_response_cache[cache_key] = text
+        try:
+            _GEMINI_CACHE_FILE.parent.mkdir(exist_ok=True)
+            with shelve.open(str(_GEMINI_CACHE_FILE)) as db:
+                db[cache_key] = text
+        except Exception:
+            pass
+
+    def call_gemini_api(self, prompt: str, api_key: str) -> str:
+        """Call Gemini API using REST API. Identical prompts are served from
+        the response cache instead of paying the multi-second round-trip
+        again (Streamlit reruns make repeats common)."""
+        cache_key = self._gemini_cache_key(prompt)
+        cached = self._lookup_cached_generation(cache_key)
+        if cached is not None:
+            return cached
+
+        api_url, body, headers = self._build_gemini_request(prompt, api_key)
+
+        try:
+            response = self.session.post(api_url, headers=headers, data=body)
+            if response.status_code in (400, 415) and 'Content-Encoding' in headers:
+                # Deployment rejected the compressed body; retry plain once.
+                api_url, body, headers = self._build_gemini_request(prompt, api_key, compress=False)
+                response = self.session.post(api_url, headers=headers, data=body)
+            response.raise_for_status()
+            text = self._extract_gemini_text(_json_loads(response.content))
+            if not text.startswith("Error:"):
+                self._store_cached_generation(cache_key, text)
+            return text
+
+        except requests.exceptions.RequestException as e:
+            return f"Error making API request: {e}"
+        except json.JSONDecodeError:
+            return f"Error decoding JSON response: {response.text}"
+        except Exception as e:
+            return f"An unexpected error occurred: {e}"
+
+    def call_gemini_api_stream(self, prompt: str, api_key: str):
+        """Yields generated text chunks as they arrive from the SSE streaming
+        endpoint. Successful generations land in the same response cache as
+        the blocking path (and cache hits replay as a single chunk)."""
+        cache_key = self._gemini_cache_key(prompt)
+        cached = self._lookup_cached_generation(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        api_url, body, headers = self._build_gemini_request(prompt, api_key)
+        api_url = api_url.replace(':generateContent?', ':streamGenerateContent?alt=sse&')
+        collected = []
+        try:
+            response = self.session.post(api_url, headers=headers, data=body, stream=True)
+            if response.status_code in (400, 415) and 'Content-Encoding' in headers:
+                # Deployment rejected the compressed body; retry plain once.
+                # The streamed response is replaced without being consumed,
+                # so close it or its pooled connection stays stranded.
+                response.close()
+                api_url, body, headers = self._build_gemini_request(prompt, api_key, compress=False)
+                api_url = api_url.replace(':generateContent?', ':streamGenerateContent?alt=sse&')
+                response = self.session.post(api_url, headers=headers, data=body, stream=True)
+            with response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line or not line.startswith(b'data: '):
+                        continue
+                    payload = line[len(b'data: '):]
+                    if payload == b'[DONE]':
+                        break
+                    candidates = _json_loads(payload).get('candidates') or []
+                    if not candidates:
+                        continue  # keep-alive / safety-only chunk
+                    for part in candidates[0].get('content', {}).get('parts') or []:
+                        text = part.get('text')
+                        if text:
+                            collected.append(text)
+                            yield text
+            if collected:
+                self._store_cached_generation(cache_key, ''.join(collected))
+        except requests.exceptions.RequestException as e:
+            if not collected:
+                yield f"Error making API request: {e}"
+            else:
+                yield f"\n\n*(stream interrupted: {e})*"
+        except Exception as e:
+            if not collected:
+                yield f"An unexpected error occurred: {e}"
+
+    async def _call_gemini_api_async(self, client: httpx.AsyncClient,
+                                     semaphore: asyncio.Semaphore,
+                                     prompt: str, api_key: str) -> str:
+        """Async counterpart of call_gemini_api, bounded by the shared semaphore."""
+        cache_key = self._gemini_cache_key(prompt)
+        cached = self._lookup_cached_generation(cache_key)
+        if cached is not None:
+            return cached
+
+        api_url, body, headers = self._build_gemini_request(prompt, api_key)
+
+        try:
+            async with semaphore:
+                response = await client.post(api_url, headers=headers, content=body)
+                if response.status_code in (400, 415) and 'Content-Encoding' in headers:
+                    # Deployment rejected the compressed body; retry plain once.
+                    api_url, body, headers = self._build_gemini_request(prompt, api_key, compress=False)
+                    response = await client.post(api_url, headers=headers, content=body)
+            response.raise_for_status()
+            text = self._extract_gemini_text(_json_loads(response.content))
+            if not text.startswith("Error:"):
+                self._store_cached_generation(cache_key, text)
+            return text
+
+        except httpx.HTTPError as e:
+            return f"Error making API request: {e}"
+        except json.JSONDecodeError:
+            return f"Error decoding JSON response: {response.text}"
+        except Exception as e:
+            return f"An unexpected error occurred: {e}"
+
+    async def call_gemini_api_batch(self, prompts: List[str], api_key: str) -> List[str]:
+        """
+        Fans out several Gemini calls concurrently over one connection,
+        so N generations cost roughly one round-trip of wall-clock time
+        instead of N. Results come back in prompt order; failures are
+        returned as per-prompt "Error: ..." strings like the sync API.
+        """
+        semaphore = asyncio.Semaphore(self.GEMINI_MAX_CONCURRENCY)
+        async with httpx.AsyncClient(timeout=120) as client:
+            return list(await asyncio.gather(*[
+                self._call_gemini_api_async(client, semaphore, prompt, api_key)
+                for prompt in prompts
+            ]))
+
+    # Placeholder image bytes are static per URL, so one fetch serves the
+    # whole session (shared by the sync and async paths below).
+    _placeholder_image_cache: Dict[str, bytes] = {}
+
+    PLACEHOLDER_IMAGE_URL = "https://via.placeholder.com/600x400?text=AI+Generated+Image"
+
+    def generate_image_with_ai(self, prompt: str) -> Optional[bytes]:
+        """
+        Simulates AI image generation or provides a placeholder.
+        In a real scenario, this would call an external image generation API.
+        """
+        st.info(f"Generating image for prompt: '{prompt}' (This is a placeholder, actual image generation requires external API integration like DALL-E, Stable Diffusion, etc.)")
+        cached = self._placeholder_image_cache.get(self.PLACEHOLDER_IMAGE_URL)
+        if cached is not None:
+            return cached
+        try:
+            response = self.session.get(self.PLACEHOLDER_IMAGE_URL, timeout=10)
+            response.raise_for_status()
+            self._placeholder_image_cache[self.PLACEHOLDER_IMAGE_URL] = response.content
+            return response.content
+        except requests.exceptions.RequestException as e:
+            st.error(f"Could not fetch placeholder image: {e}. Please check internet connection.")
+            return None
+        except Exception as e:
+            st.error(f"Error in placeholder image generation: {e}")
+            return None
+
+    async def generate_image_with_ai_async(self, prompt: str) -> Optional[bytes]:
+        """
+        Async variant of generate_image_with_ai, so the image fetch can be
+        gathered alongside a (much slower) content generation call.
+        """
+        st.info(f"Generating image for prompt: '{prompt}' (This is a placeholder, actual image generation requires external API integration like DALL-E, Stable Diffusion, etc.)")
+        cached = self._placeholder_image_cache.get(self.PLACEHOLDER_IMAGE_URL)
+        if cached is not None:
+            return cached
+        try:
+            async with httpx.AsyncClient(timeout=10) as client:
+                response = await client.get(self.PLACEHOLDER_IMAGE_URL)
+                response.raise_for_status()
+            self._placeholder_image_cache[self.PLACEHOLDER_IMAGE_URL] = response.content
+            return response.content
+        except httpx.HTTPError as e:
+            st.error(f"Could not fetch placeholder image: {e}. Please check internet connection.")
+            return None
+        except Exception as e:
+            st.error(f"Error in placeholder image generation: {e}")
+            return None
+    
+    @staticmethod
+    def _build_content_prompt(topic: str, content_type: str, description: str,
+                              additional_requirements: str, writing_style: str,
+                              target_audience: str, word_count: str,
+                              include_seo: bool, include_toc: bool,
+                              include_examples: bool, include_conclusion: bool) -> str:
+        """Assembles the generation prompt shared by the blocking and
+        streaming content paths."""
+        seo_instructions = _SEO_INSTRUCTIONS if include_seo else ""
+        toc_instructions = _TOC_INSTRUCTIONS if include_toc else ""
+        examples_instructions = _EXAMPLES_INSTRUCTIONS if include_examples else ""
+        conclusion_instructions = _CONCLUSION_INSTRUCTIONS if include_conclusion else ""
+
+        type_specific_instructions = _TYPE_SPECIFIC_INSTRUCTIONS.get(content_type, "")
+
+        return _CONTENT_PROMPT_TEMPLATE.substitute(
+            content_type=content_type,
+            content_type_lower=content_type.lower(),
+            topic=topic,
+            writing_style=writing_style,
+            target_audience=target_audience,
+            word_count=word_count,
+            description=description,
+            additional_requirements=additional_requirements,
+            seo_instructions=seo_instructions,
+            toc_instructions=toc_instructions,
+            examples_instructions=examples_instructions,
+            conclusion_instructions=conclusion_instructions,
+            type_specific_instructions=type_specific_instructions,
+        )
+
+    def generate_enhanced_content(self, topic: str, content_type: str, description: str,
+                                additional_requirements: str, writing_style: str,
+                                target_audience: str, word_count: str,
+                                include_seo: bool = True, include_toc: bool = False,
+                                include_examples: bool = True, include_conclusion: bool = True) -> Optional[str]:
+        """Generate enhanced content with detailed parameters, adapting for content type."""
+        try:
+            if not hasattr(self, 'gemini_api_key'):
+                return "Error: Gemini AI API key not configured"
+
+            prompt = self._build_content_prompt(
+                topic, content_type, description, additional_requirements,
+                writing_style, target_audience, word_count,
+                include_seo, include_toc, include_examples, include_conclusion)
+            result = self.call_gemini_api(prompt, self.gemini_api_key)
+            return result if result and not result.startswith("Error:") else result
+        except Exception as e:
+            st.error(f"Error generating content: {str(e)}")
+            return None
+
+    def generate_enhanced_content_stream(self, topic: str, content_type: str, description: str,
+                                         additional_requirements: str, writing_style: str,
+                                         target_audience: str, word_count: str,
+                                         include_seo: bool = True, include_toc: bool = False,
+                                         include_examples: bool = True, include_conclusion: bool = True):
+        """Streaming variant of generate_enhanced_content: returns a generator
+        of text chunks suitable for st.write_stream, so the first tokens reach
+        the user while the model is still writing."""
+        if not hasattr(self, 'gemini_api_key'):
+            return iter(["Error: Gemini AI API key not configured"])
+
+        prompt = self._build_content_prompt(
+            topic, content_type, description, additional_requirements,
+            writing_style, target_audience, word_count,
+            include_seo, include_toc, include_examples, include_conclusion)
+        return self.call_gemini_api_stream(prompt, self.gemini_api_key)
+    
+    def generate_project_files(self, project_name: str, project_type: str, description: str, 
+                              additional_requirements: str, target_audience: str,
+                              project_complexity: str = "Intermediate", include_tests: bool = False,
+                              include_docker: bool = False, include_ci_cd: bool = False,
+                              include_docs: bool = True, create_examples: bool = True) -> Optional[Dict[str, str]]:
+        """Generate multiple files for a complete project with enhanced parameters."""
+        
+        test_instructions = _PROJECT_TESTS_INSTRUCTIONS if include_tests else ""
+        docker_instructions = _PROJECT_DOCKER_INSTRUCTIONS if include_docker else ""
+        ci_cd_instructions = _PROJECT_CI_CD_INSTRUCTIONS if include_ci_cd else ""
+        docs_instructions = _PROJECT_DOCS_INSTRUCTIONS if include_docs else ""
+        examples_instructions = _PROJECT_EXAMPLES_INSTRUCTIONS if create_examples else ""
+        
+        prompt = _PROJECT_PROMPT_TEMPLATE.substitute(
+            project_name=project_name,
+            project_type=project_type,
+            project_type_lower=project_type.lower(),
+            target_audience=target_audience,
+            project_complexity=project_complexity,
+            description=description,
+            additional_requirements=additional_requirements,
+            test_instructions=test_instructions,
+            docker_instructions=docker_instructions,
+            ci_cd_instructions=ci_cd_instructions,
+            docs_instructions=docs_instructions,
+            examples_instructions=examples_instructions,
+        )
+        
+        try:
+            if not hasattr(self, 'gemini_api_key'):
+                return None
+                
+            result = self.call_gemini_api(prompt, self.gemini_api_key)
+            
+            if result and not result.startswith("Error:"):
+                return self.parse_project_files(result)
+            else:
+                st.error(f"Project generation failed: {result}")
+                return None
+                
+        except Exception as e:
+            st.error(f"Error generating project: {str(e)}")
+            return None
+    
+    def parse_project_files(self, content: str) -> Dict[str, str]:
+        """Parse the AI response to extract individual files."""
+        return _parse_project_files(content)
+
+    @staticmethod
+    def _parse_project_files_impl(content: str) -> Dict[str, str]:
+        files = {}
+        
+        file_blocks_matches = _FILE_BLOCK_RE.findall(content)
+
+        for filename, file_content in file_blocks_matches:
+            files[filename.strip()] = file_content.strip()
+
+        if not files:
+            st.warning("Could not parse files using strict FILE: and ``` markers. Attempting simpler parsing.")
+            # Walk FILE: markers by index and slice the original string once
+            # per file, instead of re-splitting and re-joining accumulated
+            # chunks (which copied the text repeatedly).
+            lowered = content.lower()
+            pos = lowered.find('file:')
+            while pos != -1:
+                header_end = content.find('\n', pos)
+                if header_end == -1:
+                    header_end = len(content)
+                filename = content[pos + len('FILE:'):header_end].strip()
+                next_pos = lowered.find('file:', header_end)
+                body_end = next_pos if next_pos != -1 else len(content)
+                if filename:
+                    files[filename] = content[header_end + 1:body_end].strip()
+                pos = next_pos
+
+            # Strip a wrapping code fence with slices rather than a full
+            # split('\n') round-trip per file.
+            for fname, fcontent in files.items():
+                if fcontent.startswith('```'):
+                    first_newline = fcontent.find('\n')
+                    body = fcontent[first_newline + 1:] if first_newline != -1 else ''
+                    if fcontent.endswith('```'):
+                        last_newline = body.rfind('\n')
+                        body = body[:last_newline] if last_newline != -1 else ''
+                    files[fname] = body.strip()
+
+        if not files:
+            project_name = "AI Generated Project"
+            files['README.md'] = f"# {project_name}\n\nProject generated by AI Content Agent Pro"
+            files['main.py'] = "# Main project file\nprint('Hello, World!')"
+            files['requirements.txt'] = "# Add your dependencies here"
+            st.error("Failed to parse any files from AI response. Generated minimal placeholder files.")
+        
+        return files
+    
+    def generate_seo_metadata(self, content: str, topic: str) -> Optional[Dict[str, Any]]:
+        """Generate SEO metadata for the content."""
+        
+        # Bound the preview by UTF-8 bytes rather than characters, so
+        # multilingual content cannot inflate the Gemini payload severalfold;
+        # a trailing partial character is simply dropped. Slicing 1500 chars
+        # first keeps this O(1) - they always cover at least 1500 bytes - so
+        # the whole article is never encoded just to keep a preview.
+        content_preview = content[:1500].encode('utf-8')[:1500].decode('utf-8', 'ignore')
+        
+        prompt = _SEO_PROMPT_TEMPLATE.substitute(topic=topic, content_preview=content_preview)
+        
+        try:
+            if not hasattr(self, 'gemini_api_key'):
+                st.warning("Gemini AI API key not configured for SEO generation. Using fallback metadata.")
+                return {
+                    "title": topic[:60],
+                    "description": f"Learn about {topic} in this comprehensive guide.",
+                    "keywords": [topic.lower()],
+                    "slug": topic.lower().replace(' ', '-').replace(',', '').replace('.', '')[:50]
+                }
+                
+            response = self.call_gemini_api(prompt, self.gemini_api_key)
+            
+            if response and not response.startswith("Error:"):
+                json_text = _find_json_object(response)
+                if json_text:
+                    try:
+                        parsed_json = _json_loads(json_text)
+                        parsed_json['title'] = parsed_json.get('title', topic)[:60].strip()
+                        parsed_json['description'] = parsed_json.get('description', f"Learn about {topic}").replace('\n', ' ')[:160].strip()
+                        parsed_json['keywords'] = [k.strip().lower() for k in parsed_json.get('keywords', []) if k.strip()][:5]
+                        parsed_json['slug'] = _SLUG_CLEANUP_RE.sub('', parsed_json.get('slug', topic).lower()).replace(' ', '-').strip()[:60]
+                        return parsed_json
+                    except json.JSONDecodeError:
+                        st.warning(f"Could not parse SEO JSON from Gemini. Raw response: {response}. Using fallback metadata.")
+                        pass
+            
+            st.warning("SEO generation failed or returned invalid format. Using fallback metadata.")
+            return {
+                "title": topic[:60],
+                "description": f"Learn about {topic} in this comprehensive guide.",
+                "keywords": [topic.lower()],
+                "slug": topic.lower().replace(' ', '-').replace(',', '').replace('.', '')[:50]
+            }
+            
+        except Exception as e:
+            st.error(f"Error generating SEO metadata: {str(e)}")
+            return {
+                "title": topic[:60],
+                "description": f"Learn about {topic} in this comprehensive guide.",
+                "keywords": [topic.lower()],
+                "slug": topic.lower().replace(' ', '-').replace(',', '').replace('.', '')[:50]
+            }
+    
+    def extract_title_from_content(self, content: str) -> str:
+        """Extract title from generated content (first H1)."""
+        return _extract_title_from_content(content)
+    
+    def save_markdown_file(self, content: str, title: str, seo_metadata: Dict = None,
+                           now: Optional[datetime] = None) -> str:
+        """Save content as markdown file with YAML front matter metadata.
+
+        `now` lets callers share one timestamp across related outputs."""
+        now = now or datetime.now()
+        output_dir = Path("generated_content")
+        output_dir.mkdir(exist_ok=True)
+        
+        filename = _DASH_RUN_RE.sub('-', title.translate(_SLUG_DROP_TABLE).strip()).lower()
+        filepath = output_dir / f"{filename}.md"
+        
+        # Collect the header lines and join once, rather than growing an
+        # immutable string append by append.
+        header_lines = [
+            "---\n",
+            f"title: {_json_dumps_text(title)}\n",
+            f"date: {now.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "generated_by: AI Content Agent Pro\n",
+        ]
+        if seo_metadata:
+            keywords_str = ', '.join(seo_metadata.get('keywords', []))
+            header_lines += [
+                f"seo_title: {_json_dumps_text(seo_metadata.get('title', ''))}\n",
+                f"description: {_json_dumps_text(seo_metadata.get('description', ''))}\n",
+                f"keywords: {_json_dumps_text(keywords_str)}\n",
+                f"slug: {_json_dumps_text(seo_metadata.get('slug', ''))}\n",
+            ]
+        header_lines.append("---\n\n")
+        metadata_header = ''.join(header_lines)
+        
+        # Only the first line matters here, so peel it off with partition
+        # instead of splitting (and re-joining) the whole document.
+        first_line, newline, rest = content.partition('\n')
+        stripped_first = first_line.strip()
+        if stripped_first.startswith('#'):
+            potential_ai_h1 = stripped_first[1:].strip()
+            if potential_ai_h1.lower() == title.lower():
+                content = rest if newline else ''
+        
+        markdown_content = metadata_header + content
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(markdown_content)
+        
+        return str(filepath)
+    
+    def export_content(self, content: str, title: str, seo_metadata: Dict = None,
+                       formats: Optional[set] = None) -> Dict[str, str]:
+        """
+        Writes the requested output formats ('markdown', 'html') and returns
+        {format: path}. Formats not requested cost nothing - in particular
+        the Markdown->HTML render and template substitution are skipped
+        entirely for markdown-only exports. Both artifacts share one
+        timestamp when generated together.
+        """
+        formats = formats or {'markdown', 'html'}
+        now = datetime.now()
+        paths = {}
+        if 'markdown' in formats:
+            paths['markdown'] = self.save_markdown_file(content, title, seo_metadata, now=now)
+        if 'html' in formats:
+            paths['html'] = self.create_html_website(content, title, seo_metadata, now=now)
+        return paths
+
+    def create_html_website(self, content: str, title: str, seo_metadata: Dict = None,
+                            now: Optional[datetime] = None) -> str:
+        """Create a complete HTML website with the generated content.
+
+        `now` lets callers share one timestamp across related outputs."""
+        now = now or datetime.now()
+        
+        output_dir = Path("generated_website")
+        output_dir.mkdir(exist_ok=True)
+
+        # The exported page highlights code client-side with highlight.js, so
+        # the 'page' path can use the libcmark fast route inside the cached
+        # converter when cmarkgfm is installed.
+        html_content = _markdown_to_html(content, 'page')
+        
+        page_title = seo_metadata.get('title', title) if seo_metadata else title
+        meta_description = seo_metadata.get('description', '') if seo_metadata else ''
+        keywords = ', '.join(seo_metadata.get('keywords', [])) if seo_metadata else ''
+        
+        html_file = output_dir / "index.html"
+        with open(html_file, 'w', encoding='utf-8', buffering=65536) as f:
+            f.write(_HTML_PAGE_HEAD_TEMPLATE.substitute(
+                page_title=page_title,
+                meta_description=meta_description,
+                keywords=keywords,
+                pub_date_human=now.strftime('%B %d, %Y'),
+            ))
+            f.write(html_content)
+            f.write(_HTML_PAGE_TAIL_TEMPLATE.substitute(
+                pub_date_full=now.strftime('%Y-%m-%d at %H:%M:%S'),
+            ))
+
+        return str(html_file)
+
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _parse_project_files(content: str) -> Dict[str, str]:
+    """Memoized project-file parsing; reruns re-parse identical responses."""
+    return CompleteAIContentAgent._parse_project_files_impl(content)
+
+
+
+# Static preview-column feature boxes, defined once instead of being
+# re-parsed from source on every rerun.
+_PROJECT_FEATURES_HTML = """
+                <div class="feature-box">
+                <h4>🚀 Project Features (AI Will Attempt)</h4>
+                <ul style="margin: 0; padding-left: 20px;">
+                <li>🐍 Core project logic files</li>
+                <li>📋 `requirements.txt`</li>
+                <li>📚 Comprehensive `README.md`</li>
+                <li>🔧 `.gitignore` and config files</li>
+                <li>🧪 Unit tests (optional)</li>
+                <li>🐳 Docker setup (optional)</li>
+                <li>🔄 CI/CD config (optional)</li>
+                </ul>
+                </div>
+                """
+
+_CONTENT_FEATURES_HTML = """
+                <div class="feature-box">
+                <h4>✅ Content Quality & Structure (AI Will Attempt)</h4>
+                <ul style="margin: 0; padding-left: 20px;">
+                <li>🎯 SEO-optimized elements (title, meta desc, keywords)</li>
+                <li>📱 Clean, readable formatting</li>
+                <li>💻 Syntax-highlighted code blocks (if technical)</li>
+                <li>📊 Logical section hierarchy (H1, H2, H3)</li>
+                <li>🔗 Placeholder for relevant links</li>
+                <li>📈 Actionable insights & tips</li>
+                <li>📚 Optional Table of Contents</li>
+                </ul>
+                </div>
+                """
+
+
+# One-line descriptions shown in the tab1 preview column; module-level so the
+# dicts are not re-allocated on every rerun keystroke.
+_PROJECT_INFO_MAP = {
+    "Python Project": "A general-purpose Python application.",
+    "Web Application": "A functional web app, potentially with frontend/backend components.",
+    "API Project": "A RESTful API with defined endpoints.",
+    "Data Science Project": "Scripts and notebooks for data analysis/modeling.",
+    "Machine Learning Project": "Code for an ML model, including data processing.",
+    "Discord Bot": "A functional Discord bot with commands.",
+    "Automation Script": "A script to automate a specific task.",
+    "CLI Tool": "A command-line interface tool.",
+    "Game Project": "Basic code for a simple game."
+}
+
+_CONTENT_INFO_MAP = {
+    "Blog Post": "An engaging, conversational article for your blog.",
+    "Technical Article": "An in-depth piece covering technical concepts.",
+    "Tutorial": "A step-by-step guide to teach a specific skill.",
+    "News Article": "A factual report on a current event.",
+    "Review": "An evaluation of a product or service.",
+    "Opinion Piece": "A subjective article expressing a viewpoint.",
+    "How-to Guide": "Practical instructions for achieving a task.",
+    "Case Study": "An analysis of a problem, solution, and results.",
+    "Product Documentation": "User guides and reference material for a product.",
+    "API Documentation": "Comprehensive guide for using an API.",
+    "White Paper": "An authoritative report on a specific topic, often for problem-solving.",
+    "Research Paper": "A structured, academic-style paper based on research.",
+    "Marketing Copy": "Persuasive content designed to promote something."
+}
+
+
+# Maps file extensions to st.code syntax-highlighting languages for the
+# project preview loop.
+_EXT_LANGUAGE_MAP = {
+    'py': 'python',
+    'md': 'markdown',
+    'json': 'json',
+    'yaml': 'yaml',
+    'yml': 'yaml',
+    'txt': 'text',
+    'html': 'html',
+    'css': 'css',
+    'js': 'javascript',
+    'sh': 'bash',
+    'env': 'bash',
+}
+
+
+
+
+@st.cache_data(show_spinner=False)
+def _file_download_links(files_tuple: Tuple[Tuple[str, str], ...]) -> str:
+    """Builds an HTML list of data-URI download links for the project files,
+    cached per file set so reruns reuse the encoded payloads."""
+    links = []
+    for name, content in files_tuple:
+        encoded = base64.b64encode(content.encode('utf-8')).decode('ascii')
+        safe_name = html.escape(name, quote=True)
+        links.append(f'<a download="{safe_name}" href="data:text/plain;base64,{encoded}">📄 {safe_name}</a>')
+    return '<br>'.join(links)
+
+
+# Recommended (inclusive) length bands for SEO fields, shared by the
+# analytics status labels.
+_SEO_LENGTH_BANDS = {'title': (50, 60), 'description': (150, 160)}
+
+
+def _seo_length_status(field: str, length: int) -> str:
+    low, high = _SEO_LENGTH_BANDS[field]
+    return "✅ Good" if low <= length <= high else "⚠️ Needs optimization"
+
+
+def _estimate_word_count(content: str) -> int:
+    """Space-count word estimate: one C-level pass, no throwaway word list.
+    Close enough for stats/reading-time display."""
+    return content.count(' ') + 1 if content else 0
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _content_analytics(content: str) -> Dict[str, int]:
+    """Word/paragraph/code-block/heading counts for the analytics panel.
+    One fused pass over the lines replaces the former four independent
+    traversals (split, split('\n\n') and two regex scans); fences and
+    headings are counted line-anchored, which is how generated Markdown
+    writes them anyway."""
+    # Fences are line-anchored, so a C-level substring count covers them
+    # without per-line Python work.
+    fences = content.count('\n```') + (1 if content.startswith('```') else 0)
+    paragraphs = 0
+    headings = 0
+    in_paragraph = False
+    for line in content.splitlines():
+        if line.startswith('#'):
+            rest = line.lstrip('#')
+            if rest.startswith((' ', '\t')):
+                headings += 1
+        if line.strip():
+            if not in_paragraph:
+                paragraphs += 1
+                in_paragraph = True
+        else:
+            in_paragraph = False
+    return {
+        'words': _estimate_word_count(content),
+        'paragraphs': paragraphs,
+        'code_blocks': fences // 2,
+        'headings': headings,
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _project_stats(files_tuple: Tuple[Tuple[str, str], ...]) -> Tuple[int, int]:
+    """(file count, total lines) for a generated project. count('\n') avoids
+    materializing a throwaway line list per file, and the cache keeps reruns
+    from rescanning an unchanged project."""
+    return len(files_tuple), sum(content.count('\n') + 1 for _, content in files_tuple)
+
+
+@st.cache_data(show_spinner=False)
+def _build_project_zip(files_tuple: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Builds the downloadable project archive once per distinct file set;
+    repeat clicks and unrelated tab reruns reuse the cached bytes instead
+    of recompressing every file."""
+    import zipfile
+    zip_buffer = io.BytesIO()
+    # Generated projects are small text files: zlib level 1 gets nearly the
+    # same ratio as the default level at a fraction of the CPU.
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+        for filename, content in files_tuple:
+            zip_file.writestr(filename, content)
+    return zip_buffer.getvalue()
+
+
+
+# Button/validation labels for the generate handler, keyed by is_project.
+_GEN_UI_LABELS = {
+    True: ("🚀 Generate Project", "❌ Please enter a project name."),
+    False: ("🚀 Generate Content", "❌ Please enter a topic for your content."),
+}
+
+@st.fragment
+def _render_creation_tab(agent):
+    """Tab 1 wizard. As a fragment, widget interactions here rerun only
+    this body instead of the whole script."""
+    st.header("📝 Content & Project Creation Wizard")
+
+    # Banner stashed by the generate handler before its app-scope rerun.
+    success_message = st.session_state.pop('generation_success_message', None)
+    if success_message:
+        st.success(success_message)
+        st.balloons()
+    
+    if 'gemini_configured' not in st.session_state or not st.session_state.gemini_configured:
+        st.warning("⚠️ Please configure Gemini AI in the sidebar to continue.")
+        return
+    
+    creation_type = st.radio(
+        "What would you like to create?",
+        ["📄 Content (Articles, Blog Posts, Documentation)", "🚀 Python Projects & Applications"],
+        help="Choose between creating written content or complete coding projects",
+        key="creation_type_radio"
+    )
+    
+    is_project = "Projects" in creation_type
+    
+    # A form coalesces every widget edit below into a single rerun on
+    # submit instead of one rerun per keystroke/toggle.
+    with st.form("creation_form"):
+        col1, col2 = st.columns([3, 2])
+    
+        with col1:
+            st.subheader("📋 Basic Information")
+        
+            if is_project:
+                project_name = st.text_input(
+                    "🚀 Project Name",
+                    placeholder="e.g., Simple Chatbot with Flask",
+                    help="Enter the name of your project",
+                    key="project_name_input"
+                )
+            
+                col1a, col1b = st.columns(2)
+                with col1a:
+                    project_type = st.selectbox("🛠️ Project Type", 
+                        agent.project_content_types,
+                        key="project_type_select")
+                with col1b:
+                    target_audience = st.selectbox("👥 Target Users", 
+                        ["Beginners", "Intermediate", "Advanced", "Developers"],
+                        key="project_audience_select")
+            
+                topic = project_name
+            
+            else: # Not a project, so it's article/blog content
+                topic = st.text_input(
+                    "📌 Article Topic",
+                    placeholder="e.g., The Future of AI in Content Creation",
+                    help="Enter the main topic or title for your content",
+                    key="article_topic_input"
+                )
+            
+                col1a, col1b = st.columns(2)
+                with col1a:
+                    content_type = st.selectbox("📄 Content Type", 
+                        agent.article_content_types,
+                        key="article_type_select")
+                    writing_style = st.selectbox("✍️ Writing Style", 
+                        agent.writing_styles,
+                        key="writing_style_select")
+            
+                with col1b:
+                    target_audience = st.selectbox("👥 Target Audience", 
+                        agent.target_audiences,
+                        key="audience_select")
+                    word_count = st.selectbox("📏 Word Count", 
+                        agent.word_counts,
+                        key="word_count_select")
+        
+            st.divider()
+        
+            st.subheader("📄 Detailed Requirements & Structure")
+        
+            if is_project:
+                description = st.text_area(
+                    "📝 Project Description & Features",
+                    placeholder="""Describe your project in detail:
+
+🎯 Main Purpose:
+• What should this project do?
+• What problem does it solve?
+
+🔧 Features to Include:
+• User authentication: Implement login/registration.
+• Database integration: Use SQLite for data storage.
+• API endpoints: Define GET/POST for user data.
+
+💻 Technical Requirements:
+• Programming languages: Python 3.9+
+• Frameworks: Flask
+• Libraries: SQLAlchemy, requests
+• User interface: REST API (no frontend needed)
+
+📚 Additional Requirements:
+• Comprehensive error handling for all API endpoints.
+• Logging of user activities.
+• Simple configuration using environment variables (.env.example).""",
+                    height=300,
+                    help="Provide detailed specifications for your project",
+                    key="project_description_area"
+                )
+            
+                additional_requirements = st.text_area(
+                    "➕ Additional Specifications (Optional)",
+                    placeholder="""Any other specific instructions for the AI:
+
+• Performance goals: Aim for quick response times.
+• Scalability: Design for future expansion (e.g., easy switch to PostgreSQL).
+• Security: Basic API key authentication.
+• Development environment setup details.""",
+                    height=200,
+                    key="project_additional_req_area"
+                )
+            
+            else:
+                description = st.text_area(
+                    "📝 Detailed Description & Core Topics",
+                    placeholder=f"""Describe your content requirements in detail for a {content_type.lower()} about "{topic}":
+
+🎯 Main Topics to Cover:
+• Introduction to [Concept]: Explain the basics.
+• Step-by-step implementation guide: Show how to do X.
+• Best practices for [Concept]: Provide actionable advice.
+
+💻 Technical Requirements (if applicable):
+• Programming language: Python (version, libraries)
+• Specific code examples for: data processing, API calls.
+• Command-line instructions for setup.
+
+📊 Structure Preferences:
+• Include an engaging introduction and a strong conclusion.
+• Use at least 3 main sections (H2 headings).
+• Include practical examples for each major point.
+• Add a "Troubleshooting Common Issues" section.
+• Use bullet points for lists and tables for comparisons.
+
+🔍 SEO & Format:
+• Primary keyword: "{topic.lower().replace(' ', '-')}"
+• Secondary keywords: [list, up, to, 5]
+• Include a call-to-action (e.g., "start your journey").""",
+                    height=300,
+                    help="Provide detailed instructions for the AI to create exactly what you need. Be specific about sections, examples, and tone.",
+                    key="content_description_area"
+                )
+            
+                additional_requirements = st.text_area(
+                    "➕ Additional Requirements (Optional)",
+                    placeholder="""Any other specific instructions for the AI:
+
+🎨 Style & Tone:
+• Professional but approachable, avoiding overly academic jargon.
+• Maintain a consistent, encouraging tone.
+
+📈 Special Elements:
+• Include a compelling anecdote or real-world example.
+• Suggest relevant external resources for further reading.
+• Add a section on common pitfalls and how to avoid them.
+
+🔗 References:
+• Mention 2-3 prominent tools/libraries in the field.
+• Suggest potential sub-topics for future articles.
+
+📱 Format Specifics:
+• Mobile-friendly formatting.
+• Suggest a potential social media blurb (e.g., tweet).""",
+                    height=200,
+                    key="content_additional_req_area"
+                )
+        
+            with st.expander("🔧 Advanced Generation Options", expanded=True):
+                if not is_project:
+                    col_adv_content1, col_adv_content2 = st.columns(2)
+                    with col_adv_content1:
+                        include_seo = st.checkbox("Include SEO optimization", value=True, help="AI will focus on keywords, headings, and meta-description elements.", key="include_seo_checkbox")
+                        include_toc = st.checkbox("Generate Table of Contents", value=False, help="Adds a Table of Contents at the start of the article.", key="include_toc_checkbox")
+                    with col_adv_content2:
+                        include_examples = st.checkbox("Include Practical Examples", value=True, help="Encourage the AI to provide code snippets, real-world scenarios, etc.", key="include_examples_checkbox")
+                        include_conclusion = st.checkbox("Include Actionable Conclusion", value=True, help="Ensure the article ends with key takeaways and next steps.", key="include_conclusion_checkbox")
+                else: 
+                    col_adv_project1, col_adv_project2 = st.columns(2)
+                    with col_adv_project1:
+                        project_complexity = st.selectbox("⚙️ Project Complexity", ["Simple", "Intermediate", "Advanced"], help="Influences the depth and scope of the generated project.", key="project_complexity_select")
+                        include_tests = st.checkbox("Include Unit Tests", value=False, help="Generate basic unit tests for the project.", key="include_tests_checkbox")
+                        include_docker = st.checkbox("Include Docker Setup", value=False, help="Generate Dockerfile and docker-compose.yml.", key="include_docker_checkbox")
+                    with col_adv_project2:
+                        create_examples = st.checkbox("Create Usage Examples", value=True, help="Generate example scripts or usage demonstrations.", key="create_examples_checkbox")
+                        include_docs = st.checkbox("Include Detailed Documentation", value=True, help="Encourage more extensive inline comments and README details.", key="include_docs_checkbox")
+                        include_ci_cd = st.checkbox("Include CI/CD Configuration", value=False, help="Generate basic CI/CD workflow (e.g., GitHub Actions).", key="include_ci_cd_checkbox")
+
+
+        with col2:
+            st.subheader("🎯 Creation Preview")
+        
+            if topic or (is_project and project_name):
+                col2a, col2b = st.columns(2)
+                with col2a:
+                    st.metric("⏱️ Est. Gen Time", "30-180s")
+                    st.metric("📊 Audience", target_audience)
+            
+                with col2b:
+                    if is_project:
+                        st.metric("📁 Files", "3-10+")
+                        st.metric("⚙️ Complexity", project_complexity)
+                    else:
+                        st.metric("📝 Words", word_count)
+                        st.metric("🎨 Style", writing_style)
+            
+                if is_project:
+                    st.markdown(_PROJECT_FEATURES_HTML, unsafe_allow_html=True)
+                else:
+                    st.markdown(_CONTENT_FEATURES_HTML, unsafe_allow_html=True)
+            
+                if is_project:
+                    st.info(f"**{project_type}**: {_PROJECT_INFO_MAP.get(project_type, 'A customized project.')}")
+                else:
+                    st.info(f"**{content_type}**: {_CONTENT_INFO_MAP.get(content_type, 'A customized content piece.')}")
+    
+        st.divider()
+    
+        col_gen1, col_gen2, col_gen3 = st.columns([1, 2, 1])
+    
+        with col_gen2:
+            button_text, error_msg = _GEN_UI_LABELS[is_project]
+            input_check = project_name if is_project else topic
+        
+            submitted = st.form_submit_button(button_text, type="primary", use_container_width=True)
+            if submitted:
+                if not input_check.strip():
+                    st.error(error_msg)
+                elif len(input_check.strip()) < 5 and not description.strip():
+                    st.error("❌ Please provide a more detailed topic/project name or description (at least 5 characters).")
+                else:
+                    progress_bar = st.progress(0)
+                    status_text = st.empty()
+                
+                    try:
+                        if is_project:
+                            status_text.text("🤖 AI is analyzing your project requirements...")
+                            progress_bar.progress(20)
+                        
+                            status_text.text("🔨 Creating project structure and code...")
+                            progress_bar.progress(40)
+                        
+                            project_files = agent.generate_project_files(
+                                project_name=project_name,
+                                project_type=project_type,
+                                description=description, 
+                                additional_requirements=additional_requirements, 
+                                target_audience=target_audience,
+                                project_complexity=project_complexity,
+                                include_tests=include_tests,
+                                include_docker=include_docker,
+                                include_ci_cd=include_ci_cd,
+                                include_docs=include_docs,
+                                create_examples=create_examples
+                            )
+                        
+                            if project_files:
+                                progress_bar.progress(90)
+                                status_text.text("📁 Finalizing project files...")
+                            
+                                st.session_state.generated_project = project_files
+                                st.session_state.project_name = project_name
+                                st.session_state.project_type = project_type
+                                st.session_state.project_description = description
+                                st.session_state.generation_time = datetime.now()
+                                st.session_state.is_project = True
+                            
+                                progress_bar.progress(100)
+                                status_text.text("✅ Project generated successfully!")
+                            
+                                file_count, total_lines = _project_stats(tuple(project_files.items()))
+                            
+                                st.session_state.generation_success_message = f"""
+                            🎉 **Project Generated Successfully!**
+                            
+                            📊 **Stats:**
+                            - Files: {file_count}
+                            - Total lines: {total_lines:,}
+                            - Project type: {project_type}
+                            """
+                            
+                                # Other tabs consume the freshly written state;
+                                # a fragment-scoped rerun would leave them
+                                # stale, so rerun the whole app. The banner is
+                                # stashed above to survive the rerun.
+                                st.rerun()
+                            
+                            else:
+                                st.error("❌ Failed to generate project files.")
+                            
+                        else: # Generating content (articles, blogs, etc.)
+                            status_text.text("🤖 AI is analyzing your content requirements...")
+                            progress_bar.progress(20)
+                        
+                            status_text.text("✍️ Creating your content... (streaming)")
+                            progress_bar.progress(50)
+                        
+                            # Stream tokens as they arrive so the first words
+                            # appear almost immediately instead of after the
+                            # full multi-second generation.
+                            with st.expander("✍️ Live draft", expanded=True):
+                                content = st.write_stream(agent.generate_enhanced_content_stream(
+                                    topic=topic,
+                                    content_type=content_type,
+                                    description=description,
+                                    additional_requirements=additional_requirements,
+                                    writing_style=writing_style,
+                                    target_audience=target_audience,
+                                    word_count=word_count,
+                                    include_seo=include_seo,
+                                    include_toc=include_toc,
+                                    include_examples=include_examples,
+                                    include_conclusion=include_conclusion
+                                ))
+                            if isinstance(content, list):
+                                content = ''.join(str(chunk) for chunk in content)
+                        
+                            if content and not content.startswith("Error:"):
+                                progress_bar.progress(70)
+                                status_text.text("🔍 Generating SEO metadata...")
+
+                                # Regenerating identical content (common while
+                                # tuning other fields) reuses the prior metadata
+                                # instead of another Gemini round-trip.
+                                content_key = hashlib.blake2b(f"{topic}\x00{content}".encode('utf-8'), digest_size=8).hexdigest()
+                                # Distinct prefix: widget keys like
+                                # seo_title_input must not be swept up by the
+                                # clear handler.
+                                seo_cache_key = f"seo_cache_{content_key}"
+                                seo_metadata = st.session_state.get(seo_cache_key)
+                                if seo_metadata is None:
+                                    seo_metadata = agent.generate_seo_metadata(content, topic)
+                                    st.session_state[seo_cache_key] = seo_metadata
+                            
+                                progress_bar.progress(90)
+                                status_text.text("📝 Finalizing content...")
+                            
+                                st.session_state.generated_content = content
+                                # Stats are computed once here; tab2 and tab3 read
+                                # them instead of re-traversing the content per rerun.
+                                st.session_state.content_word_count = _estimate_word_count(content)
+                                st.session_state.content_char_count = len(content)
+                                st.session_state.content_title = agent.extract_title_from_content(content)
+                                st.session_state.content_topic = topic
+                                st.session_state.content_type = content_type
+                                st.session_state.seo_metadata = seo_metadata
+                                st.session_state.generation_time = datetime.now()
+                                st.session_state.is_project = False
+                            
+                                progress_bar.progress(100)
+                                status_text.text("✅ Content generated successfully!")
+                            
+                                word_count_actual = st.session_state.content_word_count
+                            
+                                st.session_state.generation_success_message = f"""
+                            🎉 **Content Generated Successfully!**
+                            
+                            📊 **Stats:**
+                            - Words: {word_count_actual:,}
+                            - Characters: {len(content):,}
+                            - Estimated reading time: {word_count_actual // 200} minutes
+                            """
+                            
+                                # See the project branch: the app-scope rerun
+                                # lets the other tabs pick up the new content.
+                                st.rerun()
+                            
+                            else:
+                                st.error(f"❌ Content generation failed: {content}")
+                    
+                        progress_bar.empty()
+                        status_text.empty()
+                    
+                    except Exception as e:
+                        st.error(f"❌ Error during generation: {str(e)}")
+                        progress_bar.empty()
+                        status_text.empty()
+
+
+@st.fragment
+def _render_publishing_tab(agent):
+    """Tab 2 publishing controls, isolated as a fragment for the same
+    reason as the creation tab."""
+    st.header("🚀 Publishing & Distribution")
+    
+    # Outcome stashed by the publish handler before its app-scope rerun.
+    publish_outcome = st.session_state.pop('publish_success_outcome', None)
+    if publish_outcome:
+        upload_note = publish_outcome.get('image_upload')
+        if upload_note is not None:
+            if upload_note['success']:
+                st.success(f"✅ {upload_note['message']}")
+            else:
+                st.error(f"❌ Failed to upload featured image: {upload_note['error']}")
+                st.warning("The post was published without the featured image.")
+        st.success("✅ Content published successfully to WordPress!")
+        st.markdown(f"🔗 **View Post:** {publish_outcome['url']}")
+        st.markdown(f"✏️ **Edit Post:** {publish_outcome['edit_url']}")
+
+    has_content = 'generated_content' in st.session_state
+    has_project = 'generated_project' in st.session_state
+    
+    if not has_content and not has_project:
+        st.info("👆 Generate content or a project in the first tab to continue.")
+        return
+    
+    is_project = st.session_state.get('is_project', False)
+    
+    if is_project and has_project:
+        st.subheader("🚀 Project Files")
+        
+        project_files = st.session_state.generated_project
+        project_name = st.session_state.project_name
+        
+        with st.expander("📁 Project Files Preview", expanded=False):
+            # Streamlit executes expander bodies even while collapsed, which
+            # would serialize every file preview to the frontend on each
+            # rerun; only build them once explicitly requested.
+            if st.checkbox("Load file previews", value=False, key="load_project_previews"):
+                for filename, content in project_files.items():
+                    st.markdown(f"**📄 {filename}**")
+
+                    language = _EXT_LANGUAGE_MAP.get(filename.rsplit('.', 1)[-1].lower(), 'text')
+
+                    if len(content) > 1000:
+                        st.code(content[:1000] + "\n...", language=language)
+                    else:
+                        st.code(content, language=language)
+                    st.divider()
+        
+        file_count, calculated_total_lines = _project_stats(tuple(project_files.items()))
+        
+        col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+        
+        with col_stat1: st.metric("📁 Files", file_count)
+        with col_stat2: st.metric("📝 Total Lines", f"{calculated_total_lines:,}")
+        with col_stat3: st.metric("🛠️ Project Type", st.session_state.project_type)
+        with col_stat4: st.metric("📊 Generated", "Recently")
+        
+        st.divider()
+        st.subheader("💾 Local Download Options")
+        
+        col_down1, col_down2 = st.columns(2)
+        
+        with col_down1:
+            # Rendered unconditionally: the payload is a cached callable,
+            # so nothing is built until the click, and the old two-step
+            # button gate made the real download control vanish on the
+            # next rerun before it could be used.
+            st.download_button(
+                "📁 Download as ZIP",
+                data=lambda files=tuple(project_files.items()): _build_project_zip(files),
+                file_name=f"{project_name.replace(' ', '_').lower()}_project.zip",
+                mime='application/zip',
+                use_container_width=True,
+                key="download_project_zip_button"
+            )
+        
+        with col_down2:
+            if st.button("📄 View Files Individually", use_container_width=True, key="view_individual_files_button"):
+                st.session_state.show_individual_files = True
+        
+        if st.session_state.get('show_individual_files', False):
+            st.subheader("📄 Individual File Downloads")
+            # One cached HTML manifest of data-URI links instead of a
+            # download_button per file, which re-shipped every file's bytes
+            # through the widget protocol on each rerun.
+            st.markdown(_file_download_links(tuple(project_files.items())), unsafe_allow_html=True)
+    
+    elif has_content:
+        with st.expander("📖 Content Preview", expanded=False):
+            st.markdown(st.session_state.generated_content)
+        
+        generated = st.session_state.generated_content
+        word_count = st.session_state.get('content_word_count') or _estimate_word_count(generated)
+        content_stats = {
+            "Word Count": word_count,
+            "Character Count": st.session_state.get('content_char_count') or len(generated),
+            "Reading Time": f"{word_count // 200} min",
+            "Content Type": st.session_state.get('content_type', 'Unknown')
+        }
+        
+        col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+        
+        with col_stat1: st.metric("📝 Words", f"{content_stats['Word Count']:,}")
+        with col_stat2: st.metric("🔤 Chars", f"{content_stats['Character Count']:,}")
+        with col_stat3: st.metric("📖 Read Time", content_stats['Reading Time'])
+        with col_stat4: st.metric("📄 Type", content_stats['Content Type'])
+        
+        st.divider()
+        
+        if 'seo_metadata' in st.session_state and st.session_state.seo_metadata:
+            st.subheader("🔍 SEO Optimization")
+            
+            seo = st.session_state.seo_metadata
+            
+            col_seo1, col_seo2 = st.columns(2)
+            
+            with col_seo1:
+                seo_title = st.text_input(
+                    "📰 SEO Title", 
+                    value=seo.get('title', ''),
+                    help="Optimized title for search engines (50-60 characters)",
+                    key="seo_title_input"
+                )
+                
+                url_slug = st.text_input(
+                    "🔗 URL Slug", 
+                    value=seo.get('slug', ''),
+                    help="URL-friendly version of your title",
+                    key="url_slug_input"
+                )
+            
+            with col_seo2:
+                meta_description = st.text_area(
+                    "📝 Meta Description", 
+                    value=seo.get('description', ''),
+                    height=100,
+                    help="Description for search results (150-160 characters)",
+                    key="meta_description_area"
+                )
+                
+                current_keywords = seo.get('keywords', [])
+                if not isinstance(current_keywords, list):
+                    current_keywords = []
+                
+                keywords = st.multiselect(
+                    "🏷️ Keywords/Tags",
+                    options=list(set(current_keywords + [k.strip() for k in st.session_state.get('content_topic', '').split(',') if k.strip()])), 
+                    default=current_keywords[:5],
+                    key="keywords_multiselect"
+                )
+            
+            if seo:
+                st.session_state.seo_metadata.update({
+                    'title': seo_title,
+                    'description': meta_description,
+                    'slug': url_slug,
+                    'keywords': keywords
+                })
+        
+        st.divider()
+        
+        st.subheader("⚡ Quick Actions & WordPress Publishing")
+        
+        col_actions, col_wp_publish = st.columns([1, 2])
+        
+        with col_actions:
+            if st.button("💾 Save Markdown", use_container_width=True, key="save_markdown_button"):
+                try:
+                    filepath = agent.save_markdown_file(
+                        st.session_state.generated_content,
+                        st.session_state.content_title,
+                        st.session_state.get('seo_metadata')
+                    )
+                    st.success(f"✅ Saved: {filepath}")
+                    # Callable payload: the file is only read when the user
+                    # actually clicks Download, not on every rerun.
+                    st.download_button(
+                        "⬇️ Download Markdown",
+                        data=lambda p=filepath: Path(p).read_bytes(),
+                        file_name=Path(filepath).name, mime='text/markdown',
+                        key="download_markdown_final"
+                    )
+                except Exception as e:
+                    st.error(f"❌ Error saving file: {str(e)}")
+            
+            if st.button("🌐 Create HTML File", use_container_width=True, key="create_html_button"):
+                try:
+                    html_path = agent.create_html_website(
+                        st.session_state.generated_content,
+                        st.session_state.content_title,
+                        st.session_state.get('seo_metadata')
+                    )
+                    st.success(f"✅ HTML file created: {html_path}")
+                    st.download_button(
+                        "⬇️ Download HTML",
+                        data=lambda p=html_path: Path(p).read_bytes(),
+                        file_name="index.html", mime='text/html',
+                        key="download_html_final"
+                    )
+                except Exception as e:
+                    st.error(f"❌ Error creating HTML: {str(e)}")
+        
+        with col_wp_publish:
+            if 'wp_configured' in st.session_state and st.session_state.wp_configured:
+                st.markdown("#### WordPress Publishing Options")
+                # The featured-image controls stay outside the form: the AI
+                # generate button needs immediate action, which forms defer.
+                st.markdown("##### Featured Image (Optional)")
+                featured_image_option = st.radio(
+                    "How to add Featured Image?",
+                    ["None", "Manual Upload", "AI Generated"],
+                    key="featured_image_option",
+                    horizontal=True
+                )
+                
+                uploaded_file = None
+                ai_image_prompt = ""
+                featured_image_data = None 
+                featured_image_filename = None
+                featured_image_mime_type = None
+
+                if featured_image_option == "Manual Upload":
+                    uploaded_file = st.file_uploader("Upload Image", type=["png", "jpg", "jpeg", "gif"], key="image_uploader")
+                    if uploaded_file is not None:
+                        # Hand the uploader's file-like straight to the
+                        # publisher, which streams it; getvalue() would pin a
+                        # second full copy of the image in session memory.
+                        featured_image_data = uploaded_file
+                        featured_image_filename = uploaded_file.name
+                        featured_image_mime_type = uploaded_file.type
+                        st.image(uploaded_file, caption='Uploaded Image', width=200)
+
+                elif featured_image_option == "AI Generated":
+                    ai_image_prompt = st.text_input("Describe Image for AI", placeholder="e.g., a futuristic city at sunset", key="ai_image_prompt")
+                    if ai_image_prompt and st.button("Generate Image with AI", key="generate_ai_image_button"):
+                        with st.spinner("Generating image... (This is a placeholder)"):
+                            generated_image_bytes = agent.generate_image_with_ai(ai_image_prompt)
+                            if generated_image_bytes:
+                                st.session_state.generated_ai_image_data = generated_image_bytes # Store data
+                                st.session_state.generated_ai_image_filename = f"ai_generated_{ai_image_prompt.replace(' ', '_')[:20]}.png"
+                                st.session_state.generated_ai_image_mime = "image/png"
+                                # Written once so later reruns display the
+                                # path instead of re-shipping the bytes. The
+                                # on-disk name goes through the slug tables:
+                                # the raw prompt may contain '/' or '..',
+                                # which must never reach a filesystem path
+                                # (the pretty name above is only ever an HTTP
+                                # upload filename).
+                                safe_name = _DASH_RUN_RE.sub('-', ai_image_prompt.translate(_SLUG_DROP_TABLE).strip()).lower()[:20] or 'image'
+                                image_path = Path(tempfile.gettempdir()) / f"ai_generated_{safe_name}.png"
+                                image_path.write_bytes(generated_image_bytes)
+                                st.session_state.generated_ai_image_path = str(image_path)
+                                st.image(str(image_path), caption='AI Generated Image', width=200)
+                            else:
+                                st.error("Failed to generate AI image.")
+                    # Display last generated image if exists and option is AI Generated
+                    if 'generated_ai_image_data' in st.session_state and featured_image_option == "AI Generated":
+                        featured_image_data = st.session_state.generated_ai_image_data
+                        featured_image_filename = st.session_state.generated_ai_image_filename
+                        featured_image_mime_type = st.session_state.generated_ai_image_mime
+                        image_path = st.session_state.get('generated_ai_image_path')
+                        if image_path and os.path.exists(image_path):
+                            st.image(image_path, caption='AI Generated Image (from session)', width=200)
+                        else:
+                            st.image(featured_image_data, caption='AI Generated Image (from session)', width=200)
+
+                # Status and term selections batch into one rerun on submit.
+                with st.form("wp_publish_form"):
+                    publish_status = st.selectbox("Post Status", ["draft", "publish"], key="wp_publish_status_select")
+                
+                    # --- Categories & Tags Multiselect based on fetched terms ---
+                    all_categories_names = st.session_state.get('wp_category_names') or [
+                        cat['name'] for cat in st.session_state.get('wp_all_categories', [])]
+                    selected_categories = st.multiselect(
+                        "Select Categories",
+                        options=all_categories_names,
+                        default=[],
+                        help="Select existing categories from your WordPress site.",
+                        key="categories_multiselect_wp"
+                    )
+
+                    all_tags_names = st.session_state.get('wp_tag_names') or [
+                        tag['name'] for tag in st.session_state.get('wp_all_tags', [])]
+                    # Suggest keywords from SEO metadata as default selection
+                    keyword_set = {k.lower() for k in st.session_state.get('seo_metadata', {}).get('keywords', [])}
+                    tags_lower = st.session_state.get('wp_tag_names_lower') or [name.lower() for name in all_tags_names]
+                    default_tags = [
+                        name for name, lowered in zip(all_tags_names, tags_lower)
+                        if lowered in keyword_set
+                    ]
+                    selected_tags = st.multiselect(
+                        "Select Tags",
+                        options=all_tags_names,
+                        default=default_tags,
+                        help="Select existing tags from your WordPress site. Keywords from SEO are pre-selected if they exist as tags.",
+                        key="tags_multiselect_wp"
+                    )
+                    # --- END Categories & Tags Multiselect ---
+                    publish_submitted = st.form_submit_button("📝 Publish Post to WordPress", type="primary", use_container_width=True)
+
+                if publish_submitted:
+                    if not st.session_state.get('wp_configured', False):
+                        st.error("❌ WordPress is not configured. Please set up your credentials in the sidebar and test the connection.")
+                        return
+                    
+                    if featured_image_option != "None" and not featured_image_data:
+                        st.warning("No image data available for featured image. Please upload/generate an image first.")
+                        # Do not return here, let the post publish without image if user chose option but no image data.
+
+                    publish_image_data = featured_image_data if featured_image_option != "None" else None
+
+                    with st.spinner("Publishing content to WordPress..."):
+                        # Image upload and post create run back-to-back over
+                        # the same keep-alive connection inside the publisher.
+                        result = agent.publisher.publish_with_featured_image(
+                            st.session_state.content_title,
+                            st.session_state.generated_content,
+                            status=publish_status,
+                            categories=selected_categories, # Pass selected names
+                            tags=selected_tags,         # Pass selected names
+                            image_data=publish_image_data,
+                            image_filename=featured_image_filename,
+                            image_mime_type=featured_image_mime_type
+                        )
+
+                        upload_result = result.get('image_upload')
+                        if upload_result is not None:
+                            if upload_result['success']:
+                                st.success(f"✅ {upload_result['message']}")
+                            else:
+                                st.error(f"❌ Failed to upload featured image: {upload_result['error']}")
+                                st.warning("Publishing will proceed without the featured image.")
+                        
+                        if result['success']:
+                            if 'publish_results' not in st.session_state:
+                                # Bounded so a long publishing session cannot
+                                # grow memory or render cost without limit.
+                                st.session_state.publish_results = deque(maxlen=50)
+                            st.session_state.publish_results.append({
+                                'platform': 'WordPress',
+                                'status': 'success',
+                                'url': result['url'],
+                                'edit_url': result['edit_url'],
+                                'timestamp': datetime.now()
+                            })
+                            
+                            # The results tab reads publish_results; rerun the
+                            # whole app so its placeholder refreshes, stashing
+                            # the outcome (and any image-upload note) first.
+                            st.session_state.publish_success_outcome = {
+                                'url': result['url'],
+                                'edit_url': result['edit_url'],
+                                'image_upload': upload_result,
+                            }
+                            st.rerun()
+                        else:
+                            st.error(f"❌ WordPress Publishing Error: {result['error']}")
+                            
+            else:
+                st.warning("WordPress is not configured. Please set up your credentials in the sidebar to enable publishing.")
+                st.button("📝 Configure WordPress", use_container_width=True, disabled=True, key="configure_wp_disabled_button_main")
+        
+        st.divider()
+        st.subheader("🎯 Advanced Publishing Options")
+        st.info("Additional publishing options (e.g., to other platforms) have been removed to focus on WordPress as per your request.")
+
+
+@st.fragment
+def _render_publish_results():
+    """Publication history list. Its own fragment inside the results tab so
+    a Copy URL click reruns just this list, not the analytics below it."""
+    if 'publish_results' in st.session_state and st.session_state.publish_results:
+        st.subheader("📈 Recent Publications")
+        
+        wordpress_results = [res for res in st.session_state.publish_results if res['platform'] == 'WordPress']
+        
+        if wordpress_results:
+            # Newest first, capped: rendering the entire history is O(N)
+            # widgets per rerun and the UI only needs recent items.
+            recent_results = wordpress_results[::-1][:20]
+            for i, result in enumerate(recent_results):
+                display_title = st.session_state.get('content_title', 'Untitled Post')
+                if len(display_title) > 70:
+                    display_title = display_title[:67] + "..."
+
+                # >>> THIS IS THE LINE TO CHANGE <<<
+                with st.expander(f"WordPress - {display_title} ({result['timestamp'].strftime('%Y-%m-%d %H:%M')})", expanded=(i==0)): # REMOVE 'key' HERE
+                    col_result1, col_result2 = st.columns([2, 1])
+                    
+                    with col_result1:
+                        st.write(f"**Platform:** {result['platform']}")
+                        st.write(f"**Status:** {'✅ Success' if result['status'] == 'success' else '❌ Failed'}")
+                        st.write(f"**Published:** {result['timestamp'].strftime('%Y-%m-%d at %H:%M:%S')}")
+                        
+                        if 'url' in result:
+                            st.markdown(f"🔗 [View Published Content]({result['url']})")
+                            if 'edit_url' in result:
+                                st.markdown(f"✏️ [Edit in WordPress Admin]({result['edit_url']})")
+
+                    with col_result2:
+                        # Streamlit has no server-side clipboard API; st.code
+                        # renders the URL with a built-in copy control.
+                        if st.button(f"📋 Copy URL", key=f"copy_url_btn_{i}"):
+                            if 'url' in result:
+                                st.code(result['url'], language=None)
+        else:
+            st.info("📝 No WordPress publications yet. Publish some content to see results here!")
+    else:
+        st.info("📝 No publications yet. Publish some content to see results here!")
+
+
+@st.fragment
+def _render_results_tab():
+    """Tab 3 results and analytics, fragment-isolated like tabs 1-2."""
+    st.header("📊 Publishing Results & Analytics")
+
+    _render_publish_results()
+
+    if 'generated_content' in st.session_state or 'generated_project' in st.session_state:
+        st.divider()
+        st.subheader("📊 Content Analytics")
+        
+        if 'generated_content' in st.session_state:
+            content = st.session_state.generated_content
+            
+            col_analytics1, col_analytics2, col_analytics3, col_analytics4 = st.columns(4)
+            
+            analytics = _content_analytics(content)
+            with col_analytics1: st.metric("📝 Total Words", f"{analytics['words']:,}")
+            with col_analytics2: st.metric("📄 Paragraphs", analytics['paragraphs'])
+            with col_analytics3: st.metric("💻 Code Blocks", analytics['code_blocks'])
+            with col_analytics4: st.metric("📑 Headings", analytics['headings'])
+        
+        elif 'generated_project' in st.session_state:
+            project_files = st.session_state.generated_project
+            
+            col_analytics1, col_analytics2, col_analytics3, col_analytics4 = st.columns(4)
+            
+            file_count, calculated_total_lines = _project_stats(tuple(project_files.items()))
+            with col_analytics1: st.metric("📁 Total Files", file_count)
+            with col_analytics2: st.metric("📝 Total Lines", f"{calculated_total_lines:,}")
+            with col_analytics3: st.metric("🐍 Python Files", len([f for f in project_files.keys() if f.endswith('.py')]))
+            with col_analytics4: st.metric("⚙️ Config Files", len([f for f in project_files.keys() if f in ['requirements.txt', 'README.md', '.gitignore', 'config.py', 'LICENSE']])) # Added LICENSE
+        
+        if 'seo_metadata' in st.session_state and st.session_state.seo_metadata:
+            st.divider()
+            st.subheader("🔍 SEO Analysis")
+            
+            seo = st.session_state.seo_metadata
+            
+            col_seo_analysis1, col_seo_analysis2 = st.columns(2)
+            
+            with col_seo_analysis1:
+                title_length = len(seo.get('title', ''))
+                st.metric("📰 Title Length", f"{title_length} chars",
+                          delta=_seo_length_status('title', title_length))
+                
+                st.metric("🏷️ Keywords", len(seo.get('keywords', [])))
+            
+            with col_seo_analysis2:
+                desc_length = len(seo.get('description', ''))
+                st.metric("📝 Description Length", f"{desc_length} chars",
+                          delta=_seo_length_status('description', desc_length))
+                
+                st.metric("🔗 URL Slug Length", f"{len(seo.get('slug', ''))} chars")
+
+
+# Session keys the app owns (widget-backed keys are left to Streamlit);
+# "Clear All Session Data" removes exactly these.
+_APP_STATE_KEYS = (
+    'agent', 'generated_content', 'content_title', 'content_topic', 'content_type',
+    'content_word_count', 'content_char_count', 'seo_metadata', 'generation_time',
+    'is_project', 'generated_project', 'project_name', 'project_type',
+    'project_description', 'publish_results', 'show_individual_files',
+    'default_content_prefs', 'default_project_prefs',
+    'wp_configured', 'wp_site_type', 'wp_all_categories', 'wp_all_tags',
+    'wp_category_names', 'wp_tag_names', 'wp_tag_names_lower',
+    'gemini_configured', 'gemini_configured_key',
+    'generation_success_message', 'publish_success_outcome',
+    'generated_ai_image_data', 'generated_ai_image_filename', 'generated_ai_image_mime',
+    'generated_ai_image_path',
+)
+
+
+@st.cache_data(show_spinner=False)
+def _build_config_bytes(site_url: str, username: str, is_wpcom: bool) -> bytes:
+    """Serializes the exportable preferences template once per distinct
+    WordPress identity; everything else in it is static."""
+    config_template = {
+        "content_preferences": {
+            "default_writing_style": "Professional",
+            "default_target_audience": "Intermediate",
+            "default_word_count": "1200-2000",
+            "include_seo": True,
+            "include_toc": False,
+            "include_examples": True,
+            "include_conclusion": True
+        },
+        "project_preferences": {
+            "default_project_type": "Python Project",
+            "project_complexity": "Intermediate",
+            "include_tests": False,
+            "include_docker": False,
+            "include_ci_cd": False,
+            "include_documentation": True,
+            "create_examples": True
+        },
+        "publishing_platforms": {
+            "wordpress": {
+                "site_url": site_url,
+                "username": username,
+                "is_wpcom": is_wpcom,
+                "default_status": "draft"
+            }
+        },
+        "gemini_api_key_placeholder": "YOUR_GEMINI_API_KEY_HERE"
+    }
+    return json.dumps(config_template, indent=2).encode('utf-8')
+
+
+@st.fragment
+def _render_settings_tab(agent):
+    """Tab 4 settings, fragment-isolated like tabs 1-2."""
+    st.header("⚙️ Settings & Configuration")
+    
+    st.subheader("🔧 API Configuration")
+    with st.expander("📋 API Information & Setup", expanded=True):
+        st.markdown("""
+        **Required API for Full Functionality:**
+        
+        1. **🤖 Google Gemini AI** (Required)
+           - Get API key: [Google AI Studio](https://aistudio.google.com/)
+           - Used for: Content generation and project creation
+           - Cost: Free tier available
+        
+        2. **🏢 WordPress REST API** (Optional)
+           - Setup: Ensure REST API is enabled in WordPress (default for modern versions).
+           - **Self-hosted**: Create an **Application Password** in your WordPress admin via Users → Profile → Application Passwords. Use this password, not your regular login password.
+           - **WordPress.com**: You'll need a **Business plan** or higher for full REST API access. Use an **Access Token** (from WordPress.com → My Sites → Manage → Marketing → Connections) instead of a password.
+           - Used for: Direct WordPress publishing of generated content.
+        """)
+    
+    st.divider()
+    st.subheader("💾 Configuration Management")
+    
+    col_config1, col_config2 = st.columns(2)
+    
+    with col_config1:
+        st.markdown("**📤 Export Current Preferences**")
+        if st.button("📋 Generate Config File", key="generate_config_file_button"):
+            wp_cfg = agent.publisher.wordpress_config
+            config_bytes = _build_config_bytes(
+                wp_cfg.get('site_url', 'https://your-site.com'),
+                wp_cfg.get('username', 'your-username'),
+                wp_cfg.get('is_wpcom', False),
+            )
+
+            st.download_button(
+                "⬇️ Download Config JSON",
+                config_bytes,
+                file_name="ai_agent_config.json",
+                mime="application/json",
+                key="download_config_json_button"
+            )
+    
+    with col_config2:
+        st.markdown("**📥 Import Settings**")
+        uploaded_config = st.file_uploader(
+            "Upload Configuration File (.json)",
+            type=['json'],
+            help="Upload a configuration JSON file to load preferences.",
+            key="upload_config_file_uploader"
+        )
+        
+        if uploaded_config:
+            try:
+                config_data = json.load(uploaded_config)
+                
+                if 'content_preferences' in config_data:
+                    st.session_state.default_content_prefs = config_data['content_preferences']
+                if 'project_preferences' in config_data:
+                    st.session_state.default_project_prefs = config_data['project_preferences']
+                if 'publishing_platforms' in config_data and 'wordpress' in config_data['publishing_platforms']:
+                    wp_cfg = config_data['publishing_platforms']['wordpress']
+                    if 'site_url' in wp_cfg and 'username' in wp_cfg:
+                        agent.publisher.setup_wordpress(wp_cfg['site_url'], wp_cfg['username'], "placeholder_password") 
+                        st.session_state.wp_configured = True 
+                        st.success("✅ WordPress configuration partially loaded (password/token needs re-entry).")
+                
+                st.success("✅ Configuration preferences loaded successfully!")
+                st.json(config_data)
+            except Exception as e:
+                st.error(f"❌ Error loading configuration: {str(e)}")
+    
+    st.divider()
+    st.subheader("ℹ️ Application Information")
+    
+    col_info1, col_info2 = st.columns(2)
+    
+    with col_info1:
+        st.markdown("""
+        **🚀 AI Content Agent Pro**
+        
+        - **Version:** 2.1.0 (WordPress Focused)
+        - **Framework:** Streamlit
+        - **AI Model:** Google Gemini 2.0 Flash
+        - **Language:** Python 3.8+
+        - **Key Features:** Content & Project Generation, WordPress Publishing
+        """)
+    
+    with col_info2:
+        wordpress_pub_count = len([r for r in st.session_state.get('publish_results', []) if r['platform'] == 'WordPress'])
+        st.markdown(f"""
+        **📊 Session Statistics**
+        
+        - **Content Generated:** {1 if 'generated_content' in st.session_state else 0}
+        - **Projects Generated:** {1 if 'generated_project' in st.session_state else 0}
+        - **WordPress Connected:** {'Yes' if st.session_state.get('wp_configured', False) else 'No'}
+        - **Successful WP Publications:** {wordpress_pub_count}
+        """)
+    
+    st.divider()
+    st.subheader("🧹 Session Management")
+    
+    if st.button("🗑️ Clear All Session Data", key="clear_session_data_button", type="secondary"):
+        for key in _APP_STATE_KEYS:
+            st.session_state.pop(key, None)
+        # SEO results are keyed dynamically by content hash; their dedicated
+        # prefix keeps widget keys like seo_title_input out of the sweep.
+        for key in [k for k in st.session_state.keys() if k.startswith('seo_cache_')]:
+            del st.session_state[key]
+        st.success("✅ All session data cleared!")
+        st.rerun()
+
+    st.divider()
+    st.subheader("📚 Quick Help")
+    
+    with st.expander("🆘 Common Issues & Solutions", expanded=True):
+        st.markdown("""
+        **Common Problems & Solutions:**
+        
+        1.  **Gemini AI API Connection Failed:**
+            * Double-check your API key for typos.
+            * Ensure your internet connection is stable.
+            * Verify your API key is active and has the necessary permissions in [Google AI Studio](https://aistudio.google.com/).
+            
+        2.  **WordPress Connection Failed:**
+            * **Self-hosted:** Ensure you are using an **Application Password** (created in WordPress admin → Users → Profile) and **NOT** your regular login password.
+            * **WordPress.com:** Confirm your site is **Public** (not "Coming Soon") and you have a **Business plan** or higher for REST API access. Use an **Access Token** (from WordPress.com → My Sites → Manage → Marketing → Connections).
+            * Verify your WordPress site URL is correct and accessible from where this app is running.
+            * Check if WordPress REST API is enabled (usually default for WP 4.7+).
+            
+        3.  **WordPress Publishing Failed (e.g., "Invalid parameter(s): tags" or categories not recognized):**
+            * For **self-hosted WordPress**, tags and categories **must exist** on your WordPress site *before* you publish. The app tries to convert names to IDs by fetching available terms. If a name doesn't exist or doesn't exactly match (case-insensitive), it won't be applied. Create them manually in WordPress first.
+            * For WordPress.com, tags are sent as names. Categories are often harder to set via API directly without specific IDs or plugins.
+            
+        4.  **Featured Image Upload Failed:**
+            * Ensure your WordPress user (associated with the Application Password/Access Token) has permissions to upload media.
+            * Check for file size limits on your WordPress server (PHP `upload_max_filesize`, `post_max_size`).
+            * Verify the image file type is supported by WordPress.
+            * **For AI-generated images:** This feature uses a placeholder. Actual AI image generation requires integration with a dedicated image generation API (e.g., DALL-E, Stable Diffusion) and their respective API keys.
+            
+        5.  **Generated Content/Project is too short or irrelevant:**
+            * Provide a **more detailed and specific "Description"** and "Additional Requirements" in the "Content & Project Creation" tab.
+            * Experiment with different "Writing Styles" or "Target Audiences."
+            * Increase the "Word Count" target.
+        """)
+
+
+def main():
+    """Main Streamlit application."""
+    
+    st.set_page_config(
+        page_title="AI Content Agent Pro (WordPress Focused)",
+        page_icon="🚀",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # Custom CSS
+    st.markdown("""
+    <style>
+        .main-header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 2rem;
+            border-radius: 15px;
+            color: white;
+            text-align: center;
+            margin-bottom: 2rem;
+            box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+        }
+        
+        .main-header h1 {
+            margin: 0;
+            font-size: 3rem;
+            font-weight: bold;
+        }
+        
+        .main-header p {
+            margin: 0.5rem 0 0 0;
+            font-size: 1.2rem;
+            opacity: 0.9;
+        }
+        
+        .feature-box {
+            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+            padding: 1.5rem;
+            border-radius: 12px;
+            border-left: 6px solid #667eea;
+            margin: 1rem 0;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.05);
+        }
+        
+        .success-box {
+            background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
+            padding: 1.5rem;
+            border-radius: 12px;
+            border-left: 6px solid #28a745;
+            margin: 1rem 0;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.05);
+        }
+        
+        .metric-card {
+            background: white;
+            padding: 1.5rem;
+            border-radius: 12px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            text-align: center;
+            border: 1px solid #e9ecef;
+        }
+        
+        .status-connected {
+            color: #28a745;
+            font-weight: bold;
+        }
+        
+        .status-disconnected {
+            color: #dc3545;
+            font-weight: bold;
+        }
+        
+        .platform-card {
+            background: white;
+            padding: 1rem;
+            border-radius: 8px;
+            border: 1px solid #e9ecef;
+            margin: 0.5rem 0;
+        }
+        
+        div.stButton > button {
+            width: 100%;
+            border-radius: 8px;
+            border: none;
+            padding: 0.5rem 1rem;
+            font-weight: 500;
+            transition: all 0.3s ease;
+        }
+        
+        div.stButton > button:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+        }
+        
+        .sidebar .sidebar-content {
+            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Header
+    st.markdown("""
+    <div class="main-header">
+        <h1>🚀 AI Content Agent Pro</h1>
+        <p>WordPress-Focused Content Creation & Publishing with Gemini AI</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if 'agent' not in st.session_state:
+        st.session_state.agent = CompleteAIContentAgent()
+    
+    agent = st.session_state.agent
+    
+    # Sidebar Configuration
+    with st.sidebar:
+        # One local handle instead of repeated st.session_state attribute
+        # lookups throughout the sidebar body.
+        state = st.session_state
+
+        st.header("🔧 Configuration")
+        
+        env_gemini_key = _ENV_GEMINI_KEY
+        env_wp_site_url = _ENV_WP_SITE_URL
+        env_wp_username = _ENV_WP_USERNAME
+        env_wp_app_password = _ENV_WP_APP_PASSWORD
+        
+        api_key = st.text_input(
+            "🤖 Gemini AI API Key", # Changed label for clarity
+            value=env_gemini_key,
+            type="password", 
+            help="Get your API key from https://aistudio.google.com/",
+            placeholder="Enter your Gemini AI API key" if not env_gemini_key else "Loaded from .env file",
+            key="gemini_api_key_input"
+        )
+        
+        if api_key:
+            if not state.get('gemini_configured') or state.gemini_configured_key != api_key: # Added check for key change
+                if agent.setup_gemini(api_key):
+                    state.gemini_configured = True
+                    state.gemini_configured_key = api_key # Store the key that successfully configured
+                    st.success("✅ Gemini AI Connected")
+                else:
+                    st.error("❌ Failed to connect to Gemini AI")
+            else:
+                st.success("✅ Gemini AI Connected")
+        else:
+            state.gemini_configured = False # Set to false if key is empty
+            state.gemini_configured_key = None
+            st.info("👆 Enter your Gemini AI API key to get started")
+        
+        if env_gemini_key:
+            st.caption("🔄 API key loaded from .env file")
+        
+        st.divider()
+        
+        st.subheader("📡 Publishing Platforms")
+        
+        # WordPress Configuration
+        with st.expander("🏢 WordPress", expanded=True): # Expanded by default
+            st.markdown("**Choose your WordPress type:**")
+            wp_type = st.radio(
+                "WordPress Type",
+                ["Self-hosted WordPress", "WordPress.com"],
+                help="Select whether you're using a self-hosted WordPress site or WordPress.com",
+                key="wp_type_radio"
+            )
+            
+            if wp_type == "WordPress.com":
+                st.info("⚠️ **WordPress.com Requirements:**\n- Your site must be **public** (not in Coming Soon mode)\n- You need a **Business plan** or higher for REST API access\n- Use an **access token** instead of password")
+                
+                wp_site = st.text_input(
+                    "WordPress.com Site URL", 
+                    placeholder="https://yoursite.com",
+                    help="Your full WordPress.com site URL",
+                    value=env_wp_site_url,
+                    key="wpcom_site_url_input"
+                )
+                wp_user = st.text_input(
+                    "Username",
+                    placeholder="your-username",
+                    key="wpcom_username_input"
+                )
+                wp_pass = st.text_input(
+                    "Access Token", 
+                    type="password",
+                    help="Get access token from WordPress.com → My Sites → Manage → Marketing → Connections",
+                    key="wpcom_pass_input"
+                )
+
+                if env_wp_site_url or env_wp_username or env_wp_app_password:
+                    st.caption("🔄 WordPress credentials loaded from .env file (if set)")
+                if wp_site and 'wordpress.com' not in wp_site.lower() and wp_site.strip():
+                    st.warning("⚠️ This doesn't look like a WordPress.com URL")
+            else:
+                st.info("ℹ️ **Self-hosted WordPress Requirements:**\n- WordPress 4.7+ with REST API enabled\n- Use **Application Password** (not login password)\n- **Auto-detects permalink format** (works with/without pretty permalinks)")
+                
+                wp_site = st.text_input(
+                    "Site URL", 
+                    placeholder="https://yoursite.com",
+                    help="Your self-hosted WordPress site URL",
+                    value=env_wp_site_url, # Pre-filled for your site
+                    key="self_hosted_site_url_input"
+                )
+                wp_user = st.text_input(
+                    "Username",
+                    placeholder="your-username",
+                    value=env_wp_username,
+                    key="self_hosted_username_input"
+                )
+                wp_pass = st.text_input(
+                    "App Password", 
+                    type="password",
+                    help="Create Application Password in WordPress admin → Users → Profile → Application Passwords",
+                    value=env_wp_app_password,
+                    key="self_hosted_pass_input"
+                )
+            
+            # Button for explicit connection test
+            if st.button("🔗 Test WordPress Connection", key="test_wp_connection_button"):
+                with st.spinner("Testing connection..."):
+                    agent.publisher.setup_wordpress(wp_site, wp_user, wp_pass)
+                    result = agent.publisher.test_wordpress_connection()
+                    
+                    if result['success']:
+                        state.wp_configured = True
+                        state.wp_site_type = wp_type 
+                        st.success(f"✅ {result['message']}")
+                        
+                        # Store detected permalink type if self-hosted
+                        wp_cfg = agent.publisher.wordpress_config
+                        if not wp_cfg.get('is_wpcom'):
+                            if wp_cfg.get('use_query_params'):
+                                st.info("🔧 **Detected**: Your site uses query parameter format for REST API")
+                            else:
+                                st.info("🔧 **Detected**: Your site uses pretty permalinks for REST API")
+                            
+                            # --- Fetch categories and tags on successful self-hosted connection ---
+                            with st.spinner("Fetching categories and tags..."):
+                                state.wp_all_categories, state.wp_all_tags = asyncio.run(
+                                    agent.publisher.fetch_terms_async()
+                                )
+                                # Display lists are derived once here; the
+                                # publishing tab reads them instead of
+                                # re-traversing the dicts every rerun.
+                                state.wp_category_names = [cat['name'] for cat in state.wp_all_categories]
+                                state.wp_tag_names = [tag['name'] for tag in state.wp_all_tags]
+                                state.wp_tag_names_lower = [name.lower() for name in state.wp_tag_names]
+                                # Pre-warm the publisher's name->id indexes so
+                                # even the first publish maps terms with plain
+                                # dict lookups.
+                                agent.publisher._term_name_index('categories', state.wp_all_categories)
+                                agent.publisher._term_name_index('tags', state.wp_all_tags)
+                                if state.wp_all_categories:
+                                    st.success(f"Fetched {len(state.wp_all_categories)} categories.")
+                                else:
+                                    st.warning("Could not fetch any categories. Ensure categories exist and API permissions are correct.")
+                                if state.wp_all_tags:
+                                    st.success(f"Fetched {len(state.wp_all_tags)} tags.")
+                                else:
+                                    st.warning("Could not fetch any tags. Ensure tags exist and API permissions are correct.")
+
+                        else: # WP.com
+                            st.warning("Category and Tag fetching is not directly supported for WordPress.com via this application's API configuration yet.")
+                    else:
+                        state.wp_configured = False 
+                        st.error(f"❌ {result['error']}")
+                        
+                        if 'Coming Soon' in result['error']:
+                            st.markdown("Follow the instructions above to make your WordPress.com site public.")
+                        elif '401' in result['error'] or 'Authentication failed' in result['error']:
+                            st.markdown("Check your username and application password/access token.")
+                        elif '404' in result['error']:
+                            st.markdown("Ensure REST API is enabled and URL is correct. For self-hosted, also check permalink settings.")
+                        st.warning("Click '🔗 Test WordPress Connection' manually if you change credentials.")
+            
+            # Display current status
+            if state.get('wp_configured'):
+                st.markdown('<p class="status-connected">🟢 WordPress Connected</p>', unsafe_allow_html=True)
+            else:
+                st.markdown('<p class="status-disconnected">🔴 WordPress Not Configured</p>', unsafe_allow_html=True)
+        
+        st.divider()
+        st.subheader("📊 Platform Status")
+        
+        platforms_status = [
+            ("Gemini AI", "gemini_configured"),
+            ("WordPress", "wp_configured")
+        ]
+        
+        for platform, key in platforms_status:
+            status = "🟢 Connected" if state.get(key) else "🔴 Not Connected"
+            st.markdown(f"**{platform}**: {status}")
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📝 Content & Project Creation", "🚀 Publishing", "📊 Results", "⚙️ Settings"])
+    
+    with tab1:
+        _render_creation_tab(agent)
+
+    with tab2:
+        _render_publishing_tab(agent)
+
+    with tab3:
+        _render_results_tab()
+
+    with tab4:
+        _render_settings_tab(agent)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file